@@ -119,6 +119,13 @@ class CycleCloser(Component):
                 'num_eq': 1}
         }
 
+    def get_variable_aliases(self):
+        i, o = self.inl[0], self.outl[0]
+        return {
+            'pressure_equality_constraints': [('p', i, o)],
+            'enthalpy_equality_constraints': [('h', i, o)]
+        }
+
     @staticmethod
     def inlets():
         return ['in1']
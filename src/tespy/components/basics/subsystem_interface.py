@@ -144,6 +144,13 @@ class SubsystemInterface(Component):
                 'num_eq': self.num_i}
         }
 
+    def get_variable_aliases(self):
+        pairs = list(zip(self.inl, self.outl))
+        return {
+            'pressure_equality_constraints': [('p', i, o) for i, o in pairs],
+            'enthalpy_equality_constraints': [('h', i, o) for i, o in pairs]
+        }
+
     @staticmethod
     def get_parameters():
         return {'num_inter': dc_simple()}
@@ -10,7 +10,6 @@ tespy/components/combustion/base.py
 
 SPDX-License-Identifier: MIT
 """
-import itertools
 
 import CoolProp.CoolProp as CP
 import numpy as np
@@ -28,6 +27,107 @@ from tespy.tools.helpers import TESPyComponentError
 from tespy.tools.helpers import fluidalias_in_list
 
 
+def get_fuel_data(fuel, molar_mass):
+    r"""
+    Get the number of atoms and the lower heating value of a fuel.
+
+    The data are calculated once per process for every fuel and molar mass.
+
+    - Source for fluids O2, H2O and CO2: :cite:`CODATA1989`
+    - Source for all other fluids: :cite:`CRCHandbook2021`
+
+    Parameters
+    ----------
+    fuel : str
+        Alias of the fuel.
+
+    molar_mass : float
+        Molar mass of the fuel in kg/mol.
+
+    Returns
+    -------
+    data : dict
+        Number of carbon, hydrogen and oxygen atoms (:code:`C`, :code:`H`,
+        :code:`O`) and lower heating value (:code:`LHV`) in J/kg.
+
+    Example
+    -------
+    >>> from tespy.components.combustion.base import get_fuel_data
+    >>> data = get_fuel_data('CH4', 0.016043)
+    >>> data['C'], data['H'], data['O']
+    (1, 4, 0)
+    >>> round(data['LHV'] / 1e6, 2)
+    50.03
+    """
+    key = (fuel, molar_mass)
+    if key not in get_fuel_data.cache:
+        structure = fluid_structure(fuel)
+        data = {el: structure.get(el, 0) for el in ['C', 'H', 'O']}
+
+        # molar formation enthalpies in kJ/mol, water is gaseous
+        hf = {
+            'hydrogen': 0, 'methane': -74.6, 'ethane': -84.0,
+            'propane': -103.8, 'butane': -125.7, 'nDodecane': -289.4,
+            'O2': 0, 'CO2': -393.51, 'H2O': -241.826
+        }
+        alias = set(hf).intersection(
+            a.replace(' ', '') for a in CP.get_aliases(fuel)
+        )
+        data['LHV'] = (
+            -(
+                data['H'] / 2 * hf['H2O'] + data['C'] * hf['CO2']
+                - (
+                    (data['C'] + data['H'] / 4) * hf['O2']
+                    + hf[list(alias)[0]]
+                )
+            ) / molar_mass * 1000
+        )
+        get_fuel_data.cache[key] = data
+
+    return get_fuel_data.cache[key].copy()
+
+
+get_fuel_data.cache = {}
+
+
+def reference_enthalpy(fluid_data):
+    r"""
+    Get the enthalpy of a gas mixture at the reference state.
+
+    The reference state is at 298.15 K and 1 bar, the water in the mixture is
+    forced to be gaseous. The value only depends on the composition of the
+    mixture, therefore it is cached per process for the last compositions.
+
+    Parameters
+    ----------
+    fluid_data : dict
+        Fluid data of a connection.
+
+    Returns
+    -------
+    h_ref : float
+        Enthalpy of the mixture at the reference state.
+    """
+    key = tuple(
+        (fluid, data["wrapper"].__class__, data["wrapper"].back_end,
+         data["mass_fraction"])
+        for fluid, data in fluid_data.items()
+    )
+    cache = reference_enthalpy.cache
+    if key not in cache:
+        if len(cache) >= reference_enthalpy.maxsize:
+            del cache[next(iter(cache))]
+        cache[key] = h_mix_pT(
+            1e5, 298.15, fluid_data, mixing_rule="forced-gas"
+        )
+
+    return cache[key]
+
+
+reference_enthalpy.cache = {}
+reference_enthalpy.maxsize = 10000
+
+
 @component_registry
 class CombustionChamber(Component):
     r"""
@@ -289,16 +389,12 @@ class CombustionChamber(Component):
             else:
                 setattr(self, fluid.lower(), fluid)
 
+        inl, _ = self._get_combustion_connections()
         self.fuels = {}
         for f in self.fuel_list:
-            self.fuels[f] = {}
-            structure = fluid_structure(f)
-            for el in ['C', 'H', 'O']:
-                if el in structure:
-                    self.fuels[f][el] = structure[el]
-                else:
-                    self.fuels[f][el] = 0
-            self.fuels[f]['LHV'] = self.calc_lhv(f)
+            self.fuels[f] = get_fuel_data(
+                f, inl[0].fluid.wrapper[f]._molar_mass
+            )
 
     def calc_lhv(self, f):
         r"""
@@ -327,34 +423,7 @@ class CombustionChamber(Component):
                 \Delta H_f^0: \text{molar formation enthalpy}
         """
         inl, _ = self._get_combustion_connections()
-        hf = {}
-        hf['hydrogen'] = 0
-        hf['methane'] = -74.6
-        hf['ethane'] = -84.0
-        hf['propane'] = -103.8
-        hf['butane'] = -125.7
-        hf['nDodecane'] = -289.4
-        hf[self.o2] = 0
-        hf[self.co2] = -393.51
-        # water (gaseous)
-        hf[self.h2o] = -241.826
-
-        key = set(list(hf.keys())).intersection(
-                set([a.replace(' ', '')
-                     for a in CP.get_aliases(f)]))
-
-        val = (
-            -(
-                self.fuels[f]['H'] / 2 * hf[self.h2o]
-                + self.fuels[f]['C'] * hf[self.co2]
-                - (
-                    (self.fuels[f]['C'] + self.fuels[f]['H'] / 4) * hf[self.o2]
-                    + hf[list(key)[0]]
-                )
-            ) / inl[0].fluid.wrapper[f]._molar_mass * 1000
-        )
-
-        return val
+        return get_fuel_data(f, inl[0].fluid.wrapper[f]._molar_mass)['LHV']
 
     def mass_flow_func(self):
         r"""
@@ -486,14 +555,67 @@ class CombustionChamber(Component):
         residual : list
             Vector with residual values of equations.
         """
-        # calculate equations
+        # the molar flows are identical for all fluid equations
+        reaction = self.calc_reaction_state()
         residual = []
         for fluid in self.fluid_eqs_list:
-            residual += [self.stoichiometry(fluid)]
+            residual += [self.stoichiometry(fluid, reaction)]
 
         return residual
 
-    def stoichiometry(self, fluid):
+    def calc_reaction_state(self):
+        r"""
+        Calculate the molar flows of the reaction.
+
+        Returns
+        -------
+        reaction : dict
+            Inlet mass flows of fuels and oxygen (:code:`q`), molar fuel flows
+            (:code:`n_fuel`), molar oxygen flow (:code:`n_oxygen`), molar
+            hydrogen and carbon flows (:code:`n_h`, :code:`n_c`), the
+            stoichiometric oxygen flow (:code:`n_oxygen_stoich`) and the air
+            ratio (:code:`lamb`).
+        """
+        # required to work with combustion chamber and engine
+        inl, _ = self._get_combustion_connections()
+        molar_mass = self.reaction_molar_mass
+
+        q = {}
+        for f in list(self.fuel_list) + [self.o2]:
+            q[f] = 0
+            for i in inl:
+                q[f] += i.m.val_SI * i.fluid.val[f]
+
+        n_fuel = {f: q[f] / molar_mass[f] for f in self.fuel_list}
+        n_h = sum(n * self.fuels[f]['H'] for f, n in n_fuel.items())
+        n_c = sum(n * self.fuels[f]['C'] for f, n in n_fuel.items())
+        n_oxygen = q[self.o2] / molar_mass[self.o2]
+
+        ###################################################################
+        # calculate stoichiometric oxygen
+        n_oxygen_stoich = n_h / 4 + n_c
+
+        ###################################################################
+        # calculate lambda if not set
+        if not self.lamb.is_set:
+            self.lamb.val = n_oxygen / n_oxygen_stoich
+
+        return {
+            "q": q, "n_fuel": n_fuel, "n_oxygen": n_oxygen, "n_h": n_h,
+            "n_c": n_c, "n_oxygen_stoich": n_oxygen_stoich,
+            "lamb": self.lamb.val
+        }
+
+    @property
+    def reaction_molar_mass(self):
+        """Molar masses of the fuels and the reaction products."""
+        inl, _ = self._get_combustion_connections()
+        return {
+            f: inl[0].fluid.wrapper[f]._molar_mass
+            for f in list(self.fuel_list) + [self.o2, self.co2, self.h2o]
+        }
+
+    def stoichiometry(self, fluid, reaction=None):
         r"""
         Calculate the reaction balance for one fluid.
 
@@ -587,6 +709,11 @@ class CombustionChamber(Component):
         fluid : str
             Fluid to calculate residual value for.
 
+        reaction : dict
+            Molar flows of the reaction, see
+            :py:meth:`tespy.components.combustion.base.CombustionChamber.calc_reaction_state`,
+            calculated if not provided.
+
         Returns
         -------
         residual : float
@@ -594,40 +721,15 @@ class CombustionChamber(Component):
         """
         # required to work with combustion chamber and engine
         inl, outl = self._get_combustion_connections()
+        if reaction is None:
+            reaction = self.calc_reaction_state()
 
-        ###################################################################
-        # molar mass flow for fuel and oxygen
-        n_fuel = {}
-        n_oxy_stoich = {}
-        n_h = 0
-        n_c = 0
-        for f in self.fuel_list:
-            n_fuel[f] = 0
-            for i in inl:
-                n = i.m.val_SI * i.fluid.val[f] / inl[0].fluid.wrapper[f]._molar_mass
-                n_fuel[f] += n
-                n_h += n * self.fuels[f]['H']
-                n_c += n * self.fuels[f]['C']
-
-            # stoichiometric oxygen requirement for each fuel
-            n_oxy_stoich[f] = n_fuel[f] * (
-                self.fuels[f]['H'] / 4 + self.fuels[f]['C']
-            )
-
-        n_oxygen = 0
-        for i in inl:
-            n_oxygen += (
-                i.m.val_SI * i.fluid.val[self.o2] / inl[0].fluid.wrapper[self.o2]._molar_mass
-            )
-
-        ###################################################################
-        # calculate stoichiometric oxygen
-        n_oxygen_stoich = n_h / 4 + n_c
-
-        ###################################################################
-        # calculate lambda if not set
-        if not self.lamb.is_set:
-            self.lamb.val = n_oxygen / n_oxygen_stoich
+        molar_mass = self.reaction_molar_mass
+        n_fuel = reaction["n_fuel"]
+        n_oxygen = reaction["n_oxygen"]
+        n_h = reaction["n_h"]
+        n_c = reaction["n_c"]
+        n_oxygen_stoich = reaction["n_oxygen_stoich"]
 
         ###################################################################
         # calculate excess fuel if lambda is lower than 1
@@ -641,32 +743,29 @@ class CombustionChamber(Component):
         ###################################################################
         # equation for carbondioxide
         if fluid == self.co2:
-            dm = (n_c - n_c_exc) * inl[0].fluid.wrapper[self.co2]._molar_mass
+            dm = (n_c - n_c_exc) * molar_mass[self.co2]
 
         ###################################################################
         # equation for water
         elif fluid == self.h2o:
-            dm = (n_h - n_h_exc) / 2 * inl[0].fluid.wrapper[self.h2o]._molar_mass
+            dm = (n_h - n_h_exc) / 2 * molar_mass[self.h2o]
 
         ###################################################################
         # equation for oxygen
         elif fluid == self.o2:
             if self.lamb.val < 1:
-                dm = -n_oxygen * inl[0].fluid.wrapper[self.o2]._molar_mass
+                dm = -n_oxygen * molar_mass[self.o2]
             else:
-                dm = -n_oxygen / self.lamb.val * inl[0].fluid.wrapper[self.o2]._molar_mass
+                dm = -n_oxygen / self.lamb.val * molar_mass[self.o2]
 
         ###################################################################
         # equation for fuel
         elif fluid in self.fuel_list:
             if self.lamb.val < 1:
-                n_fuel_exc = (
-                    -(n_oxygen / n_oxygen_stoich - 1) * n_oxy_stoich[fluid]
-                    / (self.fuels[fluid]['H'] / 4 + self.fuels[fluid]['C'])
-                )
+                n_fuel_exc = -(n_oxygen / n_oxygen_stoich - 1) * n_fuel[fluid]
             else:
                 n_fuel_exc = 0
-            dm = -(n_fuel[fluid] - n_fuel_exc) * inl[0].fluid.wrapper[fluid]._molar_mass
+            dm = -(n_fuel[fluid] - n_fuel_exc) * molar_mass[fluid]
 
         ###################################################################
         # equation for other fluids
@@ -790,19 +889,106 @@ class CombustionChamber(Component):
         """
         # required to work with combustion chamber and engine
         inl, outl = self._get_combustion_connections()
-        f = self.stoichiometry
-        conns = inl + outl
-        for fluid, conn in itertools.product(self.fluid_eqs_list, conns):
-            eq_num = self.fluid_eqs_list.index(fluid)
-            if self.is_variable(conn.m, increment_filter):
-                self.jacobian[k + eq_num, conn.m.J_col] = self.numeric_deriv(
-                    f, 'm', conn, fluid=fluid
-                )
-            for fluid_name in conn.fluid.is_var:
-                self.jacobian[k + eq_num, conn.fluid.J_col[fluid_name]] = self.numeric_deriv(
-                    f, fluid_name, conn, fluid=fluid
+        reaction = self.calc_reaction_state()
+        o = outl[0]
+        for eq_num, fluid in enumerate(self.fluid_eqs_list):
+            row = k + eq_num
+            dm_dq = self.stoichiometry_gradient(fluid, reaction)
+            for i in inl:
+                if self.is_variable(i.m, increment_filter):
+                    self.jacobian[row, i.m.J_col] = i.fluid.val[fluid] + sum(
+                        d * i.fluid.val[f] for f, d in dm_dq.items()
+                    )
+                for fluid_name in i.fluid.is_var:
+                    d = dm_dq.get(fluid_name, 0) + (fluid_name == fluid)
+                    self.jacobian[row, i.fluid.J_col[fluid_name]] = (
+                        d * i.m.val_SI
+                    )
+
+            if self.is_variable(o.m, increment_filter):
+                self.jacobian[row, o.m.J_col] = -o.fluid.val[fluid]
+            for fluid_name in o.fluid.is_var:
+                self.jacobian[row, o.fluid.J_col[fluid_name]] = (
+                    -o.m.val_SI * (fluid_name == fluid)
                 )
 
+    def stoichiometry_gradient(self, fluid, reaction):
+        r"""
+        Calculate the partial derivatives of the converted mass flow.
+
+        The converted mass flow of a fluid :math:`\Delta \dot{m}_{fl}` only
+        depends on the inlet mass flows of the fuels and oxygen
+        :math:`\dot{q}_{j} = \sum_i \dot{m}_{in,i} \cdot x_{j,in,i}`.
+
+        Parameters
+        ----------
+        fluid : str
+            Fluid to calculate the partial derivatives for.
+
+        reaction : dict
+            Molar flows of the reaction, see
+            :py:meth:`tespy.components.combustion.base.CombustionChamber.calc_reaction_state`.
+
+        Returns
+        -------
+        dm_dq : dict
+            Partial derivatives of the converted mass flow of the fluid with
+            respect to the inlet mass flows of the fuels and oxygen.
+        """
+        molar_mass = self.reaction_molar_mass
+        M_o2 = molar_mass[self.o2]
+        n_oxygen = reaction["n_oxygen"]
+        n_oxygen_stoich = reaction["n_oxygen_stoich"]
+
+        # stoichiometric oxygen per mass of fuel
+        oxy_stoich = {
+            f: (self.fuels[f]['H'] / 4 + self.fuels[f]['C']) / molar_mass[f]
+            for f in self.fuel_list
+        }
+
+        dm_dq = {}
+        if fluid == self.co2:
+            M = molar_mass[self.co2]
+            for f in self.fuel_list:
+                dm_dq[f] = self.fuels[f]['C'] / molar_mass[f] * M
+                if self.lamb.val < 1:
+                    dm_dq[f] -= oxy_stoich[f] * M
+            if self.lamb.val < 1:
+                dm_dq[self.o2] = M / M_o2
+
+        elif fluid == self.h2o:
+            M = molar_mass[self.h2o]
+            for f in self.fuel_list:
+                dm_dq[f] = self.fuels[f]['H'] / (2 * molar_mass[f]) * M
+                if self.lamb.val < 1:
+                    dm_dq[f] -= 2 * oxy_stoich[f] * M
+            if self.lamb.val < 1:
+                dm_dq[self.o2] = 2 * M / M_o2
+
+        elif fluid == self.o2:
+            if self.lamb.val < 1:
+                dm_dq[self.o2] = -1
+            elif self.lamb.is_set:
+                dm_dq[self.o2] = -1 / self.lamb.val
+            else:
+                # lambda is a result: oxygen consumption is stoichiometric
+                for f in self.fuel_list:
+                    dm_dq[f] = -oxy_stoich[f] * M_o2
+
+        elif fluid in self.fuel_list:
+            if self.lamb.val < 1:
+                # converted fuel: n_fuel * n_oxygen / n_oxygen_stoich
+                q = reaction["q"][fluid]
+                ratio = n_oxygen / n_oxygen_stoich
+                for f in self.fuel_list:
+                    dm_dq[f] = q * ratio / n_oxygen_stoich * oxy_stoich[f]
+                dm_dq[fluid] -= ratio
+                dm_dq[self.o2] = -q / (n_oxygen_stoich * M_o2)
+            else:
+                dm_dq[fluid] = -1
+
+        return dm_dq
+
     def energy_balance_func(self):
         r"""
         Calculate the energy balance of the adiabatic combustion chamber.
@@ -835,20 +1021,16 @@ class CombustionChamber(Component):
         - Reference pressure: 1 bar.
         """
         inl, outl = self._get_combustion_connections()
-        T_ref = 298.15
-        p_ref = 1e5
 
         res = 0
         for i in inl:
             res += i.m.val_SI * (
-                i.h.val_SI
-                - h_mix_pT(p_ref, T_ref, i.fluid_data, mixing_rule="forced-gas")
+                i.h.val_SI - reference_enthalpy(i.fluid_data)
             )
 
         for o in outl:
             res -= o.m.val_SI * (
-                o.h.val_SI
-                - h_mix_pT(p_ref, T_ref, o.fluid_data, mixing_rule="forced-gas")
+                o.h.val_SI - reference_enthalpy(o.fluid_data)
             )
 
         res += self.calc_ti()
@@ -14,11 +14,11 @@ SPDX-License-Identifier: MIT
 import numpy as np
 
 from tespy.components import CombustionChamber
+from tespy.components.combustion.base import reference_enthalpy
 from tespy.components.component import component_registry
 from tespy.tools import logger
 from tespy.tools.data_containers import ComponentProperties as dc_cp
 from tespy.tools.document_models import generate_latex_eq
-from tespy.tools.fluid_properties import h_mix_pT
 
 
 @component_registry
@@ -307,22 +307,17 @@ class DiabaticCombustionChamber(CombustionChamber):
         - Reference temperature: 298.15 K.
         - Reference pressure: 1 bar.
         """
-        T_ref = 298.15
-        p_ref = 1e5
-
         res = 0
         for i in self.inl:
             i.build_fluid_data()
             res += i.m.val_SI * (
-                i.h.val_SI
-                - h_mix_pT(p_ref, T_ref, i.fluid_data, mixing_rule="forced-gas")
+                i.h.val_SI - reference_enthalpy(i.fluid_data)
             )
 
         for o in self.outl:
             o.build_fluid_data()
             res -= o.m.val_SI * (
-                o.h.val_SI
-                - h_mix_pT(p_ref, T_ref, o.fluid_data, mixing_rule="forced-gas")
+                o.h.val_SI - reference_enthalpy(o.fluid_data)
             )
 
         res += self.calc_ti() * self.eta.val
@@ -362,22 +357,17 @@ class DiabaticCombustionChamber(CombustionChamber):
         r"""Postprocessing parameter calculation."""
         super().calc_parameters()
 
-        T_ref = 298.15
-        p_ref = 1e5
-
         res = 0
         for i in self.inl:
             i.build_fluid_data()
             res += i.m.val_SI * (
-                i.h.val_SI
-                - h_mix_pT(p_ref, T_ref, i.fluid_data, mixing_rule="forced-gas")
+                i.h.val_SI - reference_enthalpy(i.fluid_data)
             )
 
         for o in self.outl:
             o.build_fluid_data()
             res -= o.m.val_SI * (
-                o.h.val_SI
-                - h_mix_pT(p_ref, T_ref, o.fluid_data, mixing_rule="forced-gas")
+                o.h.val_SI - reference_enthalpy(o.fluid_data)
             )
 
         self.eta.val = -res / self.ti.val
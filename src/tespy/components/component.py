@@ -17,6 +17,8 @@ import math
 import numpy as np
 
 from tespy.tools import logger
+from tespy.tools.autodiff import _numeric_deriv
+from tespy.tools.autodiff import evaluate_dual
 from tespy.tools.characteristics import CharLine
 from tespy.tools.characteristics import CharMap
 from tespy.tools.characteristics import load_default_char as ldc
@@ -27,9 +29,10 @@ from tespy.tools.data_containers import GroupedComponentCharacteristics as dc_gc
 from tespy.tools.data_containers import GroupedComponentProperties as dc_gcp
 from tespy.tools.data_containers import SimpleDataContainer as dc_simple
 from tespy.tools.document_models import generate_latex_eq
+from tespy.tools.fluid_properties import dv_mix_dph
+from tespy.tools.fluid_properties import dv_mix_pdh
 from tespy.tools.fluid_properties import v_mix_ph
 from tespy.tools.global_vars import ERR
-from tespy.tools.helpers import _numeric_deriv
 from tespy.tools.helpers import bus_char_derivative
 from tespy.tools.helpers import bus_char_evaluation
 from tespy.tools.helpers import newton_with_kwargs
@@ -129,6 +132,8 @@ class Component:
         self.char_warnings = True
         self.printout = True
         self.fkt_group = self.label
+        # equations removed by the topology reduction of the network
+        self._aliased_equations = set()
 
         # add container for components attributes
         self.parameters = self.get_parameters().copy()
@@ -285,6 +290,27 @@ class Component:
             logger.error(msg)
             raise KeyError(msg)
 
+    def __getstate__(self):
+        r"""
+        Return a compact state of the component for pickling.
+
+        The Jacobian, the residual values and the execution plan of the
+        equations are solver state, they are rebuilt instead of being pickled.
+        """
+        state = self.__dict__.copy()
+        for key in [
+                "jacobian", "residual", "_equation_plan", "_jacobian_slots"
+        ]:
+            state.pop(key, None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if "_vectorized_equations" in state:
+            self.jacobian = {}
+            self.residual = np.zeros(self.num_eq)
+            self.compile_equations(self._vectorized_equations)
+
     def _serialize(self):
         export = {}
         for k in self._serializable():
@@ -340,6 +366,9 @@ class Component:
         self.vars = {}
         self.num_vars = 0
         self.constraints = self.get_mandatory_constraints().copy()
+        # equations eliminated by the alias presolve of the network
+        for key in self._aliased_equations:
+            self.constraints.pop(key, None)
         self.prop_specifications = {}
         self.var_specifications = {}
         self.group_specifications = {}
@@ -409,6 +438,8 @@ class Component:
                 self.group_specifications[key] = val.is_set
 
             # component properties
+            if key in self._aliased_equations:
+                continue
             if data.is_set and data.func is not None:
                 self.num_eq += data.num_eq
 
@@ -422,16 +453,115 @@ class Component:
                 constraint["deriv"](sum_eq)
             sum_eq += num_eq
 
+        self.compile_equations()
+
         # done
         msg = f"The component {self.label} has {self.num_vars} variables."
         logger.debug(msg)
 
+    def compile_equations(self, vectorized=()):
+        r"""
+        Compile the equations of the component into a flat execution plan.
+
+        The plan holds the residual function, the derivative method, the
+        function parameters and the slice of the residual vector of every
+        equation, thus the specifications of the component are not evaluated
+        again in every iteration.
+
+        Parameters
+        ----------
+        vectorized : iterable
+            Component parameters, which equations are evaluated by a
+            vectorized kernel of the network and are not part of the plan.
+        """
+        self._equation_plan = []
+        self._jacobian_slots = None
+        self._vectorized_equations = tuple(vectorized)
+        sum_eq = 0
+        for constraint in self.constraints.values():
+            num_eq = constraint['num_eq']
+            if num_eq > 0 or not constraint['constant_deriv']:
+                self._equation_plan += [(
+                    constraint['func'], constraint['deriv'], {},
+                    slice(sum_eq, sum_eq + num_eq),
+                    constraint['constant_deriv']
+                )]
+            sum_eq += num_eq
+
+        for key, data in self.parameters.items():
+            if key in self._aliased_equations:
+                continue
+            if data.is_set and data.func is not None:
+                if key not in vectorized:
+                    self._equation_plan += [(
+                        data.func, data.deriv, data.func_params,
+                        slice(sum_eq, sum_eq + data.num_eq), False
+                    )]
+                sum_eq += data.num_eq
+
     def get_parameters(self):
         return {}
 
     def get_mandatory_constraints(self):
         return {}
 
+    def get_variable_aliases(self):
+        r"""
+        Get the equations of the component equating two variables.
+
+        The equations are eliminated by the network's presolve, which maps
+        the pressure or enthalpy of the connections onto a single variable.
+
+        Returns
+        -------
+        aliases : dict
+            Name of the mandatory constraint or component parameter as key,
+            list of tuples of the variable (:code:`'p'` or :code:`'h'`) and
+            the two connections sharing its value as value.
+        """
+        return {}
+
+    def get_vectorized_equations(self):
+        r"""
+        Get the equations of the component with a vectorized kernel.
+
+        A kernel evaluates an equation for all components of a network using
+        it at once on arrays, see :code:`Network.solve(..., vectorize=True)`.
+
+        Returns
+        -------
+        kernels : dict
+            Name of the component parameter as key, kernel function as value.
+            The kernel is called with the list of components and the
+            increment filter and returns the residual values, the Jacobian
+            columns (:code:`-1` for non-variable quantities) and the partial
+            derivatives of the equations.
+        """
+        return {}
+
+    def get_equation_offsets(self):
+        r"""
+        Get the position of the component parameters' equations.
+
+        Returns
+        -------
+        offsets : dict
+            Name of the component parameter as key, position of its (first)
+            equation in the residual vector of the component as value.
+        """
+        sum_eq = 0
+        for constraint in self.constraints.values():
+            sum_eq += constraint['num_eq']
+
+        offsets = {}
+        for key, data in self.parameters.items():
+            if key in self._aliased_equations:
+                continue
+            if data.is_set and data.func is not None:
+                offsets[key] = sum_eq
+                sum_eq += data.num_eq
+        return offsets
+
     @staticmethod
     def inlets():
         return []
@@ -513,6 +643,89 @@ class Component:
             else:
                 return False
 
+    def get_char_expr_deriv(
+            self, param, type='rel', inconn=0, outconn=0,
+            increment_filter=None):
+        r"""
+        Calculate characteristic function parameter and partial derivatives.
+
+        Parameters
+        ----------
+        param : str
+            Parameter for characteristic function evaluation.
+
+        type : str
+            Type of expression:
+
+            - :code:`rel`: relative to design value
+            - :code:`abs`: absolute value
+
+        inconn : int
+            Index of inlet connection.
+
+        outconn : int
+            Index of outlet connection.
+
+        increment_filter : ndarray
+            Matrix for filtering non-changing variables.
+
+        Returns
+        -------
+        expr : tuple
+            Value of expression and dictionary of the partial derivatives with
+            the column of the variable in the Jacobian matrix as key.
+        """
+        i = self.inl[inconn]
+        o = self.outl[outconn]
+        if param == 'm':
+            expr, derivatives = i.m.val_SI, {}
+            if self.is_variable(i.m, increment_filter):
+                derivatives[i.m.J_col] = 1
+            reference = i.m.design
+        elif param == 'm_out':
+            expr, derivatives = o.m.val_SI, {}
+            if self.is_variable(o.m, increment_filter):
+                derivatives[o.m.J_col] = 1
+            reference = o.m.design
+        elif param == 'v':
+            args = (i.p.val_SI, i.h.val_SI, i.fluid_data, i.mixing_rule)
+            v = v_mix_ph(*args, T0=i.T.val_SI)
+            expr, derivatives = i.m.val_SI * v, {}
+            if self.is_variable(i.m, increment_filter):
+                derivatives[i.m.J_col] = v
+            if self.is_variable(i.p, increment_filter):
+                derivatives[i.p.J_col] = i.m.val_SI * dv_mix_dph(
+                    *args, T0=i.T.val_SI
+                )
+            if self.is_variable(i.h, increment_filter):
+                derivatives[i.h.J_col] = i.m.val_SI * dv_mix_pdh(
+                    *args, T0=i.T.val_SI
+                )
+            reference = i.v.design
+        elif param == 'pr':
+            expr, derivatives = o.p.val_SI / i.p.val_SI, {}
+            if self.is_variable(i.p, increment_filter):
+                derivatives[i.p.J_col] = -expr / i.p.val_SI
+            if self.is_variable(o.p, increment_filter):
+                derivatives[o.p.J_col] = 1 / i.p.val_SI
+            reference = o.p.design / i.p.design
+        elif type == 'rel':
+            msg = (
+                f"The parameter {param}) is not available for "
+                "characteristic function evaluation."
+            )
+            logger.error(msg)
+            raise ValueError(msg)
+        else:
+            return False, {}
+
+        if type == 'rel':
+            expr /= reference
+            derivatives = {
+                col: value / reference for col, value in derivatives.items()
+            }
+        return expr, derivatives
+
     def get_char_expr_doc(self, param, type='rel', inconn=0, outconn=0):
         r"""
         Generic method to access characteristic function parameters.
@@ -578,28 +791,86 @@ class Component:
         """
         Solve equations and calculate partial derivatives of a component.
 
+        The equations are evaluated in the order of the plan compiled by
+        :code:`compile_equations`.
+
         Parameters
         ----------
         increment_filter : ndarray
             Matrix for filtering non-changing variables.
         """
-        sum_eq = 0
-        for constraint in self.constraints.values():
-            num_eq = constraint['num_eq']
-            if num_eq > 0:
-                self.residual[sum_eq:sum_eq + num_eq] = constraint['func']()
-            if not constraint['constant_deriv']:
-                constraint['deriv'](increment_filter, sum_eq)
-            sum_eq += num_eq
-
-        for data in self.parameters.values():
-            if data.is_set and data.func is not None:
-                self.residual[sum_eq:sum_eq + data.num_eq] = data.func(
-                    **data.func_params
+        residual = self.residual
+        for func, deriv, kwargs, rows, constant_deriv in self._equation_plan:
+            if deriv is None:
+                residual[rows] = self.autodiff_deriv(
+                    func, increment_filter, rows.start, **kwargs
                 )
-                data.deriv(increment_filter, sum_eq, **data.func_params)
+                continue
+            if rows.stop > rows.start:
+                residual[rows] = func(**kwargs)
+            if not constant_deriv:
+                deriv(increment_filter, rows.start, **kwargs)
 
-                sum_eq += data.num_eq
+    def evaluate_residuals(self):
+        """
+        Calculate the residual values of the component's equations only.
+
+        The partial derivatives are not calculated, e.g. for line searches or
+        Jacobian updates without derivatives.
+
+        Returns
+        -------
+        residual : ndarray
+            Residual values of the component's equations.
+        """
+        residual = self.residual
+        for func, _, kwargs, rows, _ in self._equation_plan:
+            if rows.stop > rows.start:
+                residual[rows] = func(**kwargs)
+
+        return residual
+
+    def autodiff_deriv(self, func, increment_filter, k, **kwargs):
+        r"""
+        Calculate residual and derivatives by automatic differentiation.
+
+        This method is used for equations without a derivative method
+        (:code:`deriv` is :code:`None`). The residual function is evaluated
+        once with :py:class:`tespy.tools.autodiff.Dual` numbers for mass flow,
+        pressure and enthalpy of all connections and the component variables.
+        The derivatives of the fluid property functions are calculated by
+        finite differences. Functions using other than the arithmetic
+        operators, the fluid property functions, the characteristics and the
+        mathematical functions of :py:mod:`tespy.tools.autodiff` are
+        differentiated by finite differences. Derivatives to the fluid
+        composition are calculated numerically.
+
+        Parameters
+        ----------
+        func : function
+            Residual function of the equation(s).
+
+        increment_filter : ndarray
+            Matrix for filtering non-changing variables.
+
+        k : int
+            Position of (first) equation in Jacobian matrix.
+
+        Returns
+        -------
+        residual : float, ndarray
+            Residual value(s) of the equation(s).
+        """
+        residual, derivatives = evaluate_dual(
+            self, func, self.inl + self.outl, variables=list(self.vars),
+            increment_filter=increment_filter, **kwargs
+        )
+        if isinstance(derivatives, dict):
+            derivatives = [derivatives]
+        for i, derivative in enumerate(derivatives):
+            for col, value in derivative.items():
+                self.jacobian[k + i, col] = value
+        return residual
 
     def bus_func(self, bus):
         r"""
@@ -21,8 +21,13 @@ from tespy.tools.data_containers import ComponentCharacteristics as dc_cc
 from tespy.tools.data_containers import ComponentProperties as dc_cp
 from tespy.tools.data_containers import GroupedComponentCharacteristics as dc_gcc
 from tespy.tools.document_models import generate_latex_eq
+from tespy.tools.fluid_properties import dh_mix_dpT
+from tespy.tools.fluid_properties import dh_mix_pdT
+from tespy.tools.fluid_properties import dT_mix_dph
+from tespy.tools.fluid_properties import dT_mix_pdh
 from tespy.tools.fluid_properties import h_mix_pT
 from tespy.tools.fluid_properties import s_mix_ph
+from tespy.tools.helpers import combine_derivatives
 from tespy.tools.helpers import convert_from_SI
 from tespy.tools.helpers import convert_to_SI
 
@@ -440,36 +445,158 @@ class HeatExchanger(Component):
         if self.is_variable(o.h):
             self.jacobian[k, o.h.J_col] = i.m.val_SI
 
-    def calculate_td_log(self):
-        i1 = self.inl[0]
+    def calc_T_deriv(self, c, increment_filter=None, deriv=True):
+        r"""
+        Calculate the temperature of a connection and its partial derivatives.
+
+        Parameters
+        ----------
+        c : tespy.connections.connection.Connection
+            Connection to calculate the temperature for.
+
+        increment_filter : ndarray
+            Matrix for filtering non-changing variables.
+
+        deriv : boolean
+            Calculate the partial derivatives, default: True.
+
+        Returns
+        -------
+        T : tuple
+            Temperature value and dictionary of the partial derivatives with
+            the column of the variable in the Jacobian matrix as key.
+        """
+        T = c.calc_T()
+        dT = {}
+        if deriv:
+            args = (c.p.val_SI, c.h.val_SI, c.fluid_data, c.mixing_rule, T)
+            if self.is_variable(c.p, increment_filter):
+                dT[c.p.J_col] = dT_mix_dph(*args)
+            if self.is_variable(c.h, increment_filter):
+                dT[c.h.J_col] = dT_mix_pdh(*args)
+        return T, dT
+
+    def calc_T_hot_inlet_deriv(self, increment_filter=None, deriv=True):
+        r"""
+        Calculate the hot side inlet temperature and its partial derivatives.
+
+        Parameters
+        ----------
+        increment_filter : ndarray
+            Matrix for filtering non-changing variables.
+
+        deriv : boolean
+            Calculate the partial derivatives, default: True.
+
+        Returns
+        -------
+        T : tuple
+            Temperature value and dictionary of the partial derivatives with
+            the column of the variable in the Jacobian matrix as key.
+        """
+        return self.calc_T_deriv(self.inl[0], increment_filter, deriv)
+
+    def get_td_log_temperatures(self, increment_filter=None, deriv=False):
+        r"""
+        Get the terminal temperatures for the logarithmic temperature difference.
+
+        Parameters
+        ----------
+        increment_filter : ndarray
+            Matrix for filtering non-changing variables.
+
+        deriv : boolean
+            Calculate the partial derivatives, default: False.
+
+        Returns
+        -------
+        T : list
+            Temperatures at hot side inlet and cold side inlet, hot side
+            outlet and cold side outlet as tuples of the value and the
+            partial derivatives.
+        """
         i2 = self.inl[1]
         o1 = self.outl[0]
         o2 = self.outl[1]
 
         # temperature value manipulation for convergence stability
-        T_i1 = i1.calc_T()
-        T_i2 = i2.calc_T()
-        T_o1 = o1.calc_T()
-        T_o2 = o2.calc_T()
-
-        if T_i1 <= T_o2:
-            T_i1 = T_o2 + 0.01
-        if T_i1 <= T_o2:
-            T_o2 = T_i1 - 0.01
-        if T_i1 <= T_o2:
-            T_o1 = T_i2 + 0.02
-        if T_o1 <= T_i2:
-            T_i2 = T_o1 - 0.02
+        T_i1 = self.calc_T_hot_inlet_deriv(increment_filter, deriv)
+        T_i2 = self.calc_T_deriv(i2, increment_filter, deriv)
+        T_o1 = self.calc_T_deriv(o1, increment_filter, deriv)
+        T_o2 = self.calc_T_deriv(o2, increment_filter, deriv)
+
+        if T_i1[0] <= T_o2[0]:
+            T_i1 = (T_o2[0] + 0.01, T_o2[1])
+        if T_i1[0] <= T_o2[0]:
+            T_o2 = (T_i1[0] - 0.01, T_i1[1])
+        if T_i1[0] <= T_o2[0]:
+            T_o1 = (T_i2[0] + 0.02, T_i2[1])
+        if T_o1[0] <= T_i2[0]:
+            T_i2 = (T_o1[0] - 0.02, T_o1[1])
+
+        return [T_i1, T_i2, T_o1, T_o2]
 
-        ttd_u = T_i1 - T_o2
-        ttd_l = T_o1 - T_i2
+    def calculate_td_log(self):
+        return self.calc_td_log_deriv(deriv=False)[0]
+
+    def calc_td_log_deriv(self, increment_filter=None, deriv=True):
+        r"""
+        Calculate the logarithmic temperature difference and its derivatives.
+
+        Parameters
+        ----------
+        increment_filter : ndarray
+            Matrix for filtering non-changing variables.
+
+        deriv : boolean
+            Calculate the partial derivatives, default: True.
+
+        Returns
+        -------
+        td_log : tuple
+            Logarithmic temperature difference and dictionary of its partial
+            derivatives with the column of the variable in the Jacobian matrix
+            as key.
+
+            .. math::
+
+                \frac{\partial \Delta T_{log}}{\partial \Delta T_{l}} =
+                \frac{\ln\frac{\Delta T_{l}}{\Delta T_{u}} -
+                \frac{\Delta T_{l} - \Delta T_{u}}{\Delta T_{l}}}
+                {\ln^2\frac{\Delta T_{l}}{\Delta T_{u}}}\\
+                \frac{\partial \Delta T_{log}}{\partial \Delta T_{u}} =
+                \frac{\frac{\Delta T_{l} - \Delta T_{u}}{\Delta T_{u}} -
+                \ln\frac{\Delta T_{l}}{\Delta T_{u}}}
+                {\ln^2\frac{\Delta T_{l}}{\Delta T_{u}}}
+        """
+        T_i1, T_i2, T_o1, T_o2 = self.get_td_log_temperatures(
+            increment_filter, deriv
+        )
+
+        ttd_u = T_i1[0] - T_o2[0]
+        ttd_l = T_o1[0] - T_i2[0]
 
         if ttd_u == ttd_l:
             td_log = ttd_l
         else:
             td_log = (ttd_l - ttd_u) / math.log((ttd_l) / (ttd_u))
 
-        return td_log
+        if not deriv:
+            return td_log, {}
+
+        log = math.log(ttd_l / ttd_u)
+        if abs(log) < 1e-4:
+            # limit for equal terminal temperature differences
+            dtd_l = 0.5
+            dtd_u = 0.5
+        else:
+            dtd_l = (log - (ttd_l - ttd_u) / ttd_l) / log ** 2
+            dtd_u = ((ttd_l - ttd_u) / ttd_u - log) / log ** 2
+
+        return td_log, combine_derivatives(
+            (dtd_u, T_i1[1]), (-dtd_u, T_o2[1]),
+            (dtd_l, T_o1[1]), (-dtd_l, T_i2[1])
+        )
 
     def kA_func(self):
         r"""
@@ -529,16 +656,13 @@ class HeatExchanger(Component):
         k : int
             Position of derivatives in Jacobian matrix (k-th equation).
         """
-        f = self.kA_func
         i = self.inl[0]
         o = self.outl[0]
         if self.is_variable(i.m):
             self.jacobian[k, i.m.J_col] = o.h.val_SI - i.h.val_SI
-        for c in self.inl + self.outl:
-            if self.is_variable(c.p):
-                self.jacobian[k, c.p.J_col] = self.numeric_deriv(f, 'p', c)
-            if self.is_variable(c.h):
-                self.jacobian[k, c.h.J_col] = self.numeric_deriv(f, 'h', c)
+
+        _, dtd_log = self.calc_td_log_deriv()
+        self.set_heat_transfer_deriv(k, combine_derivatives((self.kA.val, dtd_log)))
 
     def kA_char_func(self):
         r"""
@@ -564,15 +688,7 @@ class HeatExchanger(Component):
         For standard functions f\ :subscript:`1` \ and f\ :subscript:`2` \ see
         module :py:mod:`tespy.data`.
         """
-        p1 = self.kA_char1.param
-        p2 = self.kA_char2.param
-        f1 = self.get_char_expr(p1, **self.kA_char1.char_params)
-        f2 = self.get_char_expr(p2, **self.kA_char2.char_params)
-
-        fkA1 = self.kA_char1.char_func.evaluate(f1)
-        fkA2 = self.kA_char2.char_func.evaluate(f2)
-        fkA = 2 / (1 / fkA1 + 1 / fkA2)
-
+        fkA = self.calc_fkA()
         td_log = self.calculate_td_log()
 
         return (
@@ -581,6 +697,29 @@ class HeatExchanger(Component):
             ) + self.kA.design * fkA * td_log
         )
 
+    def calc_fkA(self):
+        r"""
+        Calculate the factor of the heat transfer coefficient characteristic.
+
+        Returns
+        -------
+        fkA : float
+            Factor of the heat transfer coefficient.
+
+            .. math::
+
+                f_{kA} = \frac{2}{\frac{1}{f_1\left( expr_1\right)} +
+                \frac{1}{f_2\left( expr_2\right)}}
+        """
+        p1 = self.kA_char1.param
+        p2 = self.kA_char2.param
+        f1 = self.get_char_expr(p1, **self.kA_char1.char_params)
+        f2 = self.get_char_expr(p2, **self.kA_char2.char_params)
+
+        fkA1 = self.kA_char1.char_func.evaluate(f1)
+        fkA2 = self.kA_char2.char_func.evaluate(f2)
+        return 2 / (1 / fkA1 + 1 / fkA2)
+
     def kA_char_func_doc(self, label):
         r"""
         Calculate heat transfer from heat transfer coefficient characteristic.
@@ -622,15 +761,84 @@ class HeatExchanger(Component):
         k : int
             Position of derivatives in Jacobian matrix (k-th equation).
         """
-        f = self.kA_char_func
-        for i in self.inl:
-            if self.is_variable(i.m):
-                self.jacobian[k, i.m.J_col] = self.numeric_deriv(f, 'm', i)
-        for c in self.inl + self.outl:
-            if self.is_variable(c.p):
-                self.jacobian[k, c.p.J_col] = self.numeric_deriv(f, 'p', c)
-            if self.is_variable(c.h):
-                self.jacobian[k, c.h.J_col] = self.numeric_deriv(f, 'h', c)
+        f = self.calc_fkA
+        fkA = f()
+        td_log, dtd_log = self.calc_td_log_deriv()
+        derivatives = combine_derivatives((self.kA.design * fkA, dtd_log))
+
+        i = self.inl[0]
+        for c in self.inl:
+            if self.is_variable(c.m):
+                self.jacobian[k, c.m.J_col] = (
+                    self.kA.design * td_log * self.numeric_deriv(f, 'm', c)
+                )
+                if c == i:
+                    self.jacobian[k, c.m.J_col] += (
+                        self.outl[0].h.val_SI - i.h.val_SI
+                    )
+
+        # characteristic function only depends on mass flow by default
+        params = {self.kA_char1.param, self.kA_char2.param}
+        if not params.issubset({'m', 'm_out'}):
+            for c in self.inl + self.outl:
+                for var in ['p', 'h']:
+                    if self.is_variable(c.get_attr(var)):
+                        col = c.get_attr(var).J_col
+                        derivatives[col] = derivatives.get(col, 0) + (
+                            self.kA.design * td_log
+                            * self.numeric_deriv(f, var, c)
+                        )
+
+        self.set_heat_transfer_deriv(k, derivatives)
+
+    def set_heat_transfer_deriv(self, k, derivatives):
+        r"""
+        Set the partial derivatives of the heat transfer equations.
+
+        Parameters
+        ----------
+        k : int
+            Position of derivatives in Jacobian matrix (k-th equation).
+
+        derivatives : dict
+            Partial derivatives of the heat transfer term with the column of
+            the variable in the Jacobian matrix as key.
+        """
+        i = self.inl[0]
+        o = self.outl[0]
+        if self.is_variable(i.h):
+            derivatives[i.h.J_col] = (
+                derivatives.get(i.h.J_col, 0) - i.m.val_SI
+            )
+        if self.is_variable(o.h):
+            derivatives[o.h.J_col] = (
+                derivatives.get(o.h.J_col, 0) + i.m.val_SI
+            )
+        self.set_deriv(k, derivatives, self.inl + self.outl)
+
+    def set_deriv(self, k, derivatives, conns, increment_filter=None):
+        r"""
+        Set the partial derivatives to pressure and enthalpy of connections.
+
+        Parameters
+        ----------
+        k : int
+            Position of derivatives in Jacobian matrix (k-th equation).
+
+        derivatives : dict
+            Partial derivatives with the column of the variable in the
+            Jacobian matrix as key.
+
+        conns : list
+            Connections to set the partial derivatives for.
+
+        increment_filter : ndarray
+            Matrix for filtering non-changing variables.
+        """
+        for c in conns:
+            for var in [c.p, c.h]:
+                if self.is_variable(var, increment_filter):
+                    self.jacobian[k, var.J_col] = derivatives.get(var.J_col, 0)
 
     def ttd_u_func(self):
         r"""
@@ -680,12 +888,12 @@ class HeatExchanger(Component):
         k : int
             Position of derivatives in Jacobian matrix (k-th equation).
         """
-        f = self.ttd_u_func
-        for c in [self.inl[0], self.outl[1]]:
-            if self.is_variable(c.p, increment_filter):
-                self.jacobian[k, c.p.J_col] = self.numeric_deriv(f, 'p', c)
-            if self.is_variable(c.h, increment_filter):
-                self.jacobian[k, c.h.J_col] = self.numeric_deriv(f, 'h', c)
+        _, dT_i1 = self.calc_T_hot_inlet_deriv(increment_filter)
+        _, dT_o2 = self.calc_T_deriv(self.outl[1], increment_filter)
+        derivatives = combine_derivatives((-1, dT_i1), (1, dT_o2))
+        self.set_deriv(
+            k, derivatives, [self.inl[0], self.outl[1]], increment_filter
+        )
 
     def ttd_l_func(self):
         r"""
@@ -735,12 +943,12 @@ class HeatExchanger(Component):
         k : int
             Position of derivatives in Jacobian matrix (k-th equation).
         """
-        f = self.ttd_l_func
-        for c in [self.inl[1], self.outl[0]]:
-            if self.is_variable(c.p, increment_filter):
-                self.jacobian[k, c.p.J_col] = self.numeric_deriv(f, 'p', c)
-            if self.is_variable(c.h, increment_filter):
-                self.jacobian[k, c.h.J_col] = self.numeric_deriv(f, 'h', c)
+        _, dT_i2 = self.calc_T_deriv(self.inl[1], increment_filter)
+        _, dT_o1 = self.calc_T_deriv(self.outl[0], increment_filter)
+        derivatives = combine_derivatives((-1, dT_o1), (1, dT_i2))
+        self.set_deriv(
+            k, derivatives, [self.inl[1], self.outl[0]], increment_filter
+        )
 
     def ttd_min_func(self):
         r"""
@@ -785,12 +993,19 @@ class HeatExchanger(Component):
         k : int
             Position of derivatives in Jacobian matrix (k-th equation).
         """
-        f = self.ttd_min_func
-        for c in self.inl + self.outl:
-            if self.is_variable(c.p, increment_filter):
-                self.jacobian[k, c.p.J_col] = self.numeric_deriv(f, 'p', c)
-            if self.is_variable(c.h, increment_filter):
-                self.jacobian[k, c.h.J_col] = self.numeric_deriv(f, 'h', c)
+        T_i1, dT_i1 = self.calc_T_deriv(self.inl[0], increment_filter)
+        T_i2, dT_i2 = self.calc_T_deriv(self.inl[1], increment_filter)
+        T_o1, dT_o1 = self.calc_T_deriv(self.outl[0], increment_filter)
+        T_o2, dT_o2 = self.calc_T_deriv(self.outl[1], increment_filter)
+
+        ttd_l = T_o1 - T_i2
+        ttd_u = T_i1 - T_o2
+        if min(ttd_l, ttd_u) == ttd_l:
+            derivatives = combine_derivatives((-1, dT_o1), (1, dT_i2))
+        else:
+            derivatives = combine_derivatives((-1, dT_i1), (1, dT_o2))
+
+        self.set_deriv(k, derivatives, self.inl + self.outl, increment_filter)
 
     def calc_dh_max_cold(self):
         r"""Calculate the theoretical maximum enthalpy increase on the cold side
@@ -842,21 +1057,53 @@ class HeatExchanger(Component):
         k : int
             Position of derivatives in Jacobian matrix (k-th equation).
         """
-        f = self.eff_cold_func
-
         i1 = self.inl[0]
         i2 = self.inl[1]
         o2 = self.outl[1]
 
-        for c in [i1, o2]:
-            if self.is_variable(c.p, increment_filter):
-                self.jacobian[k, c.p.J_col] = self.numeric_deriv(f, 'p', c)
-            if self.is_variable(c.h, increment_filter):
-                self.jacobian[k, c.h.J_col] = self.numeric_deriv(f, 'h', c)
+        derivatives = combine_derivatives(
+            (self.eff_cold.val, self.calc_dh_max_deriv(o2, i1, increment_filter))
+        )
+        if self.is_variable(o2.h, increment_filter):
+            derivatives[o2.h.J_col] = -1
+        self.set_deriv(k, derivatives, [i1, o2], increment_filter)
 
         if self.is_variable(i2.h):
             self.jacobian[k, i2.h.J_col] = 1 - self.eff_cold.val
 
+    def calc_dh_max_deriv(self, o, i, increment_filter=None):
+        r"""
+        Calculate the partial derivatives of the maximum enthalpy difference.
+
+        The maximum enthalpy difference of one side is defined by the outlet
+        pressure of that side and the inlet temperature of the other side.
+
+        Parameters
+        ----------
+        o : tespy.connections.connection.Connection
+            Outlet connection of the side.
+
+        i : tespy.connections.connection.Connection
+            Inlet connection of the other side.
+
+        increment_filter : ndarray
+            Matrix for filtering non-changing variables.
+
+        Returns
+        -------
+        derivatives : dict
+            Partial derivatives of :math:`h\left(p_{out}, T_{in}\right)`
+            with the column of the variable in the Jacobian matrix as key.
+        """
+        T, dT = self.calc_T_deriv(i, increment_filter)
+        dh_dT = dh_mix_pdT(o.p.val_SI, T, o.fluid_data, o.mixing_rule)
+        derivatives = combine_derivatives((dh_dT, dT))
+        if self.is_variable(o.p, increment_filter):
+            derivatives[o.p.J_col] = dh_mix_dpT(
+                o.p.val_SI, T, o.fluid_data, o.mixing_rule
+            )
+        return derivatives
+
     def calc_dh_max_hot(self):
         r"""Calculate the theoretical maximum enthalpy decrease on the hot side
 
@@ -907,8 +1154,6 @@ class HeatExchanger(Component):
         k : int
             Position of derivatives in Jacobian matrix (k-th equation).
         """
-        f = self.eff_hot_func
-
         i1 = self.inl[0]
         o1 = self.outl[0]
         i2 = self.inl[1]
@@ -916,11 +1161,12 @@ class HeatExchanger(Component):
         if self.is_variable(i1.h):
             self.jacobian[k, i1.h.J_col] = 1 - self.eff_hot.val
 
-        for c in [o1, i2]:
-            if self.is_variable(c.p, increment_filter):
-                self.jacobian[k, c.p.J_col] = self.numeric_deriv(f, 'p', c)
-            if self.is_variable(c.h, increment_filter):
-                self.jacobian[k, c.h.J_col] = self.numeric_deriv(f, 'h', c)
+        derivatives = combine_derivatives(
+            (self.eff_hot.val, self.calc_dh_max_deriv(o1, i2, increment_filter))
+        )
+        if self.is_variable(o1.h, increment_filter):
+            derivatives[o1.h.J_col] = -1
+        self.set_deriv(k, derivatives, [o1, i2], increment_filter)
 
     def eff_max_func(self):
         r"""Equation for maximum heat exchanger effectiveness.
@@ -964,13 +1210,33 @@ class HeatExchanger(Component):
         k : int
             Position of derivatives in Jacobian matrix (k-th equation).
         """
-        f = self.eff_max_func
+        i1 = self.inl[0]
+        i2 = self.inl[1]
+        o1 = self.outl[0]
+        o2 = self.outl[1]
 
-        for c in self.inl + self.outl:
-            if self.is_variable(c.p, increment_filter):
-                self.jacobian[k, c.p.J_col] = self.numeric_deriv(f, 'p', c)
-            if self.is_variable(c.h, increment_filter):
-                self.jacobian[k, c.h.J_col] = self.numeric_deriv(f, 'h', c)
+        dh_max_hot = self.calc_dh_max_hot()
+        dh_max_cold = self.calc_dh_max_cold()
+        eff_hot = (o1.h.val_SI - i1.h.val_SI) / dh_max_hot
+        eff_cold = (o2.h.val_SI - i2.h.val_SI) / dh_max_cold
+
+        if max(eff_hot, eff_cold) == eff_hot:
+            i, o, dh_max, eff = i1, o1, dh_max_hot, eff_hot
+            other = i2
+        else:
+            i, o, dh_max, eff = i2, o2, dh_max_cold, eff_cold
+            other = i1
+
+        # quotient rule for eff = (h_out - h_in) / (h(p_out, T_other) - h_in)
+        derivatives = combine_derivatives((
+            eff / dh_max, self.calc_dh_max_deriv(o, other, increment_filter)
+        ))
+        if self.is_variable(o.h, increment_filter):
+            derivatives[o.h.J_col] = -1 / dh_max
+        if self.is_variable(i.h, increment_filter):
+            derivatives[i.h.J_col] = (1 - eff) / dh_max
+
+        self.set_deriv(k, derivatives, self.inl + self.outl, increment_filter)
 
     def bus_func(self, bus):
         r"""
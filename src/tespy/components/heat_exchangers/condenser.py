@@ -21,6 +21,7 @@ from tespy.tools import logger
 from tespy.tools.data_containers import SimpleDataContainer as dc_simple
 from tespy.tools.document_models import generate_latex_eq
 from tespy.tools.fluid_properties import dh_mix_dpQ
+from tespy.tools.fluid_properties import dT_sat_dp
 from tespy.tools.fluid_properties import h_mix_pQ
 from tespy.tools.helpers import convert_from_SI
 
@@ -313,35 +314,53 @@ class Condenser(HeatExchanger):
         if self.is_variable(o.h):
             self.jacobian[k, o.h.J_col] = 1
 
-    def calculate_td_log(self):
+    def calc_T_hot_inlet_deriv(self, increment_filter=None, deriv=True):
+        r"""
+        Calculate the hot side saturation temperature and its derivatives.
+
+        Parameters
+        ----------
+        increment_filter : ndarray
+            Matrix for filtering non-changing variables.
+
+        deriv : boolean
+            Calculate the partial derivatives, default: True.
 
+        Returns
+        -------
+        T : tuple
+            Saturation temperature at the hot side inlet pressure and
+            dictionary of the partial derivatives with the column of the
+            variable in the Jacobian matrix as key.
+        """
+        i = self.inl[0]
+        T = i.calc_T_sat()
+        dT = {}
+        if deriv and self.is_variable(i.p, increment_filter):
+            dT[i.p.J_col] = dT_sat_dp(i.p.val_SI, i.fluid_data)
+        return T, dT
+
+    def get_td_log_temperatures(self, increment_filter=None, deriv=False):
         i1 = self.inl[0]
         i2 = self.inl[1]
         o1 = self.outl[0]
         o2 = self.outl[1]
 
-        T_i1 = i1.calc_T_sat()
-        T_i2 = i2.calc_T()
-        T_o1 = o1.calc_T()
-        T_o2 = o2.calc_T()
-
-        if T_i1 <= T_o2 and not i1.T.is_set:
-            T_i1 = T_o2 + 0.5
-        if T_i1 <= T_o2 and not o2.T.is_set:
-            T_o2 = T_i1 - 0.5
-        if T_o1 <= T_i2 and not o1.T.is_set:
-            T_o1 = T_i2 + 1
-        if T_o1 <= T_i2 and not i2.T.is_set:
-            T_i2 = T_o1 - 1
-
-        ttd_u = T_i1 - T_o2
-        ttd_l = T_o1 - T_i2
-        if ttd_u == ttd_l:
-            td_log = ttd_l
-        else:
-            td_log = (ttd_l - ttd_u) / math.log((ttd_l) / (ttd_u))
-
-        return td_log
+        T_i1 = self.calc_T_hot_inlet_deriv(increment_filter, deriv)
+        T_i2 = self.calc_T_deriv(i2, increment_filter, deriv)
+        T_o1 = self.calc_T_deriv(o1, increment_filter, deriv)
+        T_o2 = self.calc_T_deriv(o2, increment_filter, deriv)
+
+        if T_i1[0] <= T_o2[0] and not i1.T.is_set:
+            T_i1 = (T_o2[0] + 0.5, T_o2[1])
+        if T_i1[0] <= T_o2[0] and not o2.T.is_set:
+            T_o2 = (T_i1[0] - 0.5, T_i1[1])
+        if T_o1[0] <= T_i2[0] and not o1.T.is_set:
+            T_o1 = (T_i2[0] + 1, T_i2[1])
+        if T_o1[0] <= T_i2[0] and not i2.T.is_set:
+            T_i2 = (T_o1[0] - 1, T_o1[1])
+
+        return [T_i1, T_i2, T_o1, T_o2]
 
     def kA_func_doc(self, label):
         r"""
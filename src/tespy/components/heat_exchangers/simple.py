@@ -24,8 +24,12 @@ from tespy.tools.data_containers import ComponentProperties as dc_cp
 from tespy.tools.data_containers import GroupedComponentProperties as dc_gcp
 from tespy.tools.data_containers import SimpleDataContainer as dc_simple
 from tespy.tools.document_models import generate_latex_eq
+from tespy.tools.fluid_properties import T_mix_ph
 from tespy.tools.fluid_properties import s_mix_ph
+from tespy.tools.fluid_properties import v_mix_ph
+from tespy.tools.fluid_properties import viscosity_mix_ph
 from tespy.tools.fluid_properties.helpers import darcy_friction_factor as dff
+from tespy.tools.fluid_properties.helpers import darcy_friction_factor_array
 from tespy.tools.helpers import convert_to_SI
 
 
@@ -250,6 +254,26 @@ class SimpleHeatExchanger(Component):
     def outlets():
         return ['out1']
 
+    def get_variable_aliases(self):
+        if self.pr.is_set and not self.pr.is_var and self.pr.val == 1:
+            return {'pr': [('p', self.inl[0], self.outl[0])]}
+        return {}
+
+    def get_vectorized_equations(self):
+        kernels = {
+            'Q': ('energy_balance_func', self.energy_balance_kernel),
+            'darcy_group': ('darcy_func', self.darcy_kernel),
+            'hw_group': ('hazen_williams_func', self.hazen_williams_kernel),
+            'kA_group': ('kA_group_func', self.kA_group_kernel)
+        }
+        # the kernels only replace the equations of this class
+        return {
+            key: kernel for key, (func, kernel) in kernels.items()
+            if key in self.parameters and getattr(
+                self.get_attr(key).func, '__func__', None
+            ) is getattr(SimpleHeatExchanger, func)
+        }
+
     def preprocess(self, num_nw_vars):
         super().preprocess(num_nw_vars)
 
@@ -733,6 +757,267 @@ class SimpleHeatExchanger(Component):
         if self.is_variable(o.h, increment_filter):
             self.jacobian[k, o.h.J_col] = self.numeric_deriv(f, 'h', o)
 
+    @staticmethod
+    def energy_balance_kernel(components, increment_filter):
+        r"""
+        Calculate the energy balance of many components at once.
+
+        Parameters
+        ----------
+        components : list
+            Components to evaluate the equation for.
+
+        increment_filter : ndarray
+            Matrix for filtering non-changing variables.
+
+        Returns
+        -------
+        residual : ndarray
+            Residual values of the equations, see
+            :py:meth:`tespy.components.heat_exchangers.simple.SimpleHeatExchanger.energy_balance_func`.
+
+        columns : ndarray
+            Jacobian columns of the inlet mass flow, the inlet and outlet
+            enthalpy and the heat flow.
+
+        derivatives : ndarray
+            Partial derivatives of the equations.
+        """
+        i, o = _connection_states(components)
+        Q = _component_values(components, 'Q')
+        columns = np.column_stack([
+            i['m_col'], i['h_col'], o['h_col'],
+            _columns([cp.Q for cp in components])
+        ])
+        residual = i['m'] * (o['h'] - i['h']) - Q
+        derivatives = np.column_stack([
+            o['h'] - i['h'], -i['m'], i['m'], -np.ones(len(components))
+        ])
+        return residual, columns, derivatives
+
+    @staticmethod
+    def darcy_kernel(components, increment_filter):
+        r"""
+        Calculate the darcy group equation of many components at once.
+
+        The fluid properties and their partial derivatives are evaluated once
+        per connection, the friction factor and the pressure drop are
+        calculated on arrays.
+
+        Parameters
+        ----------
+        components : list
+            Components to evaluate the equation for.
+
+        increment_filter : ndarray
+            Matrix for filtering non-changing variables.
+
+        Returns
+        -------
+        residual : ndarray
+            Residual values of the equations, see
+            :py:meth:`tespy.components.heat_exchangers.simple.SimpleHeatExchanger.darcy_func`.
+
+        columns : ndarray
+            Jacobian columns of the inlet mass flow, the inlet and outlet
+            pressure and enthalpy, length, roughness and diameter.
+
+        derivatives : ndarray
+            Partial derivatives of the equations.
+        """
+        i, o = _connection_states(components)
+        elements = ['L', 'ks', 'D']
+        columns = _hydraulic_columns(i, o, components, elements)
+        needed = _is_needed(columns, increment_filter)
+
+        residual = i['p'] - o['p']
+        derivatives = np.zeros(columns.shape)
+        derivatives[:, 1] = 1
+        derivatives[:, 3] = -1
+
+        flow = np.flatnonzero(np.abs(i['m']) >= 1e-4)
+        if len(flow) == 0:
+            return residual, columns, derivatives
+
+        visc_i = _connection_property(
+            i['conns'], _viscosity, flow, needed[:, 1], needed[:, 2]
+        )
+        visc_o = _connection_property(
+            o['conns'], _viscosity, flow, needed[:, 3], needed[:, 4]
+        )
+        v_i = _connection_property(
+            i['conns'], _volume, flow, needed[:, 1], needed[:, 2]
+        )
+        v_o = _connection_property(
+            o['conns'], _volume, flow, needed[:, 3], needed[:, 4]
+        )
+        args = [i['m'][flow], (visc_i[0] + visc_o[0]) / 2] + [
+            _component_values(components, key)[flow] for key in elements
+        ]
+        v = (v_i[0] + v_o[0]) / 2
+
+        def pressure_drop(m, visc, L, ks, D):
+            Re = 4 * np.abs(m) / (math.pi * D * visc)
+            return (
+                8 * np.abs(m) * m * L * darcy_friction_factor_array(Re, ks, D)
+                / (math.pi ** 2 * D ** 5)
+            )
+
+        dp = pressure_drop(*args) * v
+        residual[flow] -= dp
+
+        steps = [1e-4, args[1] * 1e-4]
+        steps += [
+            _component_values(components, key, 'd')[flow] for key in elements
+        ]
+        if not needed[flow, 5:].any():
+            steps = steps[:2]
+        grad = _central_differences(pressure_drop, args, steps)
+        # partial derivatives to the mean viscosity and volume
+        d_visc = grad[1] * v / 2
+        d_v = dp / v / 2
+
+        derivatives[flow, 0] = -grad[0] * v
+        for col, (visc, vol, prop) in enumerate(
+                [(visc_i, v_i, 1), (visc_i, v_i, 2),
+                 (visc_o, v_o, 1), (visc_o, v_o, 2)], start=1):
+            derivatives[flow, col] -= d_visc * visc[prop] + d_v * vol[prop]
+        for col, deriv in enumerate(grad[2:], start=5):
+            derivatives[flow, col] = -deriv * v
+
+        return residual, columns, derivatives
+
+    @staticmethod
+    def hazen_williams_kernel(components, increment_filter):
+        r"""
+        Calculate the Hazen-Williams equation of many components at once.
+
+        Parameters
+        ----------
+        components : list
+            Components to evaluate the equation for.
+
+        increment_filter : ndarray
+            Matrix for filtering non-changing variables.
+
+        Returns
+        -------
+        residual : ndarray
+            Residual values of the equations, see
+            :py:meth:`tespy.components.heat_exchangers.simple.SimpleHeatExchanger.hazen_williams_func`.
+
+        columns : ndarray
+            Jacobian columns of the inlet mass flow, the inlet and outlet
+            pressure and enthalpy, length, roughness and diameter.
+
+        derivatives : ndarray
+            Partial derivatives of the equations.
+        """
+        i, o = _connection_states(components)
+        elements = ['L', 'ks_HW', 'D']
+        columns = _hydraulic_columns(i, o, components, elements)
+        needed = _is_needed(columns, increment_filter)
+
+        residual = i['p'] - o['p']
+        derivatives = np.zeros(columns.shape)
+        derivatives[:, 1] = 1
+        derivatives[:, 3] = -1
+
+        flow = np.flatnonzero(np.abs(i['m']) >= 1e-4)
+        if len(flow) == 0:
+            return residual, columns, derivatives
+
+        v_i = _connection_property(
+            i['conns'], _volume, flow, needed[:, 1], needed[:, 2]
+        )
+        v_o = _connection_property(
+            o['conns'], _volume, flow, needed[:, 3], needed[:, 4]
+        )
+        m = i['m'][flow]
+        L, ks, D = [
+            _component_values(components, key)[flow] for key in elements
+        ]
+        v = (v_i[0] + v_o[0]) / 2
+        dp = (
+            10.67 * np.abs(m) ** 1.852 * L / (ks ** 1.852 * D ** 4.871)
+            * 9.81 * v ** 0.852
+        )
+        delta_p = i['p'][flow] - o['p'][flow]
+        residual[flow] = np.copysign(delta_p, m) - dp
+
+        sign = np.copysign(1, delta_p) * np.copysign(1, m)
+        d_v = 0.852 * dp / v / 2
+        derivatives[flow, 0] = -1.852 * dp / m
+        derivatives[flow, 1] = sign - d_v * v_i[1]
+        derivatives[flow, 2] = -d_v * v_i[2]
+        derivatives[flow, 3] = -sign - d_v * v_o[1]
+        derivatives[flow, 4] = -d_v * v_o[2]
+        derivatives[flow, 5] = -dp / L
+        derivatives[flow, 6] = 1.852 * dp / ks
+        derivatives[flow, 7] = 4.871 * dp / D
+
+        return residual, columns, derivatives
+
+    @staticmethod
+    def kA_group_kernel(components, increment_filter):
+        r"""
+        Calculate the kA group equation of many components at once.
+
+        Parameters
+        ----------
+        components : list
+            Components to evaluate the equation for.
+
+        increment_filter : ndarray
+            Matrix for filtering non-changing variables.
+
+        Returns
+        -------
+        residual : ndarray
+            Residual values of the equations, see
+            :py:meth:`tespy.components.heat_exchangers.simple.SimpleHeatExchanger.kA_group_func`.
+
+        columns : ndarray
+            Jacobian columns of the inlet mass flow, the inlet and outlet
+            pressure and enthalpy and the heat transfer coefficient.
+
+        derivatives : ndarray
+            Partial derivatives of the equations.
+        """
+        i, o = _connection_states(components)
+        columns = np.column_stack([
+            i['m_col'], i['p_col'], i['h_col'], o['p_col'], o['h_col'],
+            _columns([cp.kA for cp in components])
+        ])
+        needed = _is_needed(columns, increment_filter)
+
+        every = np.arange(len(components))
+        T_i = _connection_property(
+            i['conns'], _temperature, every, needed[:, 1], needed[:, 2]
+        )
+        T_o = _connection_property(
+            o['conns'], _temperature, every, needed[:, 3], needed[:, 4]
+        )
+        kA = _component_values(components, 'kA')
+        Tamb = _component_values(components, 'Tamb', 'val_SI')
+        ttd_1 = T_i[0] - Tamb
+        ttd_2 = T_o[0] - Tamb
+        td_log = _logarithmic_temperature_difference(ttd_1, ttd_2)
+        d_td_1, d_td_2 = _central_differences(
+            _logarithmic_temperature_difference, [ttd_1, ttd_2], [1e-3, 1e-3]
+        )
+
+        residual = i['m'] * (o['h'] - i['h']) + kA * td_log
+        derivatives = np.column_stack([
+            o['h'] - i['h'],
+            kA * d_td_1 * T_i[1],
+            -i['m'] + kA * d_td_1 * T_i[2],
+            kA * d_td_2 * T_o[1],
+            i['m'] + kA * d_td_2 * T_o[2],
+            td_log
+        ])
+        return residual, columns, derivatives
+
     def bus_func(self, bus):
         r"""
         Calculate the value of the bus function.
@@ -1171,3 +1456,105 @@ class HeatExchangerSimple(SimpleHeatExchanger):
             "the next major release, please import SimpleHeatExchanger instead."
         )
         warnings.warn(msg, FutureWarning)
+
+
+def _columns(containers):
+    # containers of connections may keep the variable flag without a column
+    # in the Jacobian, if they are not part of the variable space
+    return np.array([
+        data.J_col if data.is_var and getattr(data, 'J_col', None) is not None
+        else -1 for data in containers
+    ], dtype=int)
+
+
+def _is_needed(columns, increment_filter):
+    needed = columns >= 0
+    if increment_filter is not None:
+        needed[needed] = ~increment_filter[columns[needed]]
+    return needed
+
+
+def _component_values(components, key, attr='val'):
+    return np.array([cp.get_attr(key).get_attr(attr) for cp in components])
+
+
+def _connection_states(components):
+    states = []
+    for conns in [
+            [cp.inl[0] for cp in components],
+            [cp.outl[0] for cp in components]]:
+        state = {'conns': conns}
+        for var in ['m', 'p', 'h']:
+            state[var] = np.array([c.get_attr(var).val_SI for c in conns])
+            state[var + '_col'] = _columns([c.get_attr(var) for c in conns])
+        states += [state]
+    return states
+
+
+def _hydraulic_columns(i, o, components, elements):
+    return np.column_stack([
+        i['m_col'], i['p_col'], i['h_col'], o['p_col'], o['h_col']
+    ] + [
+        _columns([cp.get_attr(key) for cp in components]) for key in elements
+    ])
+
+
+def _viscosity(c, p, h):
+    return viscosity_mix_ph(p, h, c.fluid_data, c.mixing_rule, T0=c.T.val_SI)
+
+
+def _volume(c, p, h):
+    return v_mix_ph(p, h, c.fluid_data, c.mixing_rule, T0=c.T.val_SI)
+
+
+def _temperature(c, p, h):
+    return T_mix_ph(p, h, c.fluid_data, c.mixing_rule, T0=c.T.val_SI)
+
+
+def _connection_property(conns, func, indices, p_needed, h_needed, d=1e-1):
+    r"""
+    Evaluate a fluid property of connections and its partial derivatives.
+
+    The partial derivatives to pressure and enthalpy are calculated by central
+    differences, only where they are needed.
+
+    Returns
+    -------
+    value, dp, dh : tuple
+        Arrays of the property value and its partial derivatives for the
+        connections selected by :code:`indices`.
+    """
+    value = np.empty(len(indices))
+    dp = np.zeros(len(indices))
+    dh = np.zeros(len(indices))
+    for n, index in enumerate(indices):
+        c = conns[index]
+        p, h = c.p.val_SI, c.h.val_SI
+        value[n] = func(c, p, h)
+        if p_needed[index]:
+            dp[n] = (func(c, p + d, h) - func(c, p - d, h)) / (2 * d)
+        if h_needed[index]:
+            dh[n] = (func(c, p, h + d) - func(c, p, h - d)) / (2 * d)
+    return value, dp, dh
+
+
+def _central_differences(func, args, steps):
+    r"""Calculate the partial derivatives of a function on arrays."""
+    derivatives = []
+    for n, d in enumerate(steps):
+        upper = list(args)
+        upper[n] = args[n] + d
+        lower = list(args)
+        lower[n] = args[n] - d
+        derivatives += [(func(*upper) - func(*lower)) / (2 * d)]
+    return derivatives
+
+
+def _logarithmic_temperature_difference(ttd_1, ttd_2):
+    # same cases as the kA_group_func: mean difference for different signs
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = ttd_1 / ttd_2
+        return np.where(
+            ratio < 0, (ttd_1 + ttd_2) / 2,
+            np.where(ttd_1 != ttd_2, (ttd_1 - ttd_2) / np.log(ratio), ttd_2)
+        )
@@ -169,6 +169,10 @@ class Merge(NodeBase):
                 'num_eq': self.num_i + self.num_o - 1}
         }
 
+    def get_variable_aliases(self):
+        o = self.outl[0]
+        return {'pressure_constraints': [('p', i, o) for i in self.inl]}
+
     def inlets(self):
         if self.num_in.is_set:
             return ['in' + str(i + 1) for i in range(self.num_in.val)]
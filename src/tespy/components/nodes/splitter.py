@@ -142,6 +142,13 @@ class Splitter(NodeBase):
                 'num_eq': self.num_i + self.num_o - 1}
         }
 
+    def get_variable_aliases(self):
+        i = self.inl[0]
+        return {
+            'energy_balance_constraints': [('h', i, o) for o in self.outl],
+            'pressure_constraints': [('p', i, o) for o in self.outl]
+        }
+
     @staticmethod
     def inlets():
         return ['in1']
@@ -162,6 +162,13 @@ class Valve(Component):
                 'num_eq': 1}
         }
 
+    def get_variable_aliases(self):
+        i, o = self.inl[0], self.outl[0]
+        aliases = {'enthalpy_equality_constraints': [('h', i, o)]}
+        if self.pr.is_set and not self.pr.is_var and self.pr.val == 1:
+            aliases['pr'] = [('p', i, o)]
+        return aliases
+
     @staticmethod
     def inlets():
         return ['in1']
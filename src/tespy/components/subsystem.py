@@ -13,7 +13,24 @@ available from its original location tespy/components/subsystems.py
 SPDX-License-Identifier: MIT
 """
 
+import io
+
 from tespy.tools import logger
+from tespy.tools.fluid_properties.wrappers import FluidPropertyWrapper
+from tespy.tools.helpers import _SharedObjectPickler
+from tespy.tools.helpers import _SharedObjectUnpickler
+
+
+def _check_label(label):
+    if not isinstance(label, str):
+        msg = 'Subsystem label must be of type str!'
+        logger.error(msg)
+        raise ValueError(msg)
+
+    elif len([x for x in [';', ', ', '.'] if x in label]) > 0:
+        msg = 'Can\'t use ' + str([';', ', ', '.']) + ' in label.'
+        logger.error(msg)
+        raise ValueError(msg)
 
 
 class Subsystem:
@@ -39,18 +56,8 @@ class Subsystem:
     """
 
     def __init__(self, label):
-
-        if not isinstance(label, str):
-            msg = 'Subsystem label must be of type str!'
-            logger.error(msg)
-            raise ValueError(msg)
-
-        elif len([x for x in [';', ', ', '.'] if x in label]) > 0:
-            msg = 'Can\'t use ' + str([';', ', ', '.']) + ' in label.'
-            logger.error(msg)
-            raise ValueError(msg)
-        else:
-            self.label = label
+        _check_label(label)
+        self.label = label
 
         self.comps = {}
         self.conns = {}
@@ -85,3 +92,147 @@ class Subsystem:
     def create_conns(self):
         """Create the subsystem's connections."""
         return
+
+
+class SubsystemTemplate:
+    r"""
+    Template for creating many identical subsystems.
+
+    The template is a convenience factory: every instance is a copy of the
+    subsystem passed, relabeled with the label of the instance. Parameters
+    specified on the template's components and connections before the first
+    instantiation are applied to all instances. The fluid property wrappers of
+    the connections are shared by all instances.
+
+    Parameters
+    ----------
+    subsystem : tespy.components.subsystem.Subsystem
+        Subsystem to compile into a template. The labels of the components and
+        of the connections with an individual label must start with the label
+        of the subsystem.
+
+    Example
+    -------
+    Create 100 identical pipe sections from a template. The instances are
+    labeled by replacing the subsystem label at the beginning of the component
+    and connection labels.
+
+    >>> from tespy.components import Pipe, Subsystem, SubsystemTemplate
+    >>> from tespy.connections import Connection
+    >>> class PipeSection(Subsystem):
+    ...     def create_comps(self):
+    ...         self.comps['feed'] = Pipe(f'{self.label}_feed')
+    ...         self.comps['return'] = Pipe(f'{self.label}_return')
+    ...
+    ...     def create_conns(self):
+    ...         self.conns['loop'] = Connection(
+    ...             self.comps['feed'], 'out1', self.comps['return'], 'in1'
+    ...         )
+    >>> template = SubsystemTemplate(PipeSection('section'))
+    >>> template.comps['feed'].set_attr(pr=0.99, Q=0)
+    >>> sections = [template.instantiate(f'section {i}') for i in range(100)]
+    >>> sections[42].comps['feed'].label
+    'section 42_feed'
+    >>> sections[42].conns['loop'].label
+    'section 42_feed:out1_section 42_return:in1'
+    >>> sections[42].comps['feed'].pr.val
+    0.99
+    """
+
+    def __init__(self, subsystem):
+        self.label = subsystem.label
+        self.comps = subsystem.comps
+        self.conns = subsystem.conns
+        self._subsystem = subsystem
+        self._compiled = None
+        self._shared = None
+
+        for cp in self.comps.values():
+            if not cp.label.startswith(self.label):
+                msg = (
+                    f'The label of the component {cp.label} must start with '
+                    f'the label of the subsystem {self.label} to be used in '
+                    'a subsystem template.'
+                )
+                logger.error(msg)
+                raise ValueError(msg)
+
+        for c in self.conns.values():
+            if not (
+                    c.label.startswith(self.label)
+                    or c.label == _default_label(c)):
+                msg = (
+                    f'The label of the connection {c.label} must start with '
+                    f'the label of the subsystem {self.label} to be used in '
+                    'a subsystem template.'
+                )
+                logger.error(msg)
+                raise ValueError(msg)
+
+    def _shared_objects(self):
+        """Return the fluid property wrappers shared between the instances."""
+        shared = []
+        for c in self.conns.values():
+            shared += list(c.fluid.wrapper.values())
+
+        return [obj for obj in shared if isinstance(obj, FluidPropertyWrapper)]
+
+    def compile(self):
+        r"""
+        Compile the template's subsystem for the instantiation.
+
+        This is done on the first instantiation automatically. Compile the
+        template again, if the parameters of the template's components or
+        connections have been changed afterwards.
+        """
+        self._shared = {id(obj): obj for obj in self._shared_objects()}
+        buffer = io.BytesIO()
+        # the subsystem class may not be importable (e.g. defined locally),
+        # it is only referenced by the template
+        _SharedObjectPickler(buffer, self._shared).dump(
+            self._subsystem.__dict__
+        )
+        self._compiled = buffer.getvalue()
+
+    def instantiate(self, label):
+        r"""
+        Create a new subsystem from the template.
+
+        Parameters
+        ----------
+        label : str
+            The label of the new subsystem.
+
+        Returns
+        -------
+        subsystem : tespy.components.subsystem.Subsystem
+            New instance of the template's subsystem class.
+        """
+        _check_label(label)
+        if self._compiled is None:
+            self.compile()
+
+        cls = self._subsystem.__class__
+        subsystem = cls.__new__(cls)
+        subsystem.__dict__.update(_SharedObjectUnpickler(
+            io.BytesIO(self._compiled), self._shared
+        ).load())
+
+        default_labels = {
+            id(c) for c in subsystem.conns.values()
+            if c.label == _default_label(c)
+        }
+        subsystem.label = label
+        for cp in subsystem.comps.values():
+            cp.label = label + cp.label[len(self.label):]
+        for c in subsystem.conns.values():
+            if id(c) in default_labels:
+                c.label = _default_label(c)
+            else:
+                c.label = label + c.label[len(self.label):]
+
+        return subsystem
+
+
+def _default_label(c):
+    return f"{c.source.label}:{c.source_id}_{c.target.label}:{c.target_id}"
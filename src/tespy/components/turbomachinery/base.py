@@ -15,6 +15,7 @@ from tespy.components.component import Component
 from tespy.components.component import component_registry
 from tespy.tools.data_containers import ComponentProperties as dc_cp
 from tespy.tools.document_models import generate_latex_eq
+from tespy.tools.fluid_properties import isentropic_deriv
 
 
 @component_registry
@@ -161,6 +162,93 @@ class Turbomachine(Component):
         if self.P.is_var:
             self.jacobian[k, self.P.J_col] = -1
 
+    def calc_dh_deriv(self, increment_filter=None):
+        r"""
+        Calculate the enthalpy difference and its partial derivatives.
+
+        Parameters
+        ----------
+        increment_filter : ndarray
+            Matrix for filtering non-changing variables.
+
+        Returns
+        -------
+        dh : tuple
+            Enthalpy difference of outlet and inlet and dictionary of the
+            partial derivatives with the column of the variable in the Jacobian
+            matrix as key.
+        """
+        i = self.inl[0]
+        o = self.outl[0]
+        derivatives = {}
+        if self.is_variable(i.h, increment_filter):
+            derivatives[i.h.J_col] = -1
+        if self.is_variable(o.h, increment_filter):
+            derivatives[o.h.J_col] = 1
+        return o.h.val_SI - i.h.val_SI, derivatives
+
+    def calc_dh_s_deriv(self, increment_filter=None, T0=None):
+        r"""
+        Calculate the isentropic enthalpy difference and partial derivatives.
+
+        Parameters
+        ----------
+        increment_filter : ndarray
+            Matrix for filtering non-changing variables.
+
+        T0 : float
+            Starting value for temperature calculation of mixtures.
+
+        Returns
+        -------
+        dh_s : tuple
+            Isentropic enthalpy difference of outlet and inlet and dictionary
+            of the partial derivatives with the column of the variable in the
+            Jacobian matrix as key.
+
+        Note
+        ----
+        The partial derivatives of the isentropic outlet enthalpy are obtained
+        from :py:func:`tespy.tools.fluid_properties.functions.isentropic_deriv`.
+        """
+        i = self.inl[0]
+        o = self.outl[0]
+        h_s, dh_s_dp_i, dh_s_dh_i, dh_s_dp_o = isentropic_deriv(
+            i.p.val_SI, i.h.val_SI, o.p.val_SI, i.fluid_data, i.mixing_rule,
+            T0=T0
+        )
+        derivatives = {}
+        if self.is_variable(i.p, increment_filter):
+            derivatives[i.p.J_col] = dh_s_dp_i
+        if self.is_variable(i.h, increment_filter):
+            derivatives[i.h.J_col] = dh_s_dh_i - 1
+        if self.is_variable(o.p, increment_filter):
+            derivatives[o.p.J_col] = dh_s_dp_o
+        return h_s - i.h.val_SI, derivatives
+
+    def set_deriv(self, k, derivatives, variables, increment_filter=None):
+        r"""
+        Set the partial derivatives of an equation for a set of variables.
+
+        Parameters
+        ----------
+        k : int
+            Position of derivatives in Jacobian matrix (k-th equation).
+
+        derivatives : dict
+            Partial derivatives with the column of the variable in the
+            Jacobian matrix as key.
+
+        variables : list
+            Variables to set the partial derivatives for.
+
+        increment_filter : ndarray
+            Matrix for filtering non-changing variables.
+        """
+        for var in variables:
+            if self.is_variable(var, increment_filter):
+                self.jacobian[k, var.J_col] = derivatives.get(var.J_col, 0)
+
     def bus_func(self, bus):
         r"""
         Calculate the value of the bus function.
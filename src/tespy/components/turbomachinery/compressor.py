@@ -21,7 +21,10 @@ from tespy.tools.data_containers import ComponentCharacteristics as dc_cc
 from tespy.tools.data_containers import ComponentProperties as dc_cp
 from tespy.tools.data_containers import GroupedComponentProperties as dc_gcp
 from tespy.tools.document_models import generate_latex_eq
+from tespy.tools.fluid_properties import dT_mix_dph
+from tespy.tools.fluid_properties import dT_mix_pdh
 from tespy.tools.fluid_properties import isentropic
+from tespy.tools.helpers import combine_derivatives
 
 
 @component_registry
@@ -251,15 +254,12 @@ class Compressor(Turbomachine):
         """
         i = self.inl[0]
         o = self.outl[0]
-        f = self.eta_s_func
-        if self.is_variable(i.p, increment_filter):
-            self.jacobian[k, i.p.J_col] = self.numeric_deriv(f, 'p', i)
-        if self.is_variable(o.p, increment_filter):
-            self.jacobian[k, o.p.J_col] = self.numeric_deriv(f, 'p', o)
-        if self.is_variable(i.h, increment_filter):
-            self.jacobian[k, i.h.J_col] = self.numeric_deriv(f, 'h', i)
-        if self.is_variable(o.h, increment_filter):
-            self.jacobian[k, o.h.J_col] = self.eta_s.val
+        dh, dh_deriv = self.calc_dh_deriv(increment_filter)
+        dh_s, dh_s_deriv = self.calc_dh_s_deriv(increment_filter)
+        derivatives = combine_derivatives(
+            (self.eta_s.val, dh_deriv), (-1, dh_s_deriv)
+        )
+        self.set_deriv(k, derivatives, [i.p, o.p, i.h, o.h], increment_filter)
 
     def eta_s_char_func(self):
         r"""
@@ -332,19 +332,24 @@ class Compressor(Turbomachine):
         k : int
             Position of derivatives in Jacobian matrix (k-th equation).
         """
-        f = self.eta_s_char_func
         i = self.inl[0]
         o = self.outl[0]
-        if self.is_variable(i.m, increment_filter):
-            self.jacobian[k, i.m.J_col] = self.numeric_deriv(f, 'm', i)
-        if self.is_variable(i.p, increment_filter):
-            self.jacobian[k, i.p.J_col] = self.numeric_deriv(f, 'p', i)
-        if self.is_variable(i.h, increment_filter):
-            self.jacobian[k, i.h.J_col] = self.numeric_deriv(f, 'h', i)
-        if self.is_variable(o.p, increment_filter):
-            self.jacobian[k, o.p.J_col] = self.numeric_deriv(f, 'p', o)
-        if self.is_variable(o.h, increment_filter):
-            self.jacobian[k, o.h.J_col] = self.numeric_deriv(f, 'h', o)
+        expr, expr_deriv = self.get_char_expr_deriv(
+            self.eta_s_char.param, **self.eta_s_char.char_params,
+            increment_filter=increment_filter
+        )
+        char_func = self.eta_s_char.char_func
+        eta_s = self.eta_s.design * char_func.evaluate(expr)
+        deta_s = self.eta_s.design * char_func.derivative(expr)
+
+        dh, dh_deriv = self.calc_dh_deriv(increment_filter)
+        dh_s, dh_s_deriv = self.calc_dh_s_deriv(increment_filter)
+        derivatives = combine_derivatives(
+            (eta_s, dh_deriv), (-1, dh_s_deriv), (dh * deta_s, expr_deriv)
+        )
+        self.set_deriv(
+            k, derivatives, [i.m, i.p, i.h, o.p, o.h], increment_filter
+        )
 
     def char_map_pr_func(self):
         r"""
@@ -381,8 +386,8 @@ class Compressor(Turbomachine):
 
         yarr, zarr = self.char_map_pr.char_func.evaluate_x(x)
         # value manipulation with igva
-        yarr *= (1 - self.igva.val / 100)
-        zarr *= (1 - self.igva.val / 100)
+        yarr = yarr * (1 - self.igva.val / 100)
+        zarr = zarr * (1 - self.igva.val / 100)
         pr = self.char_map_pr.char_func.evaluate_y(y, yarr, zarr)
 
         return (o.p.val_SI / i.p.val_SI) - pr * self.pr.design
@@ -431,24 +436,23 @@ class Compressor(Turbomachine):
         k : int
             Position of derivatives in Jacobian matrix (k-th equation).
         """
-        f = self.char_map_pr_func
         i = self.inl[0]
         o = self.outl[0]
-        if self.is_variable(i.m, increment_filter):
-            self.jacobian[k, i.m.J_col] = self.numeric_deriv(f, 'm', i)
+        pr, pr_deriv = self.calc_char_map_deriv(
+            self.char_map_pr, 1 - self.igva.val / 100, -1 / 100,
+            increment_filter
+        )
+        derivatives = combine_derivatives((-self.pr.design, pr_deriv))
         if self.is_variable(i.p, increment_filter):
-            self.jacobian[k, i.p.J_col] = self.numeric_deriv(f, 'p', i)
-        if self.is_variable(i.h, increment_filter):
-            self.jacobian[k, i.h.J_col] = self.numeric_deriv(f, 'h', i)
+            derivatives[i.p.J_col] -= o.p.val_SI / i.p.val_SI ** 2
         if self.is_variable(o.p, increment_filter):
-            self.jacobian[k, o.p.J_col] = 1 / i.p.val_SI
-        if self.is_variable(o.h, increment_filter):
-            self.jacobian[k, o.h.J_col] = self.numeric_deriv(f, 'h', o)
+            derivatives[o.p.J_col] = 1 / i.p.val_SI
+        self.set_deriv(
+            k, derivatives, [i.m, i.p, i.h, o.p, o.h], increment_filter
+        )
 
         if self.igva.is_var:
-            self.jacobian[k, self.igva.J_col] = self.numeric_deriv(
-                f, 'igva', None
-            )
+            self.jacobian[k, self.igva.J_col] = derivatives[self.igva.J_col]
 
     def char_map_eta_s_func(self):
         r"""
@@ -484,8 +488,8 @@ class Compressor(Turbomachine):
 
         yarr, zarr = self.char_map_eta_s.char_func.evaluate_x(x)
         # value manipulation with igva
-        yarr *= (1 - self.igva.val / 100)
-        zarr *= (1 - self.igva.val ** 2 / 10000)
+        yarr = yarr * (1 - self.igva.val / 100)
+        zarr = zarr * (1 - self.igva.val ** 2 / 10000)
         eta = self.char_map_eta_s.char_func.evaluate_y(y, yarr, zarr)
 
         return (
@@ -545,24 +549,92 @@ class Compressor(Turbomachine):
         k : int
             Position of derivatives in Jacobian matrix (k-th equation).
         """
-        f = self.char_map_eta_s_func
         i = self.inl[0]
         o = self.outl[0]
+        eta_s, eta_s_deriv = self.calc_char_map_deriv(
+            self.char_map_eta_s, 1 - self.igva.val ** 2 / 10000,
+            -2 * self.igva.val / 10000, increment_filter
+        )
+        dh, dh_deriv = self.calc_dh_deriv(increment_filter)
+        dh_s, dh_s_deriv = self.calc_dh_s_deriv(increment_filter, i.T.val_SI)
+        derivatives = combine_derivatives(
+            (1 / dh, dh_s_deriv), (-dh_s / dh ** 2, dh_deriv),
+            (-self.eta_s.design, eta_s_deriv)
+        )
+        self.set_deriv(
+            k, derivatives, [i.m, i.p, i.h, o.p, o.h], increment_filter
+        )
+
+        if self.igva.is_var:
+            self.jacobian[k, self.igva.J_col] = derivatives[self.igva.J_col]
+
+    def calc_char_map_deriv(
+            self, char_map, z_factor, dz_factor_digva, increment_filter=None):
+        r"""
+        Evaluate a compressor map and calculate the partial derivatives.
+
+        Parameters
+        ----------
+        char_map : tespy.tools.data_containers.ComponentCharacteristicMaps
+            Characteristic map to evaluate.
+
+        z_factor : float
+            Factor for the output values of the map due to the igva.
+
+        dz_factor_digva : float
+            Derivative of the output factor with respect to the igva.
+
+        increment_filter : ndarray
+            Matrix for filtering non-changing variables.
+
+        Returns
+        -------
+        z : tuple
+            Map evaluation and dictionary of the partial derivatives with the
+            column of the variable in the Jacobian matrix as key.
+
+        Note
+        ----
+        The igva scales the map's second dimension input values with
+        :math:`1-\frac{igva}{100}`, thus the evaluation equals
+
+        .. math::
+
+            z = z_\mathrm{factor} \cdot f\left(X, \frac{Y}{1-
+            \frac{igva}{100}}\right)
+        """
+        i = self.inl[0]
+        T = i.calc_T()
+        x = np.sqrt(i.T.design / T)
+        y = (i.m.val_SI * i.p.design) / (i.m.design * i.p.val_SI * x)
+        y_factor = 1 - self.igva.val / 100
+
+        char_func = char_map.char_func
+        yarr, zarr = char_func.evaluate_x(x)
+        z = char_func.evaluate_y(y, yarr * y_factor, zarr)
+        dz_dx, dz_dy = char_func.gradient(x, y / y_factor)
+        dz_dy *= z_factor / y_factor
+        # y depends on x, too
+        dz_dx = z_factor * dz_dx - dz_dy * y / x
+        dz_dT = -dz_dx * x / (2 * T)
+
+        derivatives = {}
+        args = (i.p.val_SI, i.h.val_SI, i.fluid_data, i.mixing_rule, T)
         if self.is_variable(i.m, increment_filter):
-            self.jacobian[k, i.m.J_col] = self.numeric_deriv(f, 'm', i)
+            derivatives[i.m.J_col] = (
+                dz_dy * i.p.design / (i.m.design * i.p.val_SI * x)
+            )
         if self.is_variable(i.p, increment_filter):
-            self.jacobian[k, i.p.J_col] = self.numeric_deriv(f, 'p', i)
+            derivatives[i.p.J_col] = (
+                -dz_dy * y / i.p.val_SI + dz_dT * dT_mix_dph(*args)
+            )
         if self.is_variable(i.h, increment_filter):
-            self.jacobian[k, i.h.J_col] = self.numeric_deriv(f, 'h', i)
-        if self.is_variable(o.p, increment_filter):
-            self.jacobian[k, o.p.J_col] = self.numeric_deriv(f, 'p', o)
-        if self.is_variable(o.h, increment_filter):
-            self.jacobian[k, o.h.J_col] = self.numeric_deriv(f, 'h', o)
-
+            derivatives[i.h.J_col] = dz_dT * dT_mix_pdh(*args)
         if self.igva.is_var:
-            self.jacobian[k, self.igva.J_col] = self.numeric_deriv(
-                f, 'igva', None
+            derivatives[self.igva.J_col] = (
+                dz_factor_digva * z + dz_dy * y / (100 * y_factor)
             )
+        return z * z_factor, derivatives
 
     def convergence_check(self):
         r"""
@@ -674,7 +746,7 @@ class Compressor(Turbomachine):
                 y = (self.inl[0].m.val_SI * self.inl[0].p.design) / (
                     self.inl[0].m.design * self.inl[0].p.val_SI * x)
                 yarr = data.char_func.get_domain_errors_x(x, self.label)
-                yarr *= (1 - self.igva.val / 100)
+                yarr = yarr * (1 - self.igva.val / 100)
                 data.char_func.get_domain_errors_y(y, yarr, self.label)
 
     def exergy_balance(self, T0):
@@ -19,6 +19,7 @@ from tespy.tools.data_containers import ComponentCharacteristics as dc_cc
 from tespy.tools.data_containers import ComponentProperties as dc_cp
 from tespy.tools.document_models import generate_latex_eq
 from tespy.tools.fluid_properties import isentropic
+from tespy.tools.helpers import combine_derivatives
 
 
 @component_registry
@@ -250,15 +251,12 @@ class Pump(Turbomachine):
         """
         i = self.inl[0]
         o = self.outl[0]
-        f = self.eta_s_func
-        if self.is_variable(i.p, increment_filter):
-            self.jacobian[k, i.p.J_col] = self.numeric_deriv(f, 'p', i)
-        if self.is_variable(o.p, increment_filter):
-            self.jacobian[k, o.p.J_col] = self.numeric_deriv(f, 'p', o)
-        if self.is_variable(i.h, increment_filter):
-            self.jacobian[k, i.h.J_col] = self.numeric_deriv(f, 'h', i)
-        if self.is_variable(o.h, increment_filter):
-            self.jacobian[k, o.h.J_col] = self.eta_s.val
+        dh, dh_deriv = self.calc_dh_deriv(increment_filter)
+        dh_s, dh_s_deriv = self.calc_dh_s_deriv(increment_filter)
+        derivatives = combine_derivatives(
+            (self.eta_s.val, dh_deriv), (-1, dh_s_deriv)
+        )
+        self.set_deriv(k, derivatives, [i.p, o.p, i.h, o.h], increment_filter)
 
     def eta_s_char_func(self):
         r"""
@@ -331,19 +329,24 @@ class Pump(Turbomachine):
         k : int
             Position of derivatives in Jacobian matrix (k-th equation).
         """
-        f = self.eta_s_char_func
         i = self.inl[0]
         o = self.outl[0]
-        if self.is_variable(i.m, increment_filter):
-            self.jacobian[k, i.m.J_col] = self.numeric_deriv(f, 'm', i)
-        if self.is_variable(i.p, increment_filter):
-            self.jacobian[k, i.p.J_col] = self.numeric_deriv(f, 'p', i)
-        if self.is_variable(i.h, increment_filter):
-            self.jacobian[k, i.h.J_col] = self.numeric_deriv(f, 'h', i)
-        if self.is_variable(o.p, increment_filter):
-            self.jacobian[k, o.p.J_col] = self.numeric_deriv(f, 'p', o)
-        if self.is_variable(o.h, increment_filter):
-            self.jacobian[k, o.h.J_col] = self.numeric_deriv(f, 'h', o)
+        expr, expr_deriv = self.get_char_expr_deriv(
+            self.eta_s_char.param, **self.eta_s_char.char_params,
+            increment_filter=increment_filter
+        )
+        char_func = self.eta_s_char.char_func
+        eta_s = self.eta_s.design * char_func.evaluate(expr)
+        deta_s = self.eta_s.design * char_func.derivative(expr)
+
+        dh, dh_deriv = self.calc_dh_deriv(increment_filter)
+        dh_s, dh_s_deriv = self.calc_dh_s_deriv(increment_filter)
+        derivatives = combine_derivatives(
+            (eta_s, dh_deriv), (-1, dh_s_deriv), (dh * deta_s, expr_deriv)
+        )
+        self.set_deriv(
+            k, derivatives, [i.m, i.p, i.h, o.p, o.h], increment_filter
+        )
 
     def flow_char_func(self):
         r"""
@@ -394,17 +397,20 @@ class Pump(Turbomachine):
         k : int
             Position of derivatives in Jacobian matrix (k-th equation).
         """
-        f = self.flow_char_func
         i = self.inl[0]
         o = self.outl[0]
-        if self.is_variable(i.m, increment_filter):
-            self.jacobian[k, i.m.J_col] = self.numeric_deriv(f, 'm', i)
+        expr, expr_deriv = self.get_char_expr_deriv(
+            self.flow_char.param, **self.flow_char.char_params,
+            increment_filter=increment_filter
+        )
+        derivatives = combine_derivatives(
+            (-self.flow_char.char_func.derivative(expr), expr_deriv)
+        )
         if self.is_variable(i.p, increment_filter):
-            self.jacobian[k, i.p.J_col] = self.numeric_deriv(f, 'p', i)
-        if self.is_variable(i.h, increment_filter):
-            self.jacobian[k, i.h.J_col] = self.numeric_deriv(f, 'h', i)
+            derivatives[i.p.J_col] = derivatives.get(i.p.J_col, 0) - 1
         if self.is_variable(o.p, increment_filter):
-            self.jacobian[k, o.p.J_col] = self.numeric_deriv(f, 'p', o)
+            derivatives[o.p.J_col] = 1
+        self.set_deriv(k, derivatives, [i.m, i.p, i.h, o.p], increment_filter)
 
     def convergence_check(self):
         r"""
@@ -19,7 +19,10 @@ from tespy.tools.data_containers import ComponentCharacteristics as dc_cc
 from tespy.tools.data_containers import ComponentProperties as dc_cp
 from tespy.tools.data_containers import SimpleDataContainer as dc_simple
 from tespy.tools.document_models import generate_latex_eq
+from tespy.tools.fluid_properties import dv_mix_dph
+from tespy.tools.fluid_properties import dv_mix_pdh
 from tespy.tools.fluid_properties import isentropic
+from tespy.tools.helpers import combine_derivatives
 
 
 @component_registry
@@ -234,15 +237,13 @@ class Turbine(Turbomachine):
         k : int
             Position of derivatives in Jacobian matrix (k-th equation).
         """
-        f = self.eta_s_func
         i = self.inl[0]
         o = self.outl[0]
-        if self.is_variable(i.p, increment_filter):
-            self.jacobian[k, i.p.J_col] = self.numeric_deriv(f, "p", i)
-        if self.is_variable(o.p, increment_filter):
-            self.jacobian[k, o.p.J_col] = self.numeric_deriv(f, "p", o)
+        dh_s, dh_s_deriv = self.calc_dh_s_deriv(increment_filter, i.T.val_SI)
+        derivatives = combine_derivatives((self.eta_s.val, dh_s_deriv))
         if self.is_variable(i.h, increment_filter):
-            self.jacobian[k, i.h.J_col] = self.numeric_deriv(f, "h", i)
+            derivatives[i.h.J_col] += 1
+        self.set_deriv(k, derivatives, [i.p, o.p, i.h], increment_filter)
         if o.h.is_var and self.it == 0:
             self.jacobian[k, o.h.J_col] = -1
 
@@ -312,17 +313,41 @@ class Turbine(Turbomachine):
         k : int
             Position of derivatives in Jacobian matrix (k-th equation).
         """
-        f = self.cone_func
+        n = 1
         i = self.inl[0]
         o = self.outl[0]
         if i.m.is_var:
             self.jacobian[k, i.m.J_col] = -1
+
+        args = (i.p.val_SI, i.h.val_SI, i.fluid_data, i.mixing_rule)
+        vol = i.calc_vol(T0=i.T.val_SI)
+        pr = o.p.val_SI / i.p.val_SI
+        ratio = (
+            (1 - pr ** ((n + 1) / n))
+            / (1 - self.pr.design ** ((n + 1) / n))
+        )
+        cone = (
+            i.m.design * i.p.val_SI / i.p.design
+            * (i.p.design * i.vol.design / (i.p.val_SI * vol)) ** 0.5
+            * abs(ratio) ** 0.5
+        )
+        # derivative of the cone with respect to the pressure ratio
+        dcone_dpr = (
+            -cone / (2 * ratio) * (n + 1) / n * pr ** (1 / n)
+            / (1 - self.pr.design ** ((n + 1) / n))
+        )
         if self.is_variable(i.p, increment_filter):
-            self.jacobian[k, i.p.J_col] = self.numeric_deriv(f, 'p', i)
+            self.jacobian[k, i.p.J_col] = (
+                cone / (2 * i.p.val_SI)
+                - cone / (2 * vol) * dv_mix_dph(*args, T0=i.T.val_SI)
+                - dcone_dpr * pr / i.p.val_SI
+            )
         if self.is_variable(i.h, increment_filter):
-            self.jacobian[k, i.h.J_col] = self.numeric_deriv(f, 'h', i)
+            self.jacobian[k, i.h.J_col] = (
+                -cone / (2 * vol) * dv_mix_pdh(*args, T0=i.T.val_SI)
+            )
         if self.is_variable(o.p, increment_filter):
-            self.jacobian[k, o.p.J_col] = self.numeric_deriv(f, 'p', o)
+            self.jacobian[k, o.p.J_col] = dcone_dpr / i.p.val_SI
 
     def eta_s_char_func(self):
         r"""
@@ -398,19 +423,23 @@ class Turbine(Turbomachine):
         k : int
             Position of derivatives in Jacobian matrix (k-th equation).
         """
-        f = self.eta_s_char_func
         i = self.inl[0]
         o = self.outl[0]
-        if self.is_variable(i.m, increment_filter):
-            self.jacobian[k, i.m.J_col] = self.numeric_deriv(f, 'm', i)
-        if self.is_variable(i.p, increment_filter):
-            self.jacobian[k, i.p.J_col] = self.numeric_deriv(f, "p", i)
-        if self.is_variable(i.h, increment_filter):
-            self.jacobian[k, i.h.J_col] = self.numeric_deriv(f, "h", i)
-        if self.is_variable(o.p, increment_filter):
-            self.jacobian[k, o.p.J_col] = self.numeric_deriv(f, "p", o)
-        if self.is_variable(o.h, increment_filter):
-            self.jacobian[k, o.h.J_col] = self.numeric_deriv(f, "h", o)
+        expr, expr_deriv = self.get_char_expr_deriv(
+            self.eta_s_char.param, increment_filter=increment_filter
+        )
+        char_func = self.eta_s_char.char_func
+        eta_s = self.eta_s.design * char_func.evaluate(expr)
+        deta_s = self.eta_s.design * char_func.derivative(expr)
+
+        dh, dh_deriv = self.calc_dh_deriv(increment_filter)
+        dh_s, dh_s_deriv = self.calc_dh_s_deriv(increment_filter, i.T.val_SI)
+        derivatives = combine_derivatives(
+            (-1, dh_deriv), (eta_s, dh_s_deriv), (deta_s * dh_s, expr_deriv)
+        )
+        self.set_deriv(
+            k, derivatives, [i.m, i.p, i.h, o.p, o.h], increment_filter
+        )
 
     def convergence_check(self):
         r"""
@@ -420,10 +420,23 @@ class Bus:
         return {self.label: export}
 
     def solve(self):
+        self.evaluate_residuals()
+        for cp in self.comps.index:
+            cp.bus_deriv(self)
+
+    def evaluate_residuals(self):
+        """
+        Calculate the residual value of the bus equation only.
+
+        Returns
+        -------
+        residual : float
+            Residual value of the bus equation.
+        """
         self.residual = self.P.val
         for cp in self.comps.index:
             self.residual -= cp.calc_bus_value(self)
-            cp.bus_deriv(self)
+        return self.residual
 
     def clear_jacobian(self):
         for k in self.jacobian:
@@ -262,7 +262,7 @@ class Connection:
         # set default values for kwargs
         self.property_data = self.get_parameters()
         self.parameters = {
-            k: v for k, v in self.get_parameters().items()
+            k: v for k, v in self.property_data.items()
             if hasattr(v, "func") and v.func is not None
         }
         self.state = dc_simple()
@@ -569,6 +569,25 @@ class Connection:
             logger.error(msg)
             raise KeyError(msg)
 
+    def __getstate__(self):
+        r"""
+        Return a compact state of the connection for pickling.
+
+        The fluid data lookup is derived from the fluid wrappers and mass
+        fractions and the increment filter is a reference to the network's
+        solver state, therefore both are rebuilt instead of being pickled.
+        """
+        state = self.__dict__.copy()
+        state.pop("_increment_filter", None)
+        if "fluid_data" in state:
+            state["fluid_data"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if "fluid_data" in state:
+            self.build_fluid_data()
+
     def _serialize(self):
         export = {}
         export.update({"source": self.source.label})
@@ -621,6 +640,14 @@ class Connection:
 
         self.residual = np.zeros(self.num_eq)
         self.jacobian = {}
+        self._jacobian_slots = None
+        self._equation_plan = [
+            (k, data.func, data.deriv, data.func_params)
+            for k, data in (
+                (k, self.get_attr(parameter))
+                for k, parameter in self.equations.items()
+            )
+        ]
 
     def simplify_specifications(self):
         systemvar_specs = []
@@ -892,10 +919,22 @@ class Connection:
 
     def solve(self, increment_filter):
         self._increment_filter = increment_filter
-        for k, parameter in self.equations.items():
-            data = self.get_attr(parameter)
-            data.func(k, **data.func_params)
-            data.deriv(k, **data.func_params)
+        self.evaluate_residuals()
+        for k, _, deriv, kwargs in self._equation_plan:
+            deriv(k, **kwargs)
+
+    def evaluate_residuals(self):
+        """
+        Calculate the residual values of the connection's equations only.
+
+        Returns
+        -------
+        residual : ndarray
+            Residual values of the connection's equations.
+        """
+        for k, func, _, kwargs in self._equation_plan:
+            func(k, **kwargs)
+        return self.residual
 
     def calc_results(self):
         self.T.val_SI = self.calc_T()
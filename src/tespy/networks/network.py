@@ -13,9 +13,14 @@ available from its original location tespy/networks/networks.py
 
 SPDX-License-Identifier: MIT
 """
+import io
 import json
 import math
 import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
 from time import time
 
 import numpy as np
@@ -27,14 +32,21 @@ from tespy import connections as con
 from tespy.tools import fluid_properties as fp
 from tespy.tools import helpers as hlp
 from tespy.tools import logger
+from tespy.tools.characteristics import CharLine
+from tespy.tools.characteristics import CharMap
 from tespy.tools.data_containers import ComponentCharacteristicMaps as dc_cm
 from tespy.tools.data_containers import ComponentCharacteristics as dc_cc
 from tespy.tools.data_containers import ComponentProperties as dc_cp
 from tespy.tools.data_containers import FluidComposition as dc_flu
 from tespy.tools.data_containers import GroupedComponentCharacteristics as dc_gcc
 from tespy.tools.data_containers import GroupedComponentProperties as dc_gcp
+from tespy.tools.fluid_properties.wrappers import FluidPropertyWrapper
 from tespy.tools.global_vars import ERR
 from tespy.tools.global_vars import fluid_property_data as fpd
+from tespy.tools.graph import block_triangular_decomposition
+from tespy.tools.graph import maximum_matching
+from tespy.tools.helpers import _SharedObjectPickler
+from tespy.tools.helpers import _SharedObjectUnpickler
 
 # Only require cupy if Cuda shall be used
 try:
@@ -43,6 +55,42 @@ except ModuleNotFoundError:
     cu = None
 
 
+def _solve_subnetwork(payload):
+    """Solve an independent sub-network in a worker process."""
+    settings, conns, busses, udes, kwargs = payload
+    nw = Network(**settings)
+    nw.set_attr(iterinfo=False)
+    nw._partial_design_case = True
+    nw.add_conns(*conns)
+    nw.add_busses(*busses)
+    nw.add_ude(*udes)
+    # the connections share the variables of the topology reduction of the
+    # parent network, the worker network reduces its topology on its own
+    nw.reset_topology_reduction_specifications()
+    for c in conns:
+        c.good_starting_values = True
+        for key in ['m', 'p', 'h']:
+            data = c.get_attr(key)
+            data.val0 = hlp.convert_from_SI(key, data.val_SI, data.unit)
+
+    nw.solve(print_results=False, **kwargs)
+    return {
+        'converged': nw.converged,
+        'iterations': nw.iter + 1,
+        'residual': norm(nw.residual),
+        'conns': {
+            c.label: (
+                [c.m.val_SI, c.p.val_SI, c.h.val_SI], dict(c.fluid.val)
+            ) for c in conns
+        },
+        'comps': {
+            cp.label: {
+                name: container.val for container, name in cp.vars.items()
+            } for cp in nw.comps['object']
+        }
+    }
+
+
 class Network:
     r"""
     Class component is the base class of all TESPy components.
@@ -190,6 +238,19 @@ class Network:
         self.user_defined_eq = {}
         # bus dictionary
         self.busses = {}
+        # components and connections of the subsystems
+        self.subsystems = {}
+        # component equations evaluated by vectorized kernels
+        self.vectorize = False
+        self._component_kernels = []
+        # worker networks of a sub-network only hold a part of the design case
+        self._partial_design_case = False
+        # variables of the equations and values at their last evaluation
+        self._equation_dependencies = {}
+        self._equation_snapshots = {}
+        self.reuse_tolerance = None
+        # scaling of the Newton system
+        self.scaling = False
         # results and specification dictionary
         self.results = {}
         self.specifications = {}
@@ -207,6 +268,7 @@ class Network:
         self.checked = False
         self.design_path = None
         self.iterinfo = True
+        self.results_sink = None
 
         msg = 'Default unit specifications:\n'
         for prop, data in fpd.items():
@@ -346,6 +408,132 @@ class Network:
             logger.error(msg)
             raise KeyError(msg)
 
+    def __getstate__(self):
+        r"""
+        Return a compact state of the network for pickling.
+
+        The connection and component lookup tables only hold references to
+        the objects and are stored as plain lists. The dense jacobian and its
+        inverse are solver workspace and are not pickled. Components,
+        connections, fluid wrappers and characteristics are pickled once, all
+        references to them (e.g. in the branches) are kept identical after
+        unpickling.
+        """
+        state = self.__dict__.copy()
+        state["conns"] = self.conns["object"].tolist()
+        state["comps"] = self.comps["object"].tolist()
+        state.pop("jacobian", None)
+        state.pop("_jacobian_inverse", None)
+        # copies must not append their results to the sink of the network
+        state["results_sink"] = None
+        # keyed by object ids, which are not valid after unpickling
+        state.pop("_aliased_connections", None)
+        return state
+
+    def __setstate__(self, state):
+        conns = state.pop("conns")
+        comps = state.pop("comps")
+        self.__dict__.update(state)
+
+        dtypes = {
+            "object": object,
+            "source": object,
+            "source_id": str,
+            "target": object,
+            "target_id": str
+        }
+        self.conns = pd.DataFrame(
+            {
+                "object": conns,
+                "source": [c.source for c in conns],
+                "source_id": [c.source_id for c in conns],
+                "target": [c.target for c in conns],
+                "target_id": [c.target_id for c in conns]
+            },
+            columns=list(dtypes.keys()),
+            index=[c.label for c in conns]
+        ).astype(dtypes)
+        dtypes = {
+            "comp_type": str,
+            "object": object,
+        }
+        self.comps = pd.DataFrame(
+            {
+                "comp_type": [cp.__class__.__name__ for cp in comps],
+                "object": comps
+            },
+            columns=list(dtypes.keys()),
+            index=[cp.label for cp in comps]
+        ).astype(dtypes)
+
+        if "num_vars" in state:
+            self.jacobian = np.zeros((self.num_vars, self.num_vars))
+
+    def clone(self):
+        r"""
+        Create an independent copy of the network for scenario variation.
+
+        The components, connections, busses and their specifications and
+        variable values are copied, the copy keeps all labels and the
+        topology information (branches) of the network. Objects, which hold
+        no state of the individual network, are shared with the original
+        network: the fluid property wrappers and the data of the
+        characteristic lines and maps. The results sink is not copied, the
+        clone does not write results unless a new sink is assigned.
+
+        Returns
+        -------
+        nw : tespy.networks.network.Network
+            The cloned network.
+
+        Note
+        ----
+        The fluid property wrappers update their internal state (e.g. the
+        CoolProp AbstractState) on every call, therefore the clones and the
+        original network must not be solved in parallel threads. Use separate
+        processes instead.
+        """
+        shared = {id(obj): obj for obj in self._shared_objects()}
+        buffer = io.BytesIO()
+        try:
+            _SharedObjectPickler(buffer, shared).dump(self)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            # e.g. lambda functions in user defined equations
+            return deepcopy(self, shared.copy())
+        buffer.seek(0)
+        return _SharedObjectUnpickler(buffer, shared).load()
+
+    def _shared_objects(self):
+        """Return the objects shared between network clones."""
+        shared = []
+        for c in self.conns["object"]:
+            shared += list(c.fluid.wrapper.values())
+
+        chars = []
+        for cp in self.comps["object"]:
+            for data in cp.parameters.values():
+                if isinstance(data, (dc_cc, dc_cm)):
+                    chars += [data.char_func]
+
+        for b in self.busses.values():
+            chars += [b.char] + b.comps["char"].tolist()
+
+        for ude in self.user_defined_eq.values():
+            chars += list(ude.params.values())
+
+        for char in chars:
+            if isinstance(char, CharLine):
+                shared += [char.x, char.y]
+            elif isinstance(char, CharMap):
+                shared += [char.x, char.y, char.z]
+            else:
+                shared += [char]
+
+        return [
+            obj for obj in shared
+            if isinstance(obj, (np.ndarray, FluidPropertyWrapper))
+        ]
+
     def add_subsys(self, *args):
         r"""
         Add one or more subsystems to the network.
@@ -357,8 +545,11 @@ class Network:
             :code:`network.add_subsys(s1, s2, s3, ...)`.
         """
         for subsys in args:
-            for c in subsys.conns.values():
-                self.add_conns(c)
+            self.add_conns(*subsys.conns.values())
+            self.subsystems[subsys.label] = {
+                'comps': list(subsys.comps.values()),
+                'conns': list(subsys.conns.values())
+            }
 
     def get_conn(self, label):
         r"""
@@ -412,6 +603,7 @@ class Network:
             The connection to be added to the network, connections objects ci
             :code:`add_conns(c1, c2, c3, ...)`.
         """
+        labels = set()
         for c in args:
             if not isinstance(c, con.Connection):
                 msg = (
@@ -421,7 +613,7 @@ class Network:
                 logger.error(msg)
                 raise TypeError(msg)
 
-            elif c.label in self.conns.index:
+            elif c.label in self.conns.index or c.label in labels:
                 msg = (
                     'There is already a connection with the label '
                     f'{c.label}. The connection labels must be unique!'
@@ -429,18 +621,36 @@ class Network:
                 logger.error(msg)
                 raise ValueError(msg)
 
-            c.good_starting_values = False
+            labels.add(c.label)
 
-            self.conns.loc[c.label] = [
-                c, c.source, c.source_id, c.target, c.target_id
-            ]
+        # add all connections at once, row wise insertion into the DataFrame
+        # scales badly with the number of connections
+        conns = pd.DataFrame(
+            [[c, c.source, c.source_id, c.target, c.target_id] for c in args],
+            columns=self.conns.columns,
+            index=[c.label for c in args]
+        )
+        self.conns = self._append_rows(self.conns, conns)
 
+        for c in args:
+            c.good_starting_values = False
             msg = f'Added connection {c.label} to network.'
             logger.debug(msg)
+
+        if len(args) > 0:
             # set status "checked" to false, if connection is added to network.
             self.checked = False
         self._add_comps(*args)
 
+    @staticmethod
+    def _append_rows(df, rows):
+        """Append the rows to the DataFrame."""
+        if len(df) == 0:
+            return rows
+        elif len(rows) == 0:
+            return df
+        return pd.concat([df, rows])
+
     def del_conns(self, *args):
         """
         Remove one or more connections from the network.
@@ -520,6 +730,7 @@ class Network:
         # get unique components in new connections
         comps = list({cp for c in args for cp in [c.source, c.target]})
         # add to the dataframe of components
+        new_comps = []
         for comp in comps:
             if comp.label in self.comps.index:
                 if self.comps.loc[comp.label, 'object'] == comp:
@@ -537,9 +748,29 @@ class Network:
                     )
                     raise hlp.TESPyNetworkError(msg)
 
-            comp_type = comp.__class__.__name__
-            self.comps.loc[comp.label, 'comp_type'] = comp_type
-            self.comps.loc[comp.label, 'object'] = comp
+            new_comps += [comp]
+
+        labels = [comp.label for comp in new_comps]
+        if len(labels) != len(set(labels)):
+            duplicates = [
+                comp for comp in new_comps if labels.count(comp.label) > 1
+            ]
+            msg = (
+                f"The component with the label {duplicates[0].label} of type "
+                f"{duplicates[0].__class__.__name__} cannot be added to the "
+                "network as a different component of type "
+                f"{duplicates[1].__class__.__name__} with the same label is "
+                "added at the same time. All components must have unique "
+                "values!"
+            )
+            raise hlp.TESPyNetworkError(msg)
+
+        comps = pd.DataFrame(
+            [[comp.__class__.__name__, comp] for comp in new_comps],
+            columns=self.comps.columns,
+            index=labels
+        )
+        self.comps = self._append_rows(self.comps, comps)
 
     def _del_comps(self, comps):
         r"""
@@ -767,16 +998,17 @@ class Network:
 
     def init_components(self):
         r"""Set up necessary component information."""
+        inlets = {comp: [] for comp in self.comps["object"]}
+        outlets = {comp: [] for comp in self.comps["object"]}
+        for c in self.conns["object"]:
+            outlets[c.source] += [c]
+            inlets[c.target] += [c]
+
         for comp in self.comps["object"]:
-            # get incoming and outgoing connections of a component
-            sources = self.conns[self.conns['source'] == comp]
-            sources = sources['source_id'].sort_values().index.tolist()
-            targets = self.conns[self.conns['target'] == comp]
-            targets = targets['target_id'].sort_values().index.tolist()
             # save the incoming and outgoing as well as the number of
             # connections as component attribute
-            comp.inl = self.conns.loc[targets, 'object'].tolist()
-            comp.outl = self.conns.loc[sources, 'object'].tolist()
+            comp.inl = sorted(inlets[comp], key=lambda c: c.target_id)
+            comp.outl = sorted(outlets[comp], key=lambda c: c.source_id)
             comp.num_i = len(comp.inlets())
             comp.num_o = len(comp.outlets())
 
@@ -809,8 +1041,14 @@ class Network:
     def check_components(self):
         # count number of incoming and outgoing connections and compare to
         # expected values
+        num_source = {comp: 0 for comp in self.comps['object']}
+        num_target = num_source.copy()
+        for c in self.conns['object']:
+            num_source[c.source] += 1
+            num_target[c.target] += 1
+
         for comp in self.comps['object']:
-            counts = (self.conns[['source', 'target']] == comp).sum()
+            counts = {"source": num_source[comp], "target": num_target[comp]}
 
             if counts["source"] != comp.num_o:
                 msg = (
@@ -1121,15 +1359,115 @@ class Network:
                 }
                 self.num_conn_vars += 1
 
+    def presolve_alias_topology(self):
+        r"""
+        Map pressure and enthalpy variables equated by components.
+
+        Components provide their equations equating the pressure or enthalpy
+        of two connections (e.g. a :code:`Valve` or a :code:`Pipe` with
+        :code:`pr=1`), see
+        :py:meth:`tespy.components.component.Component.get_variable_aliases`.
+        The connections linked by these equations share a single data
+        container, thus a single variable, and the equations are removed from
+        the system. Groups of connections with more than one specified value
+        or with references within the group are not reduced.
+        """
+        parent = {}
+
+        def find(node):
+            while parent.setdefault(node, node) != node:
+                parent[node] = parent[parent[node]]
+                node = parent[node]
+            return node
+
+        equations = []
+        for cp in self.comps['object']:
+            cp._aliased_equations = set()
+            for key, pairs in cp.get_variable_aliases().items():
+                if len(pairs) == 0:
+                    continue
+                nodes = []
+                for variable, c1, c2 in pairs:
+                    node1, node2 = find((variable, c1)), find((variable, c2))
+                    parent[node1] = node2
+                    nodes += [(variable, c1)]
+                equations += [(cp, key, nodes)]
+
+        groups = {}
+        for node in list(parent):
+            groups.setdefault(find(node), []).append(node[1])
+
+        rejected = set()
+        for root, conns in groups.items():
+            variable = root[0]
+            num_specs = sum(
+                c.get_attr(variable).is_set or c.get_attr(variable)._solved
+                for c in conns
+            )
+            references = [
+                c.get_attr(f"{variable}_ref").ref.obj for c in conns
+                if c.get_attr(f"{variable}_ref").is_set
+            ]
+            if num_specs > 1 or any(ref in conns for ref in references):
+                rejected.add(root)
+
+        # all equations of a constraint must be eliminated together
+        reduced = False
+        while not reduced:
+            reduced = True
+            for _, _, nodes in equations:
+                roots = {find(node) for node in nodes}
+                if not roots.isdisjoint(rejected) and not roots <= rejected:
+                    rejected |= roots
+                    reduced = False
+
+        self._aliased_connections = {}
+        num_aliases = 0
+        for root, conns in groups.items():
+            if root in rejected:
+                continue
+            variable = root[0]
+            main_conn = conns[0]
+            for c in conns:
+                container = c.get_attr(variable)
+                if container.is_set or container._solved:
+                    main_conn = c
+            main = main_conn.get_attr(variable)
+            for c in conns:
+                if c is not main_conn:
+                    # keep starting values specified on other connections
+                    if np.isnan(main.val0):
+                        if not np.isnan(c.get_attr(variable).val0):
+                            setattr(main_conn, f"_{variable}_val0", main.val0)
+                        main.val0 = c.get_attr(variable).val0
+                    setattr(c, f"_{variable}_tmp", c.get_attr(variable))
+                    setattr(c, variable, main)
+                    num_aliases += 1
+            self._aliased_connections[id(main)] = conns
+
+        for cp, key, nodes in equations:
+            if find(nodes[0]) not in rejected:
+                cp._aliased_equations.add(key)
+
+        msg = (
+            f"Removing {num_aliases} pressure and enthalpy variables from "
+            "system variables."
+        )
+        logger.debug(msg)
+
     def reset_topology_reduction_specifications(self):
         for c in self.conns["object"]:
-            if hasattr(c, "_m_tmp"):
-                value = c.m.val_SI
-                unit = c.m.unit
-                c.m = c._m_tmp
-                c.m.val_SI = value
-                c.m.unit = unit
-                del c._m_tmp
+            for key in ["m", "p", "h"]:
+                if hasattr(c, f"_{key}_val0"):
+                    c.get_attr(key).val0 = c.get_attr(f"_{key}_val0")
+                    delattr(c, f"_{key}_val0")
+                if hasattr(c, f"_{key}_tmp"):
+                    value = c.get_attr(key).val_SI
+                    unit = c.get_attr(key).unit
+                    setattr(c, key, c.get_attr(f"_{key}_tmp"))
+                    c.get_attr(key).val_SI = value
+                    c.get_attr(key).unit = unit
+                    delattr(c, f"_{key}_tmp")
             if hasattr(c, "_fluid_tmp"):
                 val = c.fluid.val
                 c.fluid = c._fluid_tmp
@@ -1219,9 +1557,41 @@ class Network:
                     variable.is_var = False
                     # reset presolve flag
                     variable._solved = False
+                    # containers may be shared by aliased connections
+                    self._conn_variables += [variable]
             elif variable.is_set:
                 variable.is_var = False
 
+    def init_variables_and_equations(self):
+        r"""
+        Assign the variable space and preprocess connections and components.
+
+        This is done after the design or offdesign specifications have been
+        switched and the presolve has mapped the aliased variables.
+        """
+        self._conn_variables = []
+        for c in self.conns['object']:
+            self._assign_variable_space(c)
+            c.preprocess()
+
+        for cp in self.comps['object']:
+            # component initialisation
+            cp.preprocess(self.num_conn_vars + self.num_comp_vars)
+
+            ct = cp.__class__.__name__
+            for spec in self.specifications[ct].keys():
+                if len(cp.get_attr(self.specifications['lookup'][spec])) > 0:
+                    self.specifications[ct][spec].loc[cp.label] = (
+                        cp.get_attr(self.specifications['lookup'][spec]))
+
+            # count number of component equations and variables
+            i = self.num_conn_vars + self.num_comp_vars
+            for container, name in cp.vars.items():
+                self.variables_dict[i] = {"obj": container, "variable": name}
+                i += 1
+            self.num_comp_vars += cp.num_vars
+            self.num_comp_eq += cp.num_eq
+
     def init_design(self):
         r"""
         Initialise a design calculation.
@@ -1233,7 +1603,6 @@ class Network:
         unset, the offdesign values set.
         """
         # connections
-        self._conn_variables = []
         _local_designs = {}
         for c in self.conns['object']:
             # read design point information of connections with
@@ -1288,8 +1657,6 @@ class Network:
 
             if not c.fluid.is_var:
                 c.simplify_specifications()
-            self._assign_variable_space(c)
-            c.preprocess()
 
         # unset design values for busses, count bus equations and
         # reindex bus dictionary
@@ -1357,21 +1724,8 @@ class Network:
 
                 cp.set_parameters(self.mode, series)
 
-            # component initialisation
-            cp.preprocess(self.num_conn_vars + self.num_comp_vars)
-
-            for spec in self.specifications[c].keys():
-                if len(cp.get_attr(self.specifications['lookup'][spec])) > 0:
-                    self.specifications[c][spec].loc[cp.label] = (
-                        cp.get_attr(self.specifications['lookup'][spec]))
-
-            # count number of component equations and variables
-            i = self.num_conn_vars + self.num_comp_vars
-            for container, name in cp.vars.items():
-                self.variables_dict[i] = {"obj": container, "variable": name}
-                i += 1
-            self.num_comp_vars += cp.num_vars
-            self.num_comp_eq += cp.num_eq
+        self.presolve_alias_topology()
+        self.init_variables_and_equations()
 
     def init_offdesign_params(self):
         r"""
@@ -1407,8 +1761,9 @@ class Network:
             df.index = df.index.astype(str)
 
             # iter through all components of this type and set data
+            self._check_design_labels(df.index, self.comps.index, path)
             _individual_design_paths = {}
-            for c_label in df.index:
+            for c_label in df.index[df.index.isin(self.comps.index)]:
                 comp = self.comps.loc[c_label, 'object']
                 # read data of components with individual design_path
                 if comp.design_path is not None:
@@ -1443,7 +1798,10 @@ class Network:
             with open(path, "r", encoding="utf-8") as f:
                 bus_data = json.load(f)
 
+            self._check_design_labels(bus_data.keys(), self.busses, path)
             for b in bus_data:
+                if b not in self.busses:
+                    continue
                 for comp, value in bus_data[b].items():
                     comp = self.get_comp(comp)
                     self.busses[b].comps.loc[comp, "P_ref"] = float(value)
@@ -1473,6 +1831,35 @@ class Network:
         msg = 'Done reading design point information for connections.'
         logger.debug(msg)
 
+    def _check_design_labels(self, labels, network_labels, path):
+        r"""
+        Check the objects of a design case file are part of the network.
+
+        Parameters
+        ----------
+        labels : iterable
+            Labels of the objects in the design case file.
+
+        network_labels : iterable
+            Labels of the objects of the network.
+
+        path : str
+            Path to the design case file.
+        """
+        # the design case of a sub-network contains the other sub-networks
+        if self._partial_design_case:
+            return
+        missing = [label for label in labels if label not in network_labels]
+        if len(missing) > 0:
+            msg = (
+                f"The design case file {path} contains the objects "
+                f"{', '.join(missing)}, which are not part of the network. "
+                "Please make sure no components or busses have been removed "
+                "or relabeled for your offdesign calculation."
+            )
+            logger.error(msg)
+            raise hlp.TESPyNetworkError(msg)
+
     def init_comp_design_params(self, component, data):
         r"""
         Write design point information to components.
@@ -1581,7 +1968,6 @@ class Network:
         :code:`cp.offdesign` will be set instead. This does also affect
         referenced values!
         """
-        self._conn_variables = []
         for c in self.conns['object']:
             if not c.local_design:
                 # switch connections to offdesign mode
@@ -1602,8 +1988,6 @@ class Network:
 
             if not c.fluid.is_var:
                 c.simplify_specifications()
-            self._assign_variable_space(c)
-            c.preprocess()
 
         msg = 'Switched connections from design to offdesign.'
         logger.debug(msg)
@@ -1632,21 +2016,10 @@ class Network:
                     msg = f"{msg[:-2]} to design value at component {cp.label}."
                     logger.debug(msg)
 
-            # start component initialisation
-            cp.preprocess(self.num_conn_vars + self.num_comp_vars)
-            ct = cp.__class__.__name__
-            for spec in self.specifications[ct].keys():
-                if len(cp.get_attr(self.specifications['lookup'][spec])) > 0:
-                    self.specifications[ct][spec].loc[cp.label] = (
-                        cp.get_attr(self.specifications['lookup'][spec]))
-
-            i = self.num_conn_vars + self.num_comp_vars
-            for container, name in cp.vars.items():
-                self.variables_dict[i] = {"obj": container, "variable": name}
-                i += 1
             cp.new_design = False
-            self.num_comp_vars += cp.num_vars
-            self.num_comp_eq += cp.num_eq
+
+        self.presolve_alias_topology()
+        self.init_variables_and_equations()
 
         msg = 'Switched components from design to offdesign.'
         logger.debug(msg)
@@ -1687,7 +2060,10 @@ class Network:
                     'network.')
                 logger.warning(msg)
 
-            for key in ['m', 'p', 'h']:
+        # pressure values of all connections are required for the enthalpy
+        # starting values of connections sharing their enthalpy variable
+        for key in ['m', 'p', 'h']:
+            for c in self.conns['object']:
                 if c.get_attr(key).is_var:
                     if not c.good_starting_values:
                         self.init_val0(c, key)
@@ -1695,6 +2071,7 @@ class Network:
                         key, c.get_attr(key).val0, c.get_attr(key).unit
                     )
 
+        for c in self.conns['object']:
             self.init_count_connections_parameters(c)
 
         for c in self.conns['object']:
@@ -1807,22 +2184,26 @@ class Network:
 
             # generic starting values for pressure and enthalpy
             else:
-                # retrieve starting values from component information
-                val_s = c.source.initialise_source(c, key)
-                val_t = c.target.initialise_target(c, key)
-
-                if val_s == 0 and val_t == 0:
+                # retrieve starting values from component information of all
+                # connections sharing the variable
+                conns = self._aliased_connections.get(
+                    id(c.get_attr(key)), [c]
+                )
+                values = []
+                for conn in conns:
+                    values += [
+                        conn.source.initialise_source(conn, key),
+                        conn.target.initialise_target(conn, key)
+                    ]
+                values = [val for val in values if val != 0]
+
+                if len(values) == 0:
                     if key == 'p':
                         c.get_attr(key).val0 = 1e5
                     elif key == 'h':
                         c.get_attr(key).val0 = 1e6
-
-                elif val_s == 0:
-                    c.get_attr(key).val0 = val_t
-                elif val_t == 0:
-                    c.get_attr(key).val0 = val_s
                 else:
-                    c.get_attr(key).val0 = (val_s + val_t) / 2
+                    c.get_attr(key).val0 = sum(values) / len(values)
 
                 # change value according to specified unit system
                 c.get_attr(key).val0 = hlp.convert_from_SI(
@@ -1849,7 +2230,12 @@ class Network:
 
     def solve(self, mode, init_path=None, design_path=None,
               max_iter=50, min_iter=4, init_only=False, init_previous=True,
-              use_cuda=False, print_results=True, prepare_fast_lane=False):
+              use_cuda=False, print_results=True, prepare_fast_lane=False,
+              jacobian_method='analytic', jacobian_update='newton',
+              jacobian_reuse=3, line_search=False,
+              block_decomposition=False, split_subnetworks=False,
+              processes=None, linear_solver='dense', threads=None,
+              vectorize=False, reuse_tolerance=None, scaling=False):
         r"""
         Solve the network.
 
@@ -1893,6 +2279,110 @@ class Network:
             Use cuda instead of numpy for matrix inversion, default:
             :code:`False`.
 
+        jacobian_method : str
+            Method to calculate the Jacobian matrix, default:
+            :code:`'analytic'`.
+
+            - :code:`'analytic'`: Partial derivatives are calculated by the
+              derivative methods of the individual equations.
+            - :code:`'colored'`: The complete Jacobian matrix is calculated by
+              finite differences of the residual vector. Structurally
+              independent variables, which do not appear in a common equation,
+              are perturbed simultaneously (column coloring). The number of
+              residual evaluations per iteration is twice the number of colors.
+
+        jacobian_update : str
+            Strategy for updating the Jacobian matrix between iterations,
+            default: :code:`'newton'`.
+
+            - :code:`'newton'`: Calculate and invert the Jacobian matrix in
+              every iteration.
+            - :code:`'chord'`: Reuse the inverted Jacobian matrix for up to
+              :code:`jacobian_reuse` iterations, only the residual values are
+              calculated.
+            - :code:`'broyden'`: Like :code:`'chord'`, but the inverted
+              Jacobian matrix is improved by rank-one updates (Broyden's
+              method) from the change of variables and residual values.
+
+            A fresh Jacobian matrix is calculated in the same iteration, if
+            the residual norm has not been reduced by at least 10 % by the
+            previous increment.
+
+        jacobian_reuse : int
+            Maximum number of iterations a Jacobian matrix is reused with the
+            :code:`'chord'` and :code:`'broyden'` strategies, default: 3.
+
+        line_search : boolean
+            Apply a backtracking line search on the Newton increment, default:
+            :code:`False`. The increment is halved (up to four times) until
+            the residual norm decreases sufficiently. The residual values are
+            calculated without derivatives. The calculation is stopped, if no
+            decrease is found in three consecutive iterations.
+
+        block_decomposition : boolean
+            Decompose the equation system into irreducible blocks (block
+            triangular form) and solve the blocks sequentially, each with its
+            own Newton iteration, default: :code:`False`. The convergence of
+            the individual blocks is reported in the :code:`block_convergence`
+            attribute of the network. If a block does not converge, the
+            complete system is solved starting from the initial values.
+
+        split_subnetworks : boolean
+            Solve the independent sub-networks of the network separately,
+            default: :code:`False`. Sub-networks do not share any variables,
+            i.e. they are not connected by components, referenced connection
+            properties, busses with specified value or user defined equations.
+            The convergence of the sub-networks is reported in the
+            :code:`subnetwork_convergence` attribute of the network. If a
+            sub-network does not converge, the complete system is solved
+            starting from the initial values.
+
+        processes : int
+            Number of worker processes for solving the sub-networks in
+            parallel, default: :code:`None`. If not specified, the
+            sub-networks are solved one after another in the current process.
+
+        linear_solver : str
+            Method to solve the linear system of every Newton iteration,
+            default: :code:`'dense'`. With :code:`'schur'` the equations and
+            variables of the subsystems added to the network are eliminated
+            block by block and the Schur complement on the remaining interface
+            variables is solved, see :code:`solve_schur_complement`. This
+            requires :code:`jacobian_update='newton'`.
+
+        threads : int
+            Number of threads for the elimination of the subsystem blocks with
+            :code:`linear_solver='schur'`, default: :code:`None`.
+
+        vectorize : boolean
+            Evaluate the equations of components providing vectorized kernels
+            (e.g. the energy balance and the pressure drop equations of
+            :code:`Pipe` and :code:`SimpleHeatExchanger`) for all instances
+            of a class at once on arrays, default: :code:`False`. See
+            :code:`Component.get_vectorized_equations`.
+
+        reuse_tolerance : float
+            Reuse the residual values and partial derivatives of components
+            and connections, if the relative change of all variables their
+            equations depend on is below this tolerance since their last
+            evaluation, default: :code:`None` (evaluate all equations in every
+            iteration). The number of reused evaluations is available in the
+            :code:`num_reused_evaluations` attribute.
+
+        scaling : boolean
+            Equilibrate the Newton system, default: :code:`False`. The columns
+            of the Jacobian matrix are scaled by the nominal values of the
+            variables at the start of the iteration (e.g. from the design case
+            or the starting values), the rows by the largest scaled partial
+            derivative of each equation. The dense linear system is solved in
+            scaled form and the calculation is converged, if the norm of the
+            scaled residual vector is below :code:`ERR` in addition to the
+            convergence criterion of the unscaled residual vector. The row
+            scales of the energy balances are of magnitude 1e6, the scaled
+            criterion alone would therefore be looser for these equations. The
+            scaled residual norms are available in the
+            :code:`scaled_residual_history` attribute.
+
         Note
         ----
         For more information on the solution process have a look at the online
@@ -1938,6 +2428,52 @@ class Network:
         else:
             self.mode = mode
 
+        if jacobian_method not in ['analytic', 'colored']:
+            msg = 'The jacobian_method must be "analytic" or "colored".'
+            logger.error(msg)
+            raise ValueError(msg)
+        self.jacobian_method = jacobian_method
+
+        if jacobian_update not in ['newton', 'chord', 'broyden']:
+            msg = (
+                'The jacobian_update must be "newton", "chord" or "broyden".'
+            )
+            logger.error(msg)
+            raise ValueError(msg)
+        if not isinstance(jacobian_reuse, int) or jacobian_reuse < 1:
+            msg = 'The jacobian_reuse must be a positive integer.'
+            logger.error(msg)
+            raise ValueError(msg)
+        self.jacobian_update = jacobian_update
+        self.jacobian_reuse = jacobian_reuse
+        self.line_search = line_search
+        self.scaling = scaling
+
+        if processes is not None and (
+                not isinstance(processes, int) or processes < 1):
+            msg = 'The number of processes must be a positive integer.'
+            logger.error(msg)
+            raise ValueError(msg)
+
+        if linear_solver not in ['dense', 'schur']:
+            msg = 'The linear_solver must be "dense" or "schur".'
+            logger.error(msg)
+            raise ValueError(msg)
+        if linear_solver == 'schur' and jacobian_update != 'newton':
+            msg = (
+                'The linear_solver "schur" does not invert the Jacobian '
+                'matrix and requires the jacobian_update "newton".'
+            )
+            logger.error(msg)
+            raise ValueError(msg)
+        if threads is not None and (
+                not isinstance(threads, int) or threads < 1):
+            msg = 'The number of threads must be a positive integer.'
+            logger.error(msg)
+            raise ValueError(msg)
+        self.linear_solver = linear_solver
+        self.threads = threads
+
         if not self.checked:
             self.check_network()
 
@@ -1960,21 +2496,41 @@ class Network:
         )
         logger.debug(msg)
 
-        self.initialise()
+        # the topology reduction is only kept after a calculation for the
+        # fast lane, the connections must not keep sharing variables otherwise
+        reset_topology = True
+        try:
+            self.initialise()
 
-        if init_only:
-            self.reset_topology_reduction_specifications()
-            return
+            if init_only:
+                return
 
-        msg = 'Starting solver.'
-        logger.info(msg)
+            msg = 'Starting solver.'
+            logger.info(msg)
+
+            self.solve_determination()
+            self.vectorize = vectorize
+            self._component_kernels = (
+                self._get_component_kernels() if vectorize else []
+            )
+            self.reuse_tolerance = reuse_tolerance
+            self._equation_dependencies = (
+                {} if reuse_tolerance is None
+                else self._get_equation_dependencies()
+            )
 
-        self.solve_determination()
+            if block_decomposition:
+                self.solve_blocks()
+            elif split_subnetworks and len(self.subnetworks) > 1:
+                self.solve_subnetworks(processes)
 
-        self.solve_loop(print_results=print_results)
+            if not self.converged:
+                self.solve_loop(print_results=print_results)
 
-        if not prepare_fast_lane:
-            self.reset_topology_reduction_specifications()
+            reset_topology = not prepare_fast_lane
+        finally:
+            if reset_topology:
+                self.reset_topology_reduction_specifications()
 
         if self.lin_dep:
             msg = (
@@ -1990,9 +2546,11 @@ class Network:
                 'zero) starting value.'
             )
             logger.error(msg)
+            self.write_results_sink()
             return
 
         self.postprocessing()
+        self.write_results_sink()
 
         if not self.progress:
             msg = (
@@ -2009,65 +2567,430 @@ class Network:
         logger.info(msg)
         return
 
-    def solve_loop(self, print_results=True):
-        r"""Loop of the newton algorithm."""
-        # parameter definitions
-        self.residual_history = np.array([])
-        self.residual = np.zeros([self.num_vars])
-        self.increment = np.ones([self.num_vars])
-        self.jacobian = np.zeros((self.num_vars, self.num_vars))
+    def solve_batch(self, mode, scenarios, init_path=None, design_path=None,
+                    max_iter=50, min_iter=4, init_previous=True,
+                    vectorize=False):
+        r"""
+        Solve many scenarios of the network in lockstep.
 
-        self.start_time = time()
-        self.progress = True
+        The network is solved once with its current specifications. Starting
+        from this solution, the scenarios are solved by a common Newton
+        iteration: The variables of all scenarios are held in one array, the
+        linear systems of all scenarios are solved with a single batched
+        LAPACK call and converged scenarios are masked out of the iteration.
+        The network is set up only once, therefore all scenarios must keep the
+        structure of the equation system, i.e. only values of parameters
+        already specified in the network may be changed.
 
-        if self.iterinfo:
-            self.iterinfo_head(print_results)
+        Parameters
+        ----------
+        mode : str
+            Choose from 'design' and 'offdesign'.
 
-        for self.iter in range(self.max_iter):
-            self.increment_filter = np.absolute(self.increment) < ERR ** 2
-            self.solve_control()
-            self.residual_history = np.append(
-                self.residual_history, norm(self.residual)
-            )
+        scenarios : list
+            Dictionaries mapping connections and components to dictionaries of
+            parameter values, e.g.
+            :code:`{c1: {'T': 50}, pump: {'eta_s': 0.8}}`. Values of
+            connection parameters are specified in the network's units,
+            parameters not specified in a scenario keep the value of the
+            network.
 
-            if self.iterinfo:
-                self.iterinfo_body(print_results)
+        init_path : str
+            Path to the folder, where your network was saved to, e.g. saving
+            to :code:`nw.save('myplant/tests')` would require loading from
+            :code:`init_path='myplant/tests'`.
 
-            if (
-                    (self.iter >= self.min_iter - 1
-                     and (self.residual_history[-2:] < ERR ** 0.5).all())
-                    or self.lin_dep
-                ):
-                self.converged = not self.lin_dep
-                break
+        design_path : str
+            Path to the folder, where your network's design case was saved to,
+            e.g. saving to :code:`nw.save('myplant/tests')` would require
+            loading from :code:`design_path='myplant/tests'`.
 
-            if self.iter > 40:
-                if (
-                    all(
-                        self.residual_history[(self.iter - 3):] >= self.residual_history[-3] * 0.95
-                    ) and self.residual_history[-1] >= self.residual_history[-2] * 0.95
-                ):
-                    self.progress = False
-                    break
+        max_iter : int
+            Maximum number of iterations before calculation stops, default: 50.
 
-        self.end_time = time()
+        min_iter : int
+            Minimum number of iterations before calculation stops, default: 4.
 
-        if self.iterinfo:
-            self.iterinfo_tail(print_results)
+        init_previous : boolean
+            Initialise the calculation with values from the previous
+            calculation, default: :code:`True`.
 
-        if self.iter == self.max_iter - 1:
-            msg = (
-                f"Reached maximum iteration count ({self.max_iter})), "
-                "calculation stopped. Residual value is "
-                "{:.2e}".format(norm(self.residual))
-            )
-            logger.warning(msg)
+        vectorize : boolean
+            Evaluate the equations of components providing vectorized kernels
+            on arrays, default: :code:`False`, see :code:`Network.solve`.
 
-        return
+        Returns
+        -------
+        results : pandas.core.frame.DataFrame
+            Mass flow, pressure, enthalpy and temperature of all connections
+            in the network's units for each scenario, :code:`NaN` for
+            scenarios without convergence. The convergence information is
+            available in the :code:`batch_convergence` attribute.
 
-    def solve_determination(self):
-        r"""Check, if the number of supplied parameters is sufficient."""
-        # number of user defined functions
+        Note
+        ----
+        The equations are evaluated scenario by scenario. As in
+        :code:`solve_loop`, the partial derivatives to variables with a
+        negligible increment in the previous iteration of a scenario are not
+        recalculated. After the batch calculation the network holds the
+        results of its own specifications.
+
+        Example
+        -------
+        >>> from tespy.components import Sink, Source, Pipe
+        >>> from tespy.connections import Connection
+        >>> from tespy.networks import Network
+        >>> nw = Network(p_unit='bar', T_unit='C', iterinfo=False)
+        >>> so = Source('source')
+        >>> si = Sink('sink')
+        >>> pipe = Pipe('pipe', pr=0.95, Q=-1e5)
+        >>> inflow = Connection(so, 'out1', pipe, 'in1', label='inflow')
+        >>> outflow = Connection(pipe, 'out1', si, 'in1', label='outflow')
+        >>> nw.add_conns(inflow, outflow)
+        >>> inflow.set_attr(fluid={'water': 1}, m=1, p=10, T=90)
+        >>> scenarios = [
+        ...     {pipe: {'Q': Q}, inflow: {'T': 80}} for Q in [-1e5, -2e5]
+        ... ]
+        >>> results = nw.solve_batch('design', scenarios)
+        >>> bool(nw.batch_convergence['converged'].all())
+        True
+        >>> [round(T, 1) for T in results[('outflow', 'T')]]
+        [56.1, 32.2]
+        >>> round(outflow.T.val, 1)
+        66.2
+        """
+        self.solve(
+            mode, init_path=init_path, design_path=design_path,
+            max_iter=max_iter, min_iter=min_iter, init_previous=init_previous,
+            print_results=False, prepare_fast_lane=True, vectorize=vectorize
+        )
+        # the network keeps the topology reduction of the fast lane for the
+        # batch calculation
+        try:
+            if self.lin_dep:
+                msg = (
+                    'The network must be solvable with its own specifications '
+                    'for the batch calculation.'
+                )
+                logger.error(msg)
+                raise hlp.TESPyNetworkError(msg)
+
+            parameters = self._get_batch_parameters(scenarios)
+            base = np.array([
+                data.val_SI if isinstance(obj, con.Connection) else data.val
+                for obj, _, data in parameters
+            ])
+            values = np.tile(base, (len(scenarios), 1))
+            for row, scenario in enumerate(scenarios):
+                for col, (obj, key, data) in enumerate(parameters):
+                    if key in scenario.get(obj, {}):
+                        value = scenario[obj][key]
+                        if isinstance(obj, con.Connection):
+                            value = hlp.convert_to_SI(key, value, data.unit)
+                        values[row, col] = value
+
+            variables = self.get_variable_vector()
+            states = np.tile(variables, (len(scenarios), 1))
+            residual_norms = np.full((len(scenarios), 2), np.inf)
+            iterations = np.zeros(len(scenarios), dtype=int)
+            converged = np.zeros(len(scenarios), dtype=bool)
+            # limit the memory of the batched Jacobian matrices to about 256 MB
+            chunk = max(1, 2 ** 25 // max(self.num_vars, 1) ** 2)
+            num_chunks = math.ceil(len(scenarios) / chunk)
+            for batch in np.array_split(np.arange(len(scenarios)), num_chunks):
+                self._solve_batch_chunk(
+                    parameters, values, states, batch, max_iter, min_iter,
+                    residual_norms, iterations, converged
+                )
+
+            self.batch_convergence = pd.DataFrame({
+                'converged': converged, 'iterations': iterations,
+                'residual': residual_norms[:, 1]
+            })
+            self.batch_convergence.index.name = 'scenario'
+            msg = (
+                f'Batch calculation of {len(scenarios)} scenarios: '
+                f'{converged.sum()} converged.'
+            )
+            logger.info(msg)
+
+            properties = ['m', 'p', 'h', 'T']
+            results = np.full(
+                (len(scenarios), len(self.conns) * len(properties)), np.nan
+            )
+            for scenario in np.flatnonzero(converged):
+                self._set_batch_state(
+                    parameters, values[scenario], states[scenario]
+                )
+                for c in self.conns['object']:
+                    c.calc_results()
+                results[scenario] = [
+                    c.get_attr(prop).val for c in self.conns['object']
+                    for prop in properties
+                ]
+
+            self._set_batch_state(parameters, base, variables)
+        finally:
+            self.reset_topology_reduction_specifications()
+        self.process_connections()
+
+        return pd.DataFrame(
+            results,
+            columns=pd.MultiIndex.from_product([self.conns.index, properties])
+        )
+
+    def _get_batch_parameters(self, scenarios):
+        parameters = {}
+        for scenario in scenarios:
+            for obj, specifications in scenario.items():
+                for key in specifications:
+                    if (obj, key) in parameters:
+                        continue
+                    if isinstance(obj, con.Connection):
+                        valid = (
+                            key in ['m', 'p', 'h', 'T', 'x', 'v', 'Td_bp']
+                            and obj.get_attr(key).is_set
+                        )
+                    elif obj.__class__.__name__ in self.specifications:
+                        valid = (
+                            isinstance(obj.parameters.get(key), dc_cp)
+                            and obj.get_attr(key).is_set
+                            and key not in obj._aliased_equations
+                        )
+                    else:
+                        msg = (
+                            'The scenarios may only specify parameters of '
+                            'connections and components.'
+                        )
+                        logger.error(msg)
+                        raise TypeError(msg)
+
+                    if not valid:
+                        msg = (
+                            f'The parameter {key} of {obj.label} must be '
+                            'specified in the network to change its value in '
+                            'the scenarios.'
+                        )
+                        logger.error(msg)
+                        raise ValueError(msg)
+                    parameters[(obj, key)] = obj.get_attr(key)
+
+        return [(obj, key, data) for (obj, key), data in parameters.items()]
+
+    def _set_batch_state(self, parameters, values, variables,
+                         check_bounds=False):
+        conns = []
+        for (obj, key, data), value in zip(parameters, values):
+            if isinstance(obj, con.Connection):
+                data.val_SI = value
+                conns += [obj]
+            else:
+                data.val = value
+
+        self.set_variable_vector(variables)
+        # specified values, which have been used in the presolve
+        for c in dict.fromkeys(conns):
+            c.simplify_specifications()
+        if check_bounds:
+            self.check_variable_bounds()
+
+    def _update_variable_array(self, variables, increment):
+        columns = {}
+        limits = {}
+        for col, data in self.variables_dict.items():
+            kind = data['variable']
+            if kind not in ['m', 'p', 'h', 'fluid']:
+                kind = 'component'
+                limits[col] = (data['obj'].min_val, data['obj'].max_val)
+            columns.setdefault(kind, []).append(col)
+
+        variables = variables + increment
+        p = columns.get('p', [])
+        if len(p) > 0:
+            # pressure is relaxed like in update_variables
+            relax = np.maximum(
+                1, -2 * increment[:, p] / (variables[:, p] - increment[:, p])
+            )
+            variables[:, p] -= increment[:, p] * (1 - 1 / relax)
+
+        fluid = columns.get('fluid', [])
+        if len(fluid) > 0:
+            fractions = variables[:, fluid]
+            fractions[fractions < ERR] = 0
+            fractions[fractions > 1 - ERR] = 1
+            variables[:, fluid] = fractions
+
+        component = columns.get('component', [])
+        if len(component) > 0:
+            lower, upper = np.array([limits[col] for col in component]).T
+            variables[:, component] = np.clip(
+                variables[:, component], lower, upper
+            )
+
+        return variables
+
+    def _solve_batch_chunk(self, parameters, values, states, batch,
+                           max_iter, min_iter, residual_norms, iterations,
+                           converged):
+        r"""
+        Solve a chunk of scenarios of a batch calculation in lockstep.
+
+        The Jacobian matrices and the increments of the scenarios are kept
+        over the iterations, thus the partial derivatives of non-changing
+        variables are not recalculated, as in :code:`solve_loop`.
+        """
+        residual = np.zeros((len(batch), self.num_vars))
+        jacobian = np.zeros((len(batch), self.num_vars, self.num_vars))
+        increment = np.ones((len(batch), self.num_vars))
+        active = np.ones(len(batch), dtype=bool)
+
+        for self.iter in range(max_iter):
+            rows = np.flatnonzero(active)
+            if len(rows) == 0:
+                break
+            for row in rows:
+                scenario = batch[row]
+                self._set_batch_state(
+                    parameters, values[scenario], states[scenario],
+                    check_bounds=self.iter > 0
+                )
+                states[scenario] = self.get_variable_vector()
+                self.increment_filter = (
+                    np.absolute(increment[row]) < ERR ** 2
+                )
+                self.residual = residual[row]
+                self.jacobian = jacobian[row]
+                self.solve_components()
+                self.solve_busses()
+                self.solve_connections()
+                self.solve_user_defined_eq()
+
+            scenarios = batch[rows]
+            residual_norms[scenarios, 0] = residual_norms[scenarios, 1]
+            residual_norms[scenarios, 1] = norm(residual[rows], axis=1)
+            iterations[scenarios] = self.iter + 1
+            done = (
+                (residual_norms[scenarios] < ERR ** 0.5).all(axis=1)
+                & (self.iter >= min_iter - 1)
+            )
+            converged[scenarios[done]] = True
+            active[rows[done]] = False
+
+            rows = rows[~done]
+            try:
+                increment[rows] = np.linalg.solve(
+                    jacobian[rows], -residual[rows][..., np.newaxis]
+                )[..., 0]
+            except np.linalg.LinAlgError:
+                # solve the systems individually to find the singular ones
+                for row in rows:
+                    try:
+                        increment[row] = np.linalg.solve(
+                            jacobian[row], -residual[row]
+                        )
+                    except np.linalg.LinAlgError:
+                        increment[row] = 0
+                        active[row] = False
+            states[batch[rows]] = self._update_variable_array(
+                states[batch[rows]], increment[rows]
+            )
+
+    def solve_loop(self, print_results=True):
+        r"""Loop of the newton algorithm."""
+        # parameter definitions
+        self.residual_history = np.array([])
+        self.residual = np.zeros([self.num_vars])
+        self.increment = np.ones([self.num_vars])
+        self.jacobian = np.zeros((self.num_vars, self.num_vars))
+
+        if self.jacobian_method == 'colored':
+            self.build_jacobian_coloring()
+
+        self._jacobian_inverse = None
+        self._schur_partition = None
+        self._jacobian_age = 0
+        self.num_jacobian_evaluations = 0
+        self.num_reused_evaluations = 0
+        self._equation_snapshots = {}
+        self._line_search_failures = 0
+        self._line_search_steps = []
+
+        if self.scaling:
+            self.scaled_residual_history = np.array([])
+            self._column_scale = np.maximum(
+                np.abs(self.get_variable_vector()), 1
+            )
+            self._row_scale = np.ones(self.num_vars)
+
+        self.start_time = time()
+        self.progress = True
+
+        if self.iterinfo:
+            self.iterinfo_head(print_results)
+
+        for self.iter in range(self.max_iter):
+            self.increment_filter = np.absolute(self.increment) < ERR ** 2
+            self.solve_control()
+            self.residual_history = np.append(
+                self.residual_history, norm(self.residual)
+            )
+            converged = self.residual_history[-2:] < ERR ** 0.5
+            if self.scaling:
+                self.scaled_residual_history = np.append(
+                    self.scaled_residual_history,
+                    norm(self.residual / self._row_scale)
+                )
+                # the row scales of the energy balances are of magnitude 1e6,
+                # the unscaled tolerance must be met as well
+                converged &= self.scaled_residual_history[-2:] < ERR
+
+            if self.iterinfo:
+                self.iterinfo_body(print_results)
+
+            if (
+                    (self.iter >= self.min_iter - 1
+                     and converged.all())
+                    or self.lin_dep
+                ):
+                self.converged = not self.lin_dep
+                break
+
+            if self._line_search_failures >= 3:
+                msg = (
+                    'The line search did not find a decrease of the residual '
+                    'in three consecutive iterations.'
+                )
+                logger.debug(msg)
+                self.progress = False
+                break
+
+            if self.iter > 40:
+                if (
+                    all(
+                        self.residual_history[(self.iter - 3):] >= self.residual_history[-3] * 0.95
+                    ) and self.residual_history[-1] >= self.residual_history[-2] * 0.95
+                ):
+                    self.progress = False
+                    break
+
+        self.end_time = time()
+
+        if self.iterinfo:
+            self.iterinfo_tail(print_results)
+
+        if self.iter == self.max_iter - 1:
+            msg = (
+                f"Reached maximum iteration count ({self.max_iter})), "
+                "calculation stopped. Residual value is "
+                "{:.2e}".format(norm(self.residual))
+            )
+            logger.warning(msg)
+
+        return
+
+    def solve_determination(self):
+        r"""Check, if the number of supplied parameters is sufficient."""
+        # number of user defined functions
         self.num_ude_eq = len(self.user_defined_eq)
 
         for func in self.user_defined_eq.values():
@@ -2118,6 +3041,96 @@ class Network:
             logger.error(msg)
             raise hlp.TESPyNetworkError(msg)
 
+        self.subnetworks = self._get_subnetworks()
+        msg = f'Number of independent sub-networks: {len(self.subnetworks)}.'
+        logger.debug(msg)
+
+    def _get_subnetworks(self):
+        r"""
+        Find the independent sub-networks of the equation system.
+
+        Connections are grouped, if they are connected by a component, a
+        referenced property, a bus with specified value or a user defined
+        equation. Each group is solvable on its own.
+
+        Returns
+        -------
+        subnetworks : list
+            Dictionaries with the connections, components, busses and user
+            defined equations as well as the rows and columns of the Jacobian
+            matrix of each sub-network.
+        """
+        parent = {c.label: c.label for c in self.conns['object']}
+
+        def find(label):
+            while parent[label] != label:
+                parent[label] = parent[parent[label]]
+                label = parent[label]
+            return label
+
+        def union(conns):
+            roots = [find(c.label) for c in conns]
+            for root in roots[1:]:
+                parent[root] = roots[0]
+
+        for cp in self.comps['object']:
+            union(cp.inl + cp.outl)
+
+        for c in self.conns['object']:
+            union([c] + [
+                c.get_attr(key).ref.obj for key in c.property_data
+                if key.endswith('_ref') and c.get_attr(key).is_set
+            ])
+
+        busses = [bus for bus in self.busses.values() if bus.P.is_set]
+        for bus in busses:
+            union([c for cp in bus.comps.index for c in cp.inl + cp.outl])
+
+        for ude in self.user_defined_eq.values():
+            union(ude.conns)
+
+        groups = {}
+        for c in self.conns['object']:
+            groups.setdefault(find(c.label), len(groups))
+
+        subnetworks = [
+            {
+                'conns': [], 'comps': [], 'busses': [], 'udes': [],
+                'rows': [], 'columns': []
+            } for _ in groups
+        ]
+
+        def group(obj):
+            if isinstance(obj, con.Connection):
+                return groups[find(obj.label)]
+            elif isinstance(obj, con.Bus):
+                return group(obj.comps.index[0])
+            elif isinstance(obj, hlp.UserDefinedEquation):
+                return group(obj.conns[0])
+            return group((obj.inl + obj.outl)[0])
+
+        for c in self.conns['object']:
+            subnetworks[group(c)]['conns'] += [c]
+        for cp in self.comps['object']:
+            subnetworks[group(cp)]['comps'] += [cp]
+        for bus in busses:
+            subnetworks[group(bus)]['busses'] += [bus]
+        for ude in self.user_defined_eq.values():
+            subnetworks[group(ude)]['udes'] += [ude]
+
+        for row, (obj, _) in enumerate(self._get_equation_owners()):
+            subnetworks[group(obj)]['rows'] += [row]
+
+        component_variables = {
+            id(container): cp for cp in self.comps['object']
+            for container in cp.vars
+        }
+        for col, data in self.variables_dict.items():
+            obj = component_variables.get(id(data['obj']), data['obj'])
+            subnetworks[group(obj)]['columns'] += [col]
+
+        return subnetworks
+
     def iterinfo_head(self, print_results=True):
         """Print head of convergence progress."""
         # Start with defining the format here
@@ -2226,31 +3239,244 @@ class Network:
     def matrix_inversion(self):
         """Invert matrix of derivatives and caluclate increment."""
         self.lin_dep = True
+        if self.scaling:
+            self._row_scale = self._get_row_scale()
         try:
             # Let the matrix inversion be computed by the GPU if use_cuda in
             # global_vars.py is true.
-            if self.use_cuda:
+            if self.linear_solver == 'schur':
+                self._jacobian_inverse = None
+                self.increment = self.solve_schur_complement()
+            elif self.use_cuda:
+                self._jacobian_inverse = cu.linalg.inv(
+                    cu.asarray(self.jacobian)
+                )
                 self.increment = cu.asnumpy(cu.dot(
-                    cu.linalg.inv(cu.asarray(self.jacobian)),
-                    -cu.asarray(self.residual)
+                    self._jacobian_inverse, -cu.asarray(self.residual)
                 ))
+            elif self.scaling:
+                self._jacobian_inverse = self._invert_scaled_jacobian()
+                self.increment = self._jacobian_inverse.dot(-self.residual)
             else:
-                self.increment = np.linalg.inv(
-                    self.jacobian
-                ).dot(-self.residual)
+                self._jacobian_inverse = np.linalg.inv(self.jacobian)
+                self.increment = self._jacobian_inverse.dot(-self.residual)
             self.lin_dep = False
         except np.linalg.LinAlgError:
+            self._jacobian_inverse = None
             self.increment = self.residual * 0
 
-    def update_variables(self):
+    def _get_row_scale(self):
+        r"""
+        Get the typical magnitude of every equation.
+
+        The magnitude of an equation is the largest partial derivative of the
+        equation multiplied with the nominal value of the variable.
+
+        Returns
+        -------
+        row_scale : ndarray
+            Scale of every row of the Jacobian matrix.
+        """
+        row_scale = np.abs(self.jacobian * self._column_scale).max(
+            axis=1, initial=0
+        )
+        row_scale[row_scale == 0] = 1
+        return row_scale
+
+    def _invert_scaled_jacobian(self):
+        r"""
+        Invert the Jacobian matrix in equilibrated form.
+
+        The scaled matrix :math:`R^{-1} \cdot J \cdot C` with the row scales
+        :math:`R` and the column scales :math:`C` is inverted and transformed
+        back to the inverse of the Jacobian matrix.
+
+        Returns
+        -------
+        inverse : ndarray
+            Inverse of the Jacobian matrix.
+        """
+        row_scale = self._row_scale
+        column_scale = self._column_scale
+        inverse = np.linalg.inv(
+            self.jacobian * column_scale / row_scale[:, None]
+        )
+        return inverse * column_scale[:, None] / row_scale
+
+    def _get_schur_partition(self):
+        r"""
+        Partition the equation system into subsystem blocks and interface.
+
+        The equations and variables of the components and connections of
+        every subsystem are matched with each other (maximum matching on the
+        sparsity pattern of the Jacobian matrix). The matched equations and
+        variables form the interior block of the subsystem, all other
+        equations and variables form the interface. Variables appearing in
+        equations of more than one subsystem, e.g. a mass flow shared by a
+        chain of subsystems after the presolve, are always part of the
+        interface.
+
+        Returns
+        -------
+        partition : tuple
+            List of the rows and columns of the interior blocks, rows and
+            columns of the interface.
+        """
+        subsystem = {}
+        for k, data in enumerate(self.subsystems.values()):
+            for obj in data['comps'] + data['conns']:
+                subsystem[id(obj)] = k
+
+        rows = [[] for _ in self.subsystems]
+        columns = [[] for _ in self.subsystems]
+        for row, (obj, _) in enumerate(self._get_equation_owners()):
+            if id(obj) in subsystem:
+                rows[subsystem[id(obj)]] += [row]
+
+        component_variables = {
+            id(container): cp for cp in self.comps['object']
+            for container in cp.vars
+        }
+        for col, data in self.variables_dict.items():
+            obj = component_variables.get(id(data['obj']), data['obj'])
+            if id(obj) in subsystem:
+                columns[subsystem[id(obj)]] += [col]
+
+        pattern = self.jacobian != 0
+        for row, row_columns in enumerate(self._get_sparsity_pattern()):
+            pattern[row, row_columns] = True
+        row_subsystem = np.full(self.num_vars, -1)
+        for k, block_rows in enumerate(rows):
+            row_subsystem[block_rows] = k
+
+        blocks = []
+        interior_rows = set()
+        interior_columns = set()
+        for k, (block_rows, block_columns) in enumerate(zip(rows, columns)):
+            # the interior variables must not appear in the equations of
+            # other subsystems
+            foreign = pattern[:, block_columns] & (
+                (row_subsystem != k) & (row_subsystem >= 0)
+            )[:, None]
+            block_columns = [
+                col for col, shared in zip(block_columns, foreign.any(axis=0))
+                if not shared
+            ]
+            matching = maximum_matching(
+                [
+                    np.flatnonzero(row).tolist()
+                    for row in pattern[np.ix_(block_rows, block_columns)]
+                ],
+                len(block_columns)
+            )
+            block = [
+                (row, block_columns[col])
+                for row, col in zip(block_rows, matching) if col is not None
+            ]
+            if len(block) == 0:
+                continue
+            blocks += [([row for row, _ in block], [col for _, col in block])]
+            interior_rows.update(blocks[-1][0])
+            interior_columns.update(blocks[-1][1])
+
+        interface_rows = [
+            row for row in range(self.num_vars) if row not in interior_rows
+        ]
+        interface_columns = [
+            col for col in range(self.num_vars) if col not in interior_columns
+        ]
+        msg = (
+            f'Schur complement partition: {len(blocks)} subsystem blocks with '
+            f'{len(interior_rows)} equations and {len(interface_rows)} '
+            'interface equations.'
+        )
+        logger.debug(msg)
+        return blocks, interface_rows, interface_columns
+
+    def solve_schur_complement(self):
+        r"""
+        Solve the linear system of the Newton step by the Schur complement.
+
+        With the interior blocks :math:`A_k` of the subsystems, the coupling
+        blocks :math:`B_k`, :math:`C_k` and the interface block :math:`D` the
+        Newton step :math:`J \cdot \Delta \vec{x} = -\vec{r}` is solved in
+        two steps:
+
+        .. math::
+
+            \left(D - \sum_k C_k \cdot A_k^{-1} \cdot B_k\right) \cdot
+            \Delta \vec{x}_I = -\vec{r}_I + \sum_k C_k \cdot A_k^{-1}
+            \cdot \vec{r}_k\\
+            \Delta \vec{x}_k = -A_k^{-1} \cdot \left(\vec{r}_k + B_k \cdot
+            \Delta \vec{x}_I\right)
+
+        The interior blocks are eliminated independently, with
+        :code:`threads` in parallel. If an interior block is singular, the
+        complete system is solved instead, the same applies to a singular
+        interface system.
+
+        Returns
+        -------
+        increment : ndarray
+            Increment of the variables.
+        """
+        if self._schur_partition is None:
+            self._schur_partition = self._get_schur_partition()
+        blocks, interface_rows, interface_columns = self._schur_partition
+
+        def eliminate(block):
+            rows, columns = block
+            rhs = np.column_stack([
+                self.jacobian[np.ix_(rows, interface_columns)],
+                self.residual[rows]
+            ])
+            return np.linalg.solve(self.jacobian[np.ix_(rows, columns)], rhs)
+
+        try:
+            if self.threads is not None and self.threads > 1:
+                with ThreadPoolExecutor(max_workers=self.threads) as executor:
+                    eliminated = list(executor.map(eliminate, blocks))
+            else:
+                eliminated = [eliminate(block) for block in blocks]
+
+            schur = self.jacobian[np.ix_(interface_rows, interface_columns)]
+            rhs = -self.residual[interface_rows]
+            for (_, columns), solution in zip(blocks, eliminated):
+                coupling = self.jacobian[np.ix_(interface_rows, columns)]
+                schur -= coupling.dot(solution[:, :-1])
+                rhs += coupling.dot(solution[:, -1])
+
+            interface_increment = np.linalg.solve(schur, rhs)
+        except np.linalg.LinAlgError:
+            msg = (
+                'Singular block in the Schur complement solve, solving the '
+                'complete linear system instead.'
+            )
+            logger.debug(msg)
+            return np.linalg.solve(self.jacobian, -self.residual)
+
+        increment = np.zeros(self.num_vars)
+        increment[interface_columns] = interface_increment
+        for (_, columns), solution in zip(blocks, eliminated):
+            increment[columns] = -(
+                solution[:, -1] + solution[:, :-1].dot(interface_increment)
+            )
+
+        return increment
+
+    def update_variables(self, columns=None):
         # cast dtype to float from numpy float64
         # this is necessary to keep the doctests running and note make them
         # look ugly all over the place
         # I have yet to come up with a better idea, or vectorize all operations
         # which requires major changes in tespy
         increment = [float(val) for val in self.increment]
+        if columns is None:
+            variables = self.variables_dict.values()
+        else:
+            variables = [self.variables_dict[col] for col in columns]
         # add the increment
-        for data in self.variables_dict.values():
+        for data in variables:
             if data["variable"] in ["m", "h"]:
                 container = data["obj"].get_attr(data["variable"])
                 container.val_SI += increment[container.J_col]
@@ -2280,9 +3506,17 @@ class Network:
                 elif data["obj"].val > data["obj"].max_val:
                     data["obj"].val = data["obj"].max_val
 
-    def check_variable_bounds(self):
-
-        for c in self.conns['object']:
+    def check_variable_bounds(self, conns=None, comps=None):
+        # the component checks may change variables of other blocks of the
+        # block decomposition and are only applied to the complete system or
+        # to the components of an independent sub-network
+        if conns is None:
+            conns = self.conns['object']
+            comps = self.comps['object']
+        elif comps is None:
+            comps = []
+
+        for c in conns:
             # check the fluid properties for physical ranges
             if len(c.fluid.is_var) > 0:
                 total_mass_fractions = sum(c.fluid.val.values())
@@ -2293,11 +3527,11 @@ class Network:
             self.check_connection_properties(c)
 
         # second property check for first three iterations without an init_file
-        if self.iter < 3:
-            for cp in self.comps['object']:
+        if self.iter < 3 and len(comps) > 0:
+            for cp in comps:
                 cp.convergence_check()
 
-            for c in self.conns['object']:
+            for c in conns:
                 self.check_connection_properties(c)
 
     def solve_control(self):
@@ -2310,18 +3544,186 @@ class Network:
         - Restrict fluid properties to value ranges
         - Check component parameters for consistency
         """
-        self.solve_components()
-        self.solve_busses()
-        self.solve_connections()
-        self.solve_user_defined_eq()
-        self.matrix_inversion()
+        if self.jacobian_update == 'newton' or self._jacobian_inverse is None:
+            self.solve_jacobian()
+        else:
+            self.solve_jacobian_update()
 
         # check for linear dependency
         if self.lin_dep:
             return
 
-        self.update_variables()
-        self.check_variable_bounds()
+        variables = self.get_variable_vector()
+        if self.line_search and norm(self.residual) >= ERR ** 0.5:
+            self.backtracking_line_search(variables)
+        else:
+            self.update_variables()
+            self.check_variable_bounds()
+
+        if self.jacobian_update == 'broyden':
+            self._variable_step = self.get_variable_vector() - variables
+
+    def backtracking_line_search(self, variables):
+        r"""
+        Update the variables with a backtracking line search.
+
+        The increment is halved until the residual norm at the new point
+        satisfies the sufficient decrease condition
+
+        .. math::
+
+            ||\vec{r}(\vec{x} + \alpha \cdot \Delta \vec{x})|| \leq
+            \left(1 - 10^{-4} \cdot \alpha \right) \cdot ||\vec{r}(\vec{x})||
+
+        If no step length satisfies the condition, the shortest step is
+        applied. The applied step lengths are recorded in
+        :code:`_line_search_steps`.
+
+        Parameters
+        ----------
+        variables : ndarray
+            Values of the variables before the update.
+        """
+        increment = self.increment
+        residual_norm = norm(self.residual)
+        step = 1
+        for attempt in range(5):
+            if attempt > 0:
+                step /= 2
+                self.set_variable_vector(variables)
+            self.increment = increment * step
+            self.update_variables()
+            self.check_variable_bounds()
+            try:
+                trial_norm = norm(self.evaluate_residuals())
+            except ValueError:
+                # fluid property evaluation failed at the trial point
+                trial_norm = np.inf
+
+            if trial_norm <= (1 - 1e-4 * step) * residual_norm:
+                self._line_search_steps += [step]
+                self._line_search_failures = 0
+                return
+
+        msg = (
+            f'No sufficient decrease of the residual found by the line search '
+            f'in iteration {self.iter + 1}.'
+        )
+        logger.debug(msg)
+        self._line_search_steps += [step]
+        self._line_search_failures += 1
+
+    def solve_jacobian(self, residual=None):
+        r"""
+        Calculate residual and Jacobian matrix and invert the matrix.
+
+        Parameters
+        ----------
+        residual : ndarray
+            Residual values at the current variables, if already calculated.
+            These are not calculated again by the colored finite differences,
+            the analytic derivatives are calculated together with the
+            residual values.
+        """
+        if self.jacobian_method == 'colored':
+            self.solve_colored_jacobian(residual)
+        else:
+            self.solve_components()
+            self.solve_busses()
+            self.solve_connections()
+            self.solve_user_defined_eq()
+        self.matrix_inversion()
+        self._jacobian_age = 0
+        self.num_jacobian_evaluations += 1
+
+    def solve_jacobian_update(self):
+        r"""
+        Calculate the increment with the previously inverted Jacobian matrix.
+
+        Only the residual values are calculated. The inverted Jacobian matrix
+        is updated with Broyden's method for :code:`jacobian_update='broyden'`.
+        A fresh Jacobian matrix is calculated instead, if the matrix has been
+        used for :code:`jacobian_reuse` iterations or if the residual norm has
+        not been reduced by at least 10 % by the previous increment. In the
+        second case the refresh takes place in the same iteration, the
+        residual values calculated are passed to the refresh.
+        """
+        if self._jacobian_age >= self.jacobian_reuse:
+            self._refresh_jacobian()
+            return
+
+        residual = self.evaluate_residuals()
+        if norm(residual) > 0.9 * self.residual_history[-1]:
+            self._refresh_jacobian(residual)
+            return
+
+        xp = cu if self.use_cuda else np
+        if self.jacobian_update == 'broyden':
+            # Sherman-Morrison update of the inverse ("good" Broyden)
+            step = xp.asarray(self._variable_step)
+            inverse_dr = self._jacobian_inverse.dot(
+                xp.asarray(residual - self.residual)
+            )
+            denominator = step.dot(inverse_dr)
+            if float(denominator) != 0:
+                self._jacobian_inverse += xp.outer(
+                    step - inverse_dr, step.dot(self._jacobian_inverse)
+                ) / denominator
+
+        self.residual = residual
+        increment = self._jacobian_inverse.dot(xp.asarray(-residual))
+        self.increment = cu.asnumpy(increment) if self.use_cuda else increment
+        self._jacobian_age += 1
+
+    def _refresh_jacobian(self, residual=None):
+        msg = (
+            f'Calculating a fresh Jacobian matrix in iteration '
+            f'{self.iter + 1}.'
+        )
+        logger.debug(msg)
+        self.solve_jacobian(residual)
+
+    def set_variable_vector(self, variables):
+        r"""
+        Set the values of the variables.
+
+        Parameters
+        ----------
+        variables : ndarray
+            Values of the variables in the order of the columns of the
+            Jacobian matrix.
+        """
+        for col, data in self.variables_dict.items():
+            if data['variable'] in ['m', 'p', 'h']:
+                container = data['obj'].get_attr(data['variable'])
+                container.val_SI = float(variables[col])
+            elif data['variable'] == 'fluid':
+                data['obj'].fluid.val[data['fluid']] = float(variables[col])
+            else:
+                data['obj'].val = float(variables[col])
+
+        for c in self.conns['object']:
+            c.build_fluid_data()
+
+    def get_variable_vector(self):
+        r"""
+        Return the current values of the variables.
+
+        Returns
+        -------
+        variables : ndarray
+            Values of the variables in the order of the columns of the
+            Jacobian matrix.
+        """
+        variables = np.zeros(self.num_vars)
+        for col, data in self.variables_dict.items():
+            if data['variable'] in ['m', 'p', 'h']:
+                variables[col] = data['obj'].get_attr(data['variable']).val_SI
+            elif data['variable'] == 'fluid':
+                variables[col] = data['obj'].fluid.val[data['fluid']]
+            else:
+                variables[col] = data['obj'].val
+        return variables
 
     def check_connection_properties(self, c):
         r"""
@@ -2383,39 +3785,188 @@ class Network:
             c.m.val_SI = self.m_range_SI[1]
             logger.debug(c._property_range_message('m'))
 
+    def _get_component_kernels(self):
+        r"""
+        Group the component equations with a vectorized kernel.
+
+        The equations are removed from the compiled equation plans of the
+        components.
+
+        Returns
+        -------
+        kernels : list
+            Kernel function, components and equation rows of every group of
+            equations evaluated together.
+        """
+        groups = {}
+        sum_eq = 0
+        for cp in self.comps['object']:
+            offsets = cp.get_equation_offsets()
+            vectorized = set()
+            for key, kernel in cp.get_vectorized_equations().items():
+                if key in offsets:
+                    group = groups.setdefault(kernel, ([], []))
+                    group[0].append(cp)
+                    group[1].append(sum_eq + offsets[key])
+                    vectorized.add(key)
+            if vectorized:
+                cp.compile_equations(vectorized)
+            sum_eq += cp.num_eq
+
+        kernels = [
+            {
+                'kernel': kernel, 'components': components,
+                'rows': np.array(rows)
+            }
+            for kernel, (components, rows) in groups.items()
+        ]
+        msg = (
+            f'{sum(len(k["rows"]) for k in kernels)} component equations are '
+            f'evaluated by {len(kernels)} vectorized kernels.'
+        )
+        logger.debug(msg)
+        return kernels
+
+    def solve_component_kernels(self):
+        r"""
+        Calculate the residual and derivatives of vectorized equations.
+
+        The partial derivatives of filtered variables are not updated, as
+        with the derivative methods of the individual components.
+        """
+        for group in self._component_kernels:
+            residual, columns, derivatives = group['kernel'](
+                group['components'], self.increment_filter
+            )
+            rows = np.broadcast_to(group['rows'][:, np.newaxis], columns.shape)
+            update = columns >= 0
+            update[update] = ~self.increment_filter[columns[update]]
+
+            self.residual[group['rows']] = residual
+            # variables may appear multiple times in an equation
+            self.jacobian[rows[update], columns[update]] = 0
+            np.add.at(
+                self.jacobian, (rows[update], columns[update]),
+                derivatives[update]
+            )
+
+    def _write_jacobian(self, obj, sum_eq):
+        r"""
+        Write the partial derivatives of a component or connection.
+
+        The positions of the derivatives in the Jacobian matrix are cached on
+        the object and only recalculated, if the number of derivatives or the
+        first row of the object's equations change.
+
+        Parameters
+        ----------
+        obj : tespy.components.component.Component, tespy.connections.connection.Connection
+            Object providing the equations.
+
+        sum_eq : int
+            Row of the first equation of the object.
+        """
+        slots = obj._jacobian_slots
+        num = len(obj.jacobian)
+        if slots is None or slots[0] != num or slots[1] != sum_eq:
+            keys = np.array(list(obj.jacobian), dtype=int).reshape(-1, 2)
+            slots = (num, sum_eq, keys[:, 0] + sum_eq, keys[:, 1])
+            obj._jacobian_slots = slots
+        self.jacobian[slots[2], slots[3]] = list(obj.jacobian.values())
+
+    def _get_equation_dependencies(self):
+        r"""
+        Get the columns of the variables the equations of each object read.
+
+        Returns
+        -------
+        dependencies : dict
+            Columns of the variables for every component and connection.
+        """
+        dependencies = {}
+        for cp in self.comps['object']:
+            dependencies[cp] = np.array(
+                self._get_component_columns(cp), dtype=int
+            )
+        for c in self.conns['object']:
+            columns = self._get_connection_columns(c)
+            for key, container in c.property_data.items():
+                if key.endswith('_ref') and container.is_set:
+                    columns += self._get_connection_columns(container.ref.obj)
+            dependencies[c] = np.array(columns, dtype=int)
+        return dependencies
+
+    def _get_tracked_variables(self):
+        if len(self._equation_dependencies) == 0:
+            return None
+        return self.get_variable_vector()
+
+    def _reuse_evaluation(self, obj, variables):
+        r"""
+        Check, if the previous evaluation of an object can be reused.
+
+        Parameters
+        ----------
+        obj : tespy.components.component.Component, tespy.connections.connection.Connection
+            Object providing the equations.
+
+        variables : ndarray
+            Current values of the variables, :code:`None` if the evaluations
+            are not tracked.
+
+        Returns
+        -------
+        reuse : boolean
+            :code:`True`, if none of the variables of the object's equations
+            changed beyond the tolerance since the last evaluation.
+        """
+        if variables is None:
+            return False
+        values = variables[self._equation_dependencies[obj]]
+        snapshot = self._equation_snapshots.get(obj)
+        if snapshot is not None and (
+                np.abs(values - snapshot)
+                <= self.reuse_tolerance * np.maximum(np.abs(snapshot), 1)
+        ).all():
+            self.num_reused_evaluations += 1
+            return True
+        self._equation_snapshots[obj] = values
+        return False
+
     def solve_components(self):
         r"""
         Calculate the residual and derivatives of component equations.
         """
         # fetch component equation residuals and component partial derivatives
+        variables = self._get_tracked_variables()
         sum_eq = 0
         for cp in self.comps['object']:
-            cp.solve(self.increment_filter)
+            if not self._reuse_evaluation(cp, variables):
+                cp.solve(self.increment_filter)
             self.residual[sum_eq:sum_eq + cp.num_eq] = cp.residual
 
             if len(cp.jacobian) > 0:
-                rows = [k[0] + sum_eq for k in cp.jacobian]
-                columns = [k[1] for k in cp.jacobian]
-                data = list(cp.jacobian.values())
-                self.jacobian[rows, columns] = data
-                sum_eq += cp.num_eq
+                self._write_jacobian(cp, sum_eq)
+            # the derivatives of vectorized equations are not stored here
+            sum_eq += cp.num_eq
 
             cp.it += 1
 
+        self.solve_component_kernels()
+
     def solve_connections(self):
         r"""
         Calculate the residual and derivatives of connection equations.
         """
+        variables = self._get_tracked_variables()
         sum_eq = self.num_comp_eq
         for c in self.conns['object']:
-            c.solve(self.increment_filter)
+            if not self._reuse_evaluation(c, variables):
+                c.solve(self.increment_filter)
             self.residual[sum_eq:sum_eq + c.num_eq] = c.residual
 
             if len(c.jacobian) > 0:
-                rows = [k[0] + sum_eq for k in c.jacobian]
-                columns = [k[1] for k in c.jacobian]
-                data = list(c.jacobian.values())
-                self.jacobian[rows, columns] = data
+                self._write_jacobian(c, sum_eq)
                 sum_eq += c.num_eq
 
             c.it += 1
@@ -2454,6 +4005,539 @@ class Network:
                 bus.clear_jacobian()
                 sum_eq += 1
 
+    @staticmethod
+    def _get_connection_columns(c):
+        columns = [
+            c.get_attr(key).J_col for key in ['m', 'p', 'h']
+            if c.get_attr(key).is_var and c.get_attr(key).J_col is not None
+        ]
+        return columns + [c.fluid.J_col[fluid] for fluid in c.fluid.is_var]
+
+    def _get_component_columns(self, cp):
+        columns = [data.J_col for data in cp.vars]
+        for c in cp.inl + cp.outl:
+            columns += self._get_connection_columns(c)
+        return columns
+
+    def _get_sparsity_pattern(self):
+        r"""
+        Get the structural sparsity pattern of the Jacobian matrix.
+
+        The pattern follows from the variables of the connections (and
+        components) each equation is formulated for, independent of the
+        current values of the partial derivatives.
+
+        Returns
+        -------
+        rows : list
+            Columns appearing in each row of the Jacobian matrix.
+        """
+        rows = []
+        for cp in self.comps['object']:
+            rows += [self._get_component_columns(cp)] * cp.num_eq
+
+        for c in self.conns['object']:
+            for k, parameter in c.equations.items():
+                columns = self._get_connection_columns(c)
+                if parameter.endswith('_ref'):
+                    ref = c.get_attr(parameter).ref
+                    columns += self._get_connection_columns(ref.obj)
+                rows += [columns] * c.parameters[parameter].num_eq
+
+        for bus in self.busses.values():
+            if bus.P.is_set:
+                columns = []
+                for cp in bus.comps.index:
+                    columns += self._get_component_columns(cp)
+                rows += [columns]
+
+        for ude in self.user_defined_eq.values():
+            columns = []
+            for c in ude.conns:
+                columns += self._get_connection_columns(c)
+            rows += [columns]
+
+        return rows
+
+    def build_jacobian_coloring(self):
+        r"""
+        Group the variables for the colored finite difference Jacobian.
+
+        The sparsity pattern of the Jacobian follows from the variables of
+        the connections (and components) each equation is formulated for.
+        Variables, which do not appear in a common equation, are assigned the
+        same color by a greedy algorithm (Curtis-Powell-Reid). The partial
+        derivatives of all variables of a color can be calculated from a
+        single perturbation of the residual vector.
+        """
+        rows = self._get_sparsity_pattern()
+        column_rows = [set() for _ in range(self.num_vars)]
+        for row, columns in enumerate(rows):
+            for col in columns:
+                column_rows[col].add(row)
+
+        # greedy coloring, columns with most entries first
+        colors = []
+        color_rows = []
+        order = sorted(
+            range(self.num_vars), key=lambda col: -len(column_rows[col])
+        )
+        for col in order:
+            for color, occupied in enumerate(color_rows):
+                if occupied.isdisjoint(column_rows[col]):
+                    colors[color] += [col]
+                    occupied.update(column_rows[col])
+                    break
+            else:
+                colors += [[col]]
+                color_rows += [set(column_rows[col])]
+
+        self._jacobian_coloring = []
+        for columns in colors:
+            entry_rows = []
+            entry_cols = []
+            for col in columns:
+                entry_rows += sorted(column_rows[col])
+                entry_cols += [col] * len(column_rows[col])
+            self._jacobian_coloring += [(
+                [self._get_perturbation(col) for col in columns],
+                np.array(entry_rows, dtype=int), np.array(entry_cols, dtype=int)
+            )]
+
+        msg = (
+            f'Jacobian coloring: {self.num_vars} variables in '
+            f'{len(colors)} colors.'
+        )
+        logger.debug(msg)
+
+    def _get_perturbation(self, col):
+        data = self.variables_dict[col]
+        if data['variable'] in ['m', 'p', 'h']:
+            container = data['obj'].get_attr(data['variable'])
+            d = 1e-4 if data['variable'] == 'm' else 1e-1
+            return col, container, 'val_SI', d, None
+        elif data['variable'] == 'fluid':
+            container = data['obj'].fluid
+            # all connections sharing the fluid composition
+            conns = [
+                c for c in self.conns['object'] if c.fluid is container
+            ]
+            return col, container.val, data['fluid'], 1e-5, conns
+        else:
+            return col, data['obj'], 'val', data['obj'].d, None
+
+    @staticmethod
+    def _set_perturbation(perturbations, values, factor):
+        for (_, target, key, d, conns), value in zip(perturbations, values):
+            if conns is None:
+                setattr(target, key, value + factor * d)
+            else:
+                target[key] = min(max(value + factor * d, 0), 1)
+                for c in conns:
+                    c.build_fluid_data()
+
+    def evaluate_residuals(self):
+        r"""
+        Calculate the residual values of all equations without derivatives.
+
+        Returns
+        -------
+        residual : ndarray
+            Residual values in the order of the rows of the Jacobian matrix.
+        """
+        # the residual values of the components and connections are
+        # overwritten, their previous evaluations cannot be reused
+        self._equation_snapshots = {}
+        residual = np.zeros(self.num_vars)
+        sum_eq = 0
+        for cp in self.comps['object']:
+            residual[sum_eq:sum_eq + cp.num_eq] = cp.evaluate_residuals()
+            sum_eq += cp.num_eq
+
+        # all variables are filtered, the kernels skip the derivatives
+        no_derivatives = np.ones(self.num_vars, dtype=bool)
+        for group in self._component_kernels:
+            residual[group['rows']] = group['kernel'](
+                group['components'], no_derivatives
+            )[0]
+
+        for c in self.conns['object']:
+            residual[sum_eq:sum_eq + c.num_eq] = c.evaluate_residuals()
+            sum_eq += c.num_eq
+
+        for bus in self.busses.values():
+            if bus.P.is_set:
+                residual[sum_eq] = bus.evaluate_residuals()
+                sum_eq += 1
+
+        for ude in self.user_defined_eq.values():
+            residual[sum_eq] = ude.evaluate_residuals()
+            sum_eq += 1
+
+        return residual
+
+    def solve_colored_jacobian(self, residual=None):
+        r"""
+        Calculate the residual and the Jacobian by colored finite differences.
+
+        For every color of :code:`build_jacobian_coloring` the variables are
+        perturbed simultaneously and the partial derivatives are calculated
+        by central differences of the residual vector.
+
+        Parameters
+        ----------
+        residual : ndarray
+            Residual values at the current variables, if already calculated.
+        """
+        if residual is None:
+            residual = self.evaluate_residuals()
+        self.residual = residual
+        self.jacobian = np.zeros((self.num_vars, self.num_vars))
+
+        for perturbations, rows, cols in self._jacobian_coloring:
+            values = [
+                getattr(target, key) if conns is None else target[key]
+                for _, target, key, _, conns in perturbations
+            ]
+            self._set_perturbation(perturbations, values, 1)
+            upper = [
+                getattr(target, key) if conns is None else target[key]
+                for _, target, key, _, conns in perturbations
+            ]
+            residual_upper = self.evaluate_residuals()
+            self._set_perturbation(perturbations, values, -1)
+            lower = [
+                getattr(target, key) if conns is None else target[key]
+                for _, target, key, _, conns in perturbations
+            ]
+            residual_lower = self.evaluate_residuals()
+            self._set_perturbation(perturbations, values, 0)
+
+            # actual step, mass fractions are limited to the range of 0 to 1
+            step = np.zeros(self.num_vars)
+            for (col, *_), up, low in zip(perturbations, upper, lower):
+                step[col] = up - low
+            self.jacobian[rows, cols] = (
+                residual_upper[rows] - residual_lower[rows]
+            ) / step[cols]
+
+        for cp in self.comps['object']:
+            cp.it += 1
+        for c in self.conns['object']:
+            c.it += 1
+
+    def _get_equation_owners(self):
+        owners = []
+        sum_eq = 0
+        for cp in self.comps['object']:
+            owners += [(cp, sum_eq)] * cp.num_eq
+            sum_eq += cp.num_eq
+        for c in self.conns['object']:
+            owners += [(c, sum_eq)] * c.num_eq
+            sum_eq += c.num_eq
+        for bus in self.busses.values():
+            if bus.P.is_set:
+                owners += [(bus, sum_eq)]
+                sum_eq += 1
+        for ude in self.user_defined_eq.values():
+            owners += [(ude, sum_eq)]
+            sum_eq += 1
+        return owners
+
+    def _solve_equation_owner(self, obj, sum_eq):
+        if isinstance(obj, (con.Bus, hlp.UserDefinedEquation)):
+            obj.solve()
+            self.residual[sum_eq] = obj.residual
+            if len(obj.jacobian) > 0:
+                columns = list(obj.jacobian)
+                self.jacobian[sum_eq, columns] = list(obj.jacobian.values())
+            if isinstance(obj, con.Bus):
+                obj.clear_jacobian()
+        else:
+            self._equation_snapshots.pop(obj, None)
+            obj.solve(self.increment_filter)
+            self.residual[sum_eq:sum_eq + obj.num_eq] = obj.residual
+            if len(obj.jacobian) > 0:
+                self._write_jacobian(obj, sum_eq)
+            obj.it += 1
+
+    def _get_block_connections(self, columns):
+        conns = []
+        for col in columns:
+            data = self.variables_dict[col]
+            if data['variable'] == 'fluid':
+                conns += [
+                    c for c in self.conns['object']
+                    if c.fluid is data['obj'].fluid
+                ]
+            elif data['variable'] in ['m', 'p', 'h']:
+                conns += [data['obj']]
+        return list(dict.fromkeys(conns))
+
+    def _solve_block(self, rows, columns, owners, conns, comps=None):
+        converged = False
+        for iteration in range(self.max_iter):
+            self.iter = iteration
+            for obj, sum_eq in owners:
+                self._solve_equation_owner(obj, sum_eq)
+
+            residual_norm = norm(self.residual[rows])
+            if residual_norm < ERR ** 0.5:
+                converged = True
+                break
+
+            try:
+                increment = np.linalg.solve(
+                    self.jacobian[np.ix_(rows, columns)], -self.residual[rows]
+                )
+            except np.linalg.LinAlgError:
+                break
+
+            self.increment = np.zeros(self.num_vars)
+            self.increment[columns] = increment
+            self.update_variables(columns)
+            self.check_variable_bounds(conns, comps)
+
+        return converged, iteration + 1, residual_norm
+
+    def solve_blocks(self):
+        r"""
+        Solve the equation system block by block.
+
+        The structural sparsity pattern of the Jacobian matrix, see
+        :code:`_get_sparsity_pattern`, is decomposed into irreducible blocks
+        (block triangular form), see
+        :py:func:`tespy.tools.graph.block_triangular_decomposition`. Partial
+        derivatives vanishing at the starting values therefore do not change
+        the order of the blocks. The blocks are solved in sequence with
+        individual Newton iterations, only the equations of the components,
+        connections, busses and user defined equations of the respective block
+        are evaluated.
+        """
+        self._init_partitioned_solve()
+        variables = self.get_variable_vector()
+        owners = self._get_equation_owners()
+
+        pattern = self._get_sparsity_pattern()
+        blocks = block_triangular_decomposition(pattern, self.num_vars)
+        if blocks is None:
+            msg = (
+                'The Jacobian matrix is structurally singular, the block '
+                'decomposition is skipped.'
+            )
+            logger.warning(msg)
+            return
+
+        msg = f'Decomposed the equation system into {len(blocks)} blocks.'
+        logger.debug(msg)
+
+        diagnostics = []
+        for block, (rows, columns) in enumerate(blocks):
+            block_owners = list(dict.fromkeys(owners[row] for row in rows))
+            block_conns = self._get_block_connections(columns)
+            converged, iterations, residual_norm = self._solve_block(
+                rows, columns, block_owners, block_conns
+            )
+            diagnostics += [{
+                'equations': len(rows), 'iterations': iterations,
+                'residual': residual_norm, 'converged': converged
+            }]
+            if not converged:
+                msg = (
+                    f'Block {block} with {len(rows)} equations did not '
+                    'converge, solving the complete equation system instead.'
+                )
+                logger.warning(msg)
+                break
+
+        self.block_convergence = self._finalize_partitioned_solve(
+            diagnostics, 'block', variables
+        )
+        self.iter = max(int(self.block_convergence['iterations'].sum()) - 1, 0)
+
+    def solve_subnetworks(self, processes=None):
+        r"""
+        Solve the independent sub-networks of the network separately.
+
+        The sub-networks are identified in :code:`solve_determination`. Each
+        sub-network is solved with its own Newton iteration on its equations
+        only. With more than one process, the sub-networks are solved as
+        individual networks in worker processes and the results are merged
+        into this network.
+
+        Parameters
+        ----------
+        processes : int
+            Number of worker processes, default: :code:`None`.
+        """
+        self._init_partitioned_solve()
+        variables = self.get_variable_vector()
+
+        for subnetwork in self.subnetworks:
+            if len(subnetwork['rows']) != len(subnetwork['columns']):
+                msg = (
+                    'The sub-network of the connection '
+                    f'{subnetwork["conns"][0].label} has '
+                    f'{len(subnetwork["rows"])} equations for '
+                    f'{len(subnetwork["columns"])} variables, solving the '
+                    'complete equation system instead.'
+                )
+                logger.warning(msg)
+                return
+
+        msg = (
+            f'Solving {len(self.subnetworks)} independent sub-networks '
+            'separately.'
+        )
+        logger.debug(msg)
+
+        if processes is None or processes == 1:
+            diagnostics = self._solve_subnetworks_sequentially()
+            iterations = sum(data['iterations'] for data in diagnostics)
+        else:
+            diagnostics = self._solve_subnetworks_in_parallel(processes)
+            iterations = max(data['iterations'] for data in diagnostics)
+
+        self.subnetwork_convergence = self._finalize_partitioned_solve(
+            diagnostics, 'subnetwork', variables
+        )
+        self.iter = max(iterations - 1, 0)
+
+    def _solve_subnetworks_sequentially(self):
+        owners = self._get_equation_owners()
+        diagnostics = []
+        for subnetwork, data in enumerate(self.subnetworks):
+            rows = data['rows']
+            converged, iterations, residual_norm = self._solve_block(
+                rows, data['columns'],
+                list(dict.fromkeys(owners[row] for row in rows)),
+                data['conns'], data['comps']
+            )
+            diagnostics += [{
+                'equations': len(rows), 'iterations': iterations,
+                'residual': residual_norm, 'converged': converged
+            }]
+            if not converged:
+                msg = (
+                    f'Sub-network {subnetwork} with {len(rows)} equations did '
+                    'not converge, solving the complete equation system '
+                    'instead.'
+                )
+                logger.warning(msg)
+                break
+
+        return diagnostics
+
+    def _get_subnetwork_solve_options(self):
+        r"""
+        Return the options of the current solve for the sub-networks.
+
+        The partitioning options are not forwarded, as every worker solves a
+        single sub-network.
+
+        Returns
+        -------
+        kwargs : dict
+            Keyword arguments for :code:`Network.solve`.
+        """
+        return {
+            'mode': self.mode, 'init_path': self.init_path,
+            'design_path': self.design_path, 'max_iter': self.max_iter,
+            'min_iter': self.min_iter, 'init_previous': self.init_previous,
+            'use_cuda': self.use_cuda,
+            'jacobian_method': self.jacobian_method,
+            'jacobian_update': self.jacobian_update,
+            'jacobian_reuse': self.jacobian_reuse,
+            'line_search': self.line_search,
+            'linear_solver': self.linear_solver, 'threads': self.threads,
+            'vectorize': self.vectorize,
+            'reuse_tolerance': self.reuse_tolerance, 'scaling': self.scaling
+        }
+
+    def _solve_subnetworks_in_parallel(self, processes):
+        kwargs = self._get_subnetwork_solve_options()
+        settings = self._serialize()
+        workers = min(processes, len(self.subnetworks))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_solve_subnetwork, (
+                    settings, data['conns'], data['busses'], data['udes'],
+                    kwargs
+                ))
+                for data in self.subnetworks
+            ]
+            results = []
+            for subnetwork, future in enumerate(futures):
+                try:
+                    results += [future.result()]
+                except Exception as e:
+                    msg = (
+                        f'Solving the sub-network {subnetwork} in a worker '
+                        f'process failed: {e}'
+                    )
+                    logger.warning(msg)
+                    results += [None]
+
+        diagnostics = []
+        for data, result in zip(self.subnetworks, results):
+            if result is None:
+                diagnostics += [{
+                    'equations': len(data['rows']), 'iterations': 0,
+                    'residual': np.nan, 'converged': False
+                }]
+                continue
+
+            for c in data['conns']:
+                values, fluid = result['conns'][c.label]
+                for key, value in zip(['m', 'p', 'h'], values):
+                    c.get_attr(key).val_SI = value
+                c.fluid.val.update(fluid)
+                c.build_fluid_data()
+
+            for cp in data['comps']:
+                for container, name in cp.vars.items():
+                    container.val = result['comps'][cp.label][name]
+
+            diagnostics += [{
+                'equations': len(data['rows']),
+                'iterations': result['iterations'],
+                'residual': result['residual'],
+                'converged': result['converged']
+            }]
+
+        return diagnostics
+
+    def _init_partitioned_solve(self):
+        self.residual = np.zeros(self.num_vars)
+        self.jacobian = np.zeros((self.num_vars, self.num_vars))
+        self.increment = np.zeros(self.num_vars)
+        self.increment_filter = np.zeros(self.num_vars, dtype=bool)
+        self.residual_history = np.array([])
+        self.lin_dep = False
+        self.progress = True
+        self.iter = 0
+        self.start_time = time()
+
+    def _finalize_partitioned_solve(self, diagnostics, index, variables):
+        convergence = pd.DataFrame(
+            diagnostics,
+            columns=['equations', 'iterations', 'residual', 'converged']
+        )
+        convergence.index.name = index
+        if self.iterinfo:
+            print(tabulate(convergence, headers='keys', floatfmt='.2e'))
+
+        if convergence['converged'].all():
+            self.residual = self.evaluate_residuals()
+            self.residual_history = np.array([norm(self.residual)])
+            self.converged = bool(self.residual_history[-1] < ERR ** 0.5)
+
+        if not self.converged:
+            self.set_variable_vector(variables)
+
+        self.end_time = time()
+        return convergence
+
     def postprocessing(self):
         r"""Calculate connection, bus and component parameters."""
         self.process_connections()
@@ -2463,6 +4547,11 @@ class Network:
         msg = 'Postprocessing complete.'
         logger.info(msg)
 
+    def write_results_sink(self):
+        """Append the results to the results sink, if one is specified."""
+        if self.results_sink is not None:
+            self.results_sink.write(self)
+
     def process_connections(self):
         """Process the Connection results."""
         for c in self.conns['object']:
@@ -2661,7 +4750,21 @@ class Network:
             return np.nan
 
     def export(self, path):
-        """Export the network structure and parametrization."""
+        """
+        Export the network structure and parametrization.
+
+        Parameters
+        ----------
+        path : str
+            Path to export the network to. If the path ends with
+            :code:`.json`, all information is exported to a single file,
+            otherwise a folder structure with one file for the network, the
+            connections, the busses and each component type is created.
+        """
+        if str(path).endswith(".json"):
+            self._export_single_file(path)
+            return
+
         path, path_comps = self._create_export_paths(path)
         self.export_network(path)
         self.export_connections(path)
@@ -2766,9 +4869,7 @@ class Network:
             logger.debug('Bus information saved to %s.', fn)
 
     def export_connections(self, fn):
-        connections = {}
-        for c in self.conns["object"]:
-            connections.update(c._serialize())
+        connections = self._serialize_connections()
 
         fn = os.path.join(fn, "connections.json")
         with open(fn, "w", encoding="utf-8") as f:
@@ -2776,11 +4877,7 @@ class Network:
         logger.debug('Connection information exported to %s.', fn)
 
     def export_components(self, fn):
-        for c in self.comps["comp_type"].unique():
-            components = {}
-            for cp in self.comps.loc[self.comps["comp_type"] == c, "object"]:
-                components.update(cp._serialize())
-
+        for c, components in self._serialize_components().items():
             fname = os.path.join(fn, f"{c}.json")
             with open(fname, "w", encoding="utf-8") as f:
                 json.dump(components, f, indent=4)
@@ -2788,10 +4885,45 @@ class Network:
 
     def export_busses(self, fn):
         if len(self.busses) > 0:
-            busses = {}
-            for bus in self.busses.values():
-                busses.update(bus._serialize())
+            busses = self._serialize_busses()
             fn = os.path.join(fn, 'busses.json')
             with open(fn, "w", encoding="utf-8") as f:
                 json.dump(busses, f, indent=4)
             logger.debug('Bus information exported to %s.', fn)
+
+    def _export_single_file(self, fn):
+        data = {
+            "Network": self._serialize(),
+            "Connection": self._serialize_connections(),
+            "Component": self._serialize_components()
+        }
+        if len(self.busses) > 0:
+            data["Bus"] = self._serialize_busses()
+
+        dirname = os.path.dirname(fn)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+
+        with open(fn, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        logger.debug('Network exported to %s.', fn)
+
+    def _serialize_connections(self):
+        connections = {}
+        for c in self.conns["object"]:
+            connections.update(c._serialize())
+        return connections
+
+    def _serialize_components(self):
+        components = {}
+        for c in self.comps["comp_type"].unique():
+            components[c] = {}
+            for cp in self.comps.loc[self.comps["comp_type"] == c, "object"]:
+                components[c].update(cp._serialize())
+        return components
+
+    def _serialize_busses(self):
+        busses = {}
+        for bus in self.busses.values():
+            busses.update(bus._serialize())
+        return busses
@@ -33,7 +33,7 @@ from tespy.tools.fluid_properties.wrappers import wrapper_registry
 
 def load_network(path):
     r"""
-    Load a network from a base path.
+    Load a network from a base path or a single file export.
 
     Parameters
     ----------
@@ -62,6 +62,10 @@ def load_network(path):
     - busses.json
     - network.json
 
+    If the network has been exported to a single file, i.e. the path passed
+    to :code:`Network.export` ends with :code:`.json`, provide the path to
+    that file instead.
+
     Example
     -------
     Create a network and export it. This is followed by loading the network
@@ -173,10 +177,16 @@ def load_network(path):
     >>> shutil.rmtree('./exported_nwk', ignore_errors=True)
     >>> shutil.rmtree('./design_state', ignore_errors=True)
     """
-    path_comps = os.path.join(path, 'components')
+    if os.path.isfile(path):
+        msg = f"Reading network data from file {path}."
+        logger.info(msg)
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
 
-    msg = f'Reading network data from base path {path}.'
-    logger.info(msg)
+    else:
+        msg = f"Reading network data from base path {path}."
+        logger.info(msg)
+        data = _read_network_folder(path)
 
     # load components
     comps = {}
@@ -184,13 +194,9 @@ def load_network(path):
     module_name = "tespy.components"
     _ = importlib.import_module(module_name)
 
-    files = os.listdir(path_comps)
-    for f in files:
-        if not f.endswith(".json"):
-            continue
-
-        component = f.replace(".json", "")
-
+    # the keys of the data containers are only validated once per key set
+    validated = set()
+    for component, component_data in data["Component"].items():
         if component not in component_registry.items:
             msg = (
                 f"A class {component} is not available through the "
@@ -201,50 +207,29 @@ def load_network(path):
             logger.warning(msg)
             continue
 
-        fn = os.path.join(path_comps, f)
-        msg = f"Reading component data ({component}) from {fn}."
-        logger.debug(msg)
-
-        with open(fn, "r", encoding="utf-8") as c:
-            data = json.load(c)
-
         target_class = component_registry.items[component]
-        comps.update(_construct_components(target_class, data))
+        comps.update(
+            _construct_components(target_class, component_data, validated)
+        )
 
     msg = 'Created network components.'
     logger.info(msg)
 
     # create network
-    nw = _construct_network(path)
+    nw = Network(**data["Network"])
 
     # load connections
-    fn = os.path.join(path, 'connections.json')
-    msg = f"Reading connection data from {fn}."
-    logger.debug(msg)
-
-    with open(fn, "r", encoding="utf-8") as c:
-        data = json.load(c)
-
-    conns = _construct_connections(data, comps)
+    conns = _construct_connections(data["Connection"], comps, validated)
 
     # add connections to network
-    for c in conns.values():
-        nw.add_conns(c)
+    nw.add_conns(*conns.values())
 
     msg = 'Created connections.'
     logger.info(msg)
 
     # load busses
-    fn = os.path.join(path, 'busses.json')
-    if os.path.isfile(fn):
-
-        msg = f"Reading bus data from {fn}."
-        logger.debug(msg)
-
-        with open(fn, "r", encoding="utf-8") as c:
-            data = json.load(c)
-
-        busses = _construct_busses(data, comps)
+    if "Bus" in data:
+        busses = _construct_busses(data["Bus"], comps)
         # add busses to network
         for b in busses.values():
             nw.add_busses(b)
@@ -264,7 +249,88 @@ def load_network(path):
     return nw
 
 
-def _construct_components(target_class, data):
+def _read_network_folder(path):
+    r"""
+    Read the network data from the exported folder structure.
+
+    Parameters
+    ----------
+    path : str
+        Base-path to stored network data.
+
+    Returns
+    -------
+    dict
+        Network data in the structure of the single file export.
+    """
+    data = {"Component": {}}
+    path_comps = os.path.join(path, 'components')
+
+    files = os.listdir(path_comps)
+    for f in files:
+        if not f.endswith(".json"):
+            continue
+
+        component = f.replace(".json", "")
+        fn = os.path.join(path_comps, f)
+        msg = f"Reading component data ({component}) from {fn}."
+        logger.debug(msg)
+
+        with open(fn, "r", encoding="utf-8") as c:
+            data["Component"][component] = json.load(c)
+
+    # read network .json-file
+    fn = os.path.join(path, 'network.json')
+    with open(fn, 'r') as f:
+        data["Network"] = json.load(f)
+
+    fn = os.path.join(path, 'connections.json')
+    msg = f"Reading connection data from {fn}."
+    logger.debug(msg)
+
+    with open(fn, "r", encoding="utf-8") as c:
+        data["Connection"] = json.load(c)
+
+    fn = os.path.join(path, 'busses.json')
+    if os.path.isfile(fn):
+
+        msg = f"Reading bus data from {fn}."
+        logger.debug(msg)
+
+        with open(fn, "r", encoding="utf-8") as c:
+            data["Bus"] = json.load(c)
+
+    return data
+
+
+def _set_container_data(container, data, validated):
+    r"""
+    Set the data of a DataContainer.
+
+    The keys of the data are validated by the container's :code:`set_attr`
+    method only for the first container of a type with the respective keys,
+    all other containers are updated directly.
+
+    Parameters
+    ----------
+    container : tespy.tools.data_containers.DataContainer
+        The container to set the data on.
+
+    data : dict
+        Data to set.
+
+    validated : set
+        Combinations of container type and keys, which have been validated.
+    """
+    key = (container.__class__, tuple(data))
+    if key in validated:
+        container.__dict__.update(data)
+    else:
+        container.set_attr(**data)
+        validated.add(key)
+
+
+def _construct_components(target_class, data, validated):
     r"""
     Create TESPy component from class name and set parameters.
 
@@ -276,6 +342,9 @@ def _construct_components(target_class, data):
     data : dict
         Dictionary with component information.
 
+    validated : set
+        Combinations of container type and keys, which have been validated.
+
     Returns
     -------
     dict
@@ -294,37 +363,14 @@ def _construct_components(target_class, data):
                         param_data["char_func"] = CharMap(**param_data["char_func"])
                 if isinstance(container, dc_prop):
                     param_data["val0"] = param_data["val"]
-                container.set_attr(**param_data)
+                _set_container_data(container, param_data, validated)
             else:
                 instances[cp].set_attr(**{param: param_data})
 
     return instances
 
 
-def _construct_network(path):
-    r"""
-    Create TESPy network from the path provided by the user.
-
-    Parameters
-    ----------
-    path : str
-        Base-path to stored network data.
-
-    Returns
-    -------
-    nw : tespy.networks.network.Network
-        TESPy network object.
-    """
-    # read network .json-file
-    fn = os.path.join(path, 'network.json')
-    with open(fn, 'r') as f:
-        data = json.load(f)
-
-    # create network object with its properties
-    return Network(**data)
-
-
-def _construct_connections(data, comps):
+def _construct_connections(data, comps, validated):
     r"""
     Create TESPy connection from data in the .json-file and its parameters.
 
@@ -336,12 +382,17 @@ def _construct_connections(data, comps):
     comps : dict
         Dictionary of constructed components.
 
+    validated : set
+        Combinations of container type and keys, which have been validated.
+
     Returns
     -------
     dict
         Dictionary of TESPy connection objects.
     """
     conns = {}
+    # connections with identical fluid property engines share the wrapper
+    wrappers = {}
 
     arglist = [
         _ for _ in data[list(data.keys())[0]]
@@ -362,15 +413,26 @@ def _construct_connections(data, comps):
         for arg in arglist:
             container = conns[label].get_attr(arg)
             if isinstance(container, dc):
-                container.set_attr(**conn[arg])
+                _set_container_data(container, conn[arg], validated)
             else:
                 conns[label].set_attr(**{arg: conn[arg]})
 
         for f, engine in conn["fluid"]["engine"].items():
             conn["fluid"]["engine"][f] = wrapper_registry.items[engine]
 
-        conns[label].fluid.set_attr(**conn["fluid"])
+        fluid = conns[label].fluid
+        fluid.set_attr(**conn["fluid"])
+        keys = {
+            f: (fluid.engine.get(f), f, fluid.back_end.get(f))
+            for f in fluid.val
+        }
+        for f, key in keys.items():
+            if key in wrappers:
+                fluid.wrapper[f] = wrappers[key]
+
         conns[label]._create_fluid_wrapper()
+        for f, key in keys.items():
+            wrappers[key] = fluid.wrapper[f]
 
     for label, conn in data.items():
         for arg in arglist_ref:
@@ -15,3 +15,5 @@ from .data_containers import SimpleDataContainer  # noqa: F401
 from .document_models import document_model  # noqa: F401
 from .helpers import UserDefinedEquation  # noqa: F401
 from .optimization import OptimizationProblem  # noqa: F401
+from .results_sink import ResultsSink  # noqa: F401
+from .results_sink import read_results  # noqa: F401
@@ -0,0 +1,520 @@
+# -*- coding: utf-8
+
+"""Module for forward-mode automatic differentiation of equations.
+
+Residual functions of components and user defined equations can be evaluated
+with dual numbers instead of floats. A dual number carries its value and the
+partial derivatives with respect to the variables of the system, thus a single
+evaluation of the residual function yields the residual value and all partial
+derivatives. The characteristics accept dual numbers and return their exact
+slopes, the fluid property functions accept dual numbers and return partial
+derivatives calculated by finite differences (dual-number derivatives with
+finite-difference property derivatives).
+
+
+This file is part of project TESPy (github.com/oemof/tespy). It's copyrighted
+by the contributors recorded in the version control history of the file,
+available from its original location tespy/tools/autodiff.py
+
+SPDX-License-Identifier: MIT
+"""
+import functools
+import inspect
+import math
+
+import numpy as np
+
+from tespy.tools import logger
+
+
+class Dual:
+    r"""
+    Dual number for forward-mode automatic differentiation.
+
+    Parameters
+    ----------
+    val : float
+        Value of the number.
+
+    grad : dict
+        Partial derivatives of the number with the variable (e.g. the column
+        of the variable in the Jacobian matrix) as key.
+
+    Note
+    ----
+    The dictionary of the partial derivatives is never modified after
+    creation of a Dual and may therefore be shared between instances.
+
+    Example
+    -------
+    >>> from tespy.tools.autodiff import Dual, sqrt
+    >>> x = Dual.variable(3, 0)
+    >>> y = Dual.variable(4, 1)
+    >>> z = sqrt(x ** 2 + y ** 2)
+    >>> z.val
+    5.0
+    >>> {key: round(value, 6) for key, value in z.grad.items()}
+    {0: 0.6, 1: 0.8}
+    >>> (2 * x / y - 1).grad
+    {0: 0.5, 1: -0.375}
+    """
+
+    __slots__ = ('val', 'grad')
+    # make numpy scalars defer to the operators of the Dual
+    __array_ufunc__ = None
+
+    def __init__(self, val, grad=None):
+        self.val = val
+        self.grad = {} if grad is None else grad
+
+    @classmethod
+    def variable(cls, val, key):
+        r"""Create a Dual for a variable with the partial derivative 1."""
+        return cls(val, {key: 1.0})
+
+    @classmethod
+    def from_partials(cls, val, terms):
+        r"""
+        Create a Dual from partial derivatives with respect to other Duals.
+
+        Parameters
+        ----------
+        val : float
+            Value of the number.
+
+        terms : list
+            Tuples of partial derivative and the Dual it refers to.
+
+        Returns
+        -------
+        dual : tespy.tools.autodiff.Dual
+            Dual with the gradient from the chain rule.
+        """
+        grad = {}
+        for partial, dual in terms:
+            for key, value in dual.grad.items():
+                grad[key] = grad.get(key, 0) + partial * value
+        return cls(val, grad)
+
+    def _scale(self, factor):
+        return {key: factor * value for key, value in self.grad.items()}
+
+    def __repr__(self):
+        return f'Dual({self.val}, {self.grad})'
+
+    def __add__(self, other):
+        if isinstance(other, Dual):
+            return Dual.from_partials(
+                self.val + other.val, [(1, self), (1, other)]
+            )
+        return Dual(self.val + other, self.grad)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, Dual):
+            return Dual.from_partials(
+                self.val - other.val, [(1, self), (-1, other)]
+            )
+        return Dual(self.val - other, self.grad)
+
+    def __rsub__(self, other):
+        return Dual(other - self.val, self._scale(-1))
+
+    def __mul__(self, other):
+        if isinstance(other, Dual):
+            return Dual.from_partials(
+                self.val * other.val, [(other.val, self), (self.val, other)]
+            )
+        return Dual(self.val * other, self._scale(other))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, Dual):
+            val = self.val / other.val
+            return Dual.from_partials(
+                val, [(1 / other.val, self), (-val / other.val, other)]
+            )
+        return Dual(self.val / other, self._scale(1 / other))
+
+    def __rtruediv__(self, other):
+        val = other / self.val
+        return Dual(val, self._scale(-val / self.val))
+
+    def __pow__(self, other):
+        if isinstance(other, Dual):
+            val = self.val ** other.val
+            return Dual.from_partials(val, [
+                (other.val * self.val ** (other.val - 1), self),
+                (val * math.log(self.val), other)
+            ])
+        if other == 0:
+            return Dual(1.0)
+        return Dual(
+            self.val ** other, self._scale(other * self.val ** (other - 1))
+        )
+
+    def __rpow__(self, other):
+        val = other ** self.val
+        return Dual(val, self._scale(val * math.log(other)))
+
+    def __neg__(self):
+        return Dual(-self.val, self._scale(-1))
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        if self.val < 0:
+            return -self
+        return self
+
+    def __eq__(self, other):
+        return self.val == _value(other)
+
+    def __ne__(self, other):
+        return self.val != _value(other)
+
+    def __lt__(self, other):
+        return self.val < _value(other)
+
+    def __le__(self, other):
+        return self.val <= _value(other)
+
+    def __gt__(self, other):
+        return self.val > _value(other)
+
+    def __ge__(self, other):
+        return self.val >= _value(other)
+
+    __hash__ = None
+
+
+def _value(x):
+    return x.val if isinstance(x, Dual) else x
+
+
+def value(x):
+    r"""Return the value of a Dual or the input itself for other types."""
+    return _value(x)
+
+
+def sqrt(x):
+    r"""Square root of a float or a Dual."""
+    if isinstance(x, Dual):
+        val = math.sqrt(x.val)
+        return Dual(val, x._scale(0.5 / val))
+    return math.sqrt(x)
+
+
+def exp(x):
+    r"""Exponential function of a float or a Dual."""
+    if isinstance(x, Dual):
+        val = math.exp(x.val)
+        return Dual(val, x._scale(val))
+    return math.exp(x)
+
+
+def log(x):
+    r"""Natural logarithm of a float or a Dual."""
+    if isinstance(x, Dual):
+        return Dual(math.log(x.val), x._scale(1 / x.val))
+    return math.log(x)
+
+
+def differentiable(*steps):
+    r"""
+    Make a function of floats accept Duals for its leading arguments.
+
+    The function is evaluated with the values of the Duals. The partial
+    derivatives with respect to the Dual arguments are calculated by central
+    finite differences of the function.
+
+    Parameters
+    ----------
+    steps : float
+        Finite difference step for each differentiable leading argument.
+
+    Returns
+    -------
+    decorator : function
+        Decorator for the function.
+
+    Example
+    -------
+    >>> from tespy.tools.autodiff import Dual, differentiable
+    >>> @differentiable(1e-3, 1e-3)
+    ... def func(a, b, c=1):
+    ...     return a ** 2 * b * c
+    >>> func(2, 3)
+    12
+    >>> result = func(Dual.variable(2, 'a'), b=3, c=2)
+    >>> result.val, round(result.grad['a'], 6)
+    (24, 24.0)
+    """
+    def decorator(func):
+        names = list(inspect.signature(func).parameters)[:len(steps)]
+        num = len(steps)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if kwargs and not kwargs.keys().isdisjoint(names):
+                args = list(args)
+                for name in names[len(args):]:
+                    if name not in kwargs:
+                        break
+                    args += [kwargs.pop(name)]
+
+            for arg in args[:num]:
+                if isinstance(arg, Dual):
+                    break
+            else:
+                return func(*args, **kwargs)
+
+            values = [_value(arg) for arg in args[:num]]
+            rest = args[num:]
+            val = func(*values, *rest, **kwargs)
+            terms = []
+            for i, (arg, d) in enumerate(zip(args[:num], steps)):
+                if isinstance(arg, Dual):
+                    upper = values.copy()
+                    upper[i] += d
+                    lower = values.copy()
+                    lower[i] -= d
+                    partial = (
+                        func(*upper, *rest, **kwargs)
+                        - func(*lower, *rest, **kwargs)
+                    ) / (2 * d)
+                    terms += [(partial, arg)]
+            return Dual.from_partials(val, terms)
+
+        return wrapper
+
+    return decorator
+
+
+def evaluate_dual(obj, func, conns, variables=None, increment_filter=None,
+                  **kwargs):
+    r"""
+    Evaluate a residual function and all its partial derivatives.
+
+    The mass flow, pressure and enthalpy of the connections and the additional
+    variables are replaced by Duals for a single evaluation of the function.
+    Derivatives to the fluid composition are calculated numerically.
+
+    Parameters
+    ----------
+    obj : object
+        Instance, which provides the equation (component or user defined
+        equation).
+
+    func : function
+        Residual function to evaluate. It may return a single value or a list
+        of values for multiple equations.
+
+    conns : list
+        Connections the residual function depends on.
+
+    variables : list
+        Additional variables (e.g. component variables) the residual function
+        depends on. The value is taken from the :code:`val` attribute.
+
+    increment_filter : ndarray
+        Matrix for filtering non-changing variables.
+
+    Returns
+    -------
+    residual : float, ndarray
+        Residual value(s) of the function.
+
+    derivatives : dict, list
+        Partial derivatives with the column of the variable in the Jacobian
+        matrix as key (list of dictionaries for multiple equations).
+
+    Note
+    ----
+    If the function does not accept Duals, e.g. because it uses the functions
+    of the :code:`math` module or numpy ufuncs instead of the ones of this
+    module, all partial derivatives are calculated by central finite
+    differences.
+    """
+    seeded = {}
+    for c in conns:
+        for container, d in [(c.m, 1e-4), (c.p, 1e-1), (c.h, 1e-1)]:
+            if _is_variable(container, increment_filter):
+                seeded[id(container)] = (container, 'val_SI', d)
+    for container in variables or []:
+        if _is_variable(container, increment_filter):
+            seeded[id(container)] = (container, 'val', container.d)
+
+    for container, attr, _ in seeded.values():
+        setattr(
+            container, attr,
+            Dual.variable(getattr(container, attr), container.J_col)
+        )
+    try:
+        result = func(**kwargs)
+        dual_evaluation = True
+    except TypeError:
+        dual_evaluation = False
+    finally:
+        for container, attr, _ in seeded.values():
+            setattr(container, attr, _value(getattr(container, attr)))
+
+    def residual_func(**kwargs):
+        return np.asarray(func(**kwargs), dtype=float).reshape(-1)
+
+    if dual_evaluation:
+        multiple = isinstance(result, (list, tuple, np.ndarray))
+        if not multiple:
+            result = [result]
+
+        residual = np.array([_value(x) for x in result], dtype=float)
+        derivatives = [
+            dict(x.grad) if isinstance(x, Dual) else {} for x in result
+        ]
+        for container, _, _ in seeded.values():
+            for derivative in derivatives:
+                derivative.setdefault(container.J_col, 0)
+    else:
+        msg = (
+            f'The equation {func.__name__} does not accept dual numbers, the '
+            'partial derivatives are calculated by finite differences.'
+        )
+        logger.debug(msg)
+        result = func(**kwargs)
+        multiple = isinstance(result, (list, tuple, np.ndarray))
+        residual = np.asarray(result, dtype=float).reshape(-1)
+        derivatives = [{} for _ in residual]
+        for container, attr, d in seeded.values():
+            deriv = _finite_difference(
+                residual_func, container, attr, d, **kwargs
+            )
+            for derivative, value in zip(derivatives, deriv):
+                derivative[container.J_col] = value
+
+    # the mass fractions are no Duals, derivatives are calculated numerically
+    for c in conns:
+        for fluid in c.fluid.is_var:
+            col = c.fluid.J_col[fluid]
+            if increment_filter is None or not increment_filter[col]:
+                deriv = _numeric_deriv(obj, residual_func, fluid, c, **kwargs)
+                for derivative, value in zip(derivatives, deriv):
+                    derivative[col] = value
+
+    if multiple:
+        return residual, derivatives
+    return residual[0], derivatives[0]
+
+
+def _finite_difference(func, container, attr, d, **kwargs):
+    val = getattr(container, attr)
+    try:
+        setattr(container, attr, val + d)
+        upper = func(**kwargs)
+        setattr(container, attr, val - d)
+        lower = func(**kwargs)
+    finally:
+        setattr(container, attr, val)
+    return (upper - lower) / (2 * d)
+
+
+def _numeric_deriv(obj, func, dx, conn=None, **kwargs):
+    r"""
+    Calculate partial derivative of the function func to dx.
+
+    Parameters
+    ----------
+    obj : object
+        Instance, which provides the equation to calculate the derivative for.
+
+    func : function
+        Function :math:`f` to calculate the partial derivative for.
+
+    dx : str
+        Partial derivative.
+
+    conn : tespy.connections.connection.Connection
+        Connection to calculate the numeric derivative for.
+
+    Returns
+    -------
+    deriv : float/list
+        Partial derivative(s) of the function :math:`f` to variable(s)
+        :math:`x`.
+
+        .. math::
+
+            \frac{\partial f}{\partial x} = \frac{f(x + d) + f(x - d)}{2 d}
+    """
+    if conn is None:
+        d = obj.get_attr(dx).d
+        exp = 0
+        obj.get_attr(dx).val += d
+        exp += func(**kwargs)
+
+        obj.get_attr(dx).val -= 2 * d
+        exp -= func(**kwargs)
+        deriv = exp / (2 * d)
+
+        obj.get_attr(dx).val += d
+
+    elif dx in conn.fluid.is_var:
+        d = 1e-5
+
+        val = conn.fluid.val[dx]
+        if conn.fluid.val[dx] + d <= 1:
+            conn.fluid.val[dx] += d
+        else:
+            conn.fluid.val[dx] = 1
+
+        conn.build_fluid_data()
+        exp = func(**kwargs)
+
+        if conn.fluid.val[dx] - 2 * d >= 0:
+            conn.fluid.val[dx] -= 2 * d
+        else:
+            conn.fluid.val[dx] = 0
+
+        conn.build_fluid_data()
+        exp -= func(**kwargs)
+
+        conn.fluid.val[dx] = val
+        conn.build_fluid_data()
+
+        deriv = exp / (2 * d)
+
+    elif dx in ['m', 'p', 'h']:
+
+        if dx == 'm':
+            d = 1e-4
+        else:
+            d = 1e-1
+        conn.get_attr(dx).val_SI += d
+        exp = func(**kwargs)
+
+        conn.get_attr(dx).val_SI -= 2 * d
+        exp -= func(**kwargs)
+        deriv = exp / (2 * d)
+
+        conn.get_attr(dx).val_SI += d
+
+    else:
+        msg = (
+            "Your variable specification for the numerical derivative "
+            "calculation seems to be wrong. It has to be a fluid name, m, "
+            "p, h or the name of a component variable."
+        )
+        logger.exception(msg)
+        raise ValueError(msg)
+    return deriv
+
+
+def _is_variable(container, increment_filter=None):
+    # containers of connections may keep the variable flag without a column
+    # in the Jacobian, if they are not part of the variable space
+    if container.is_var and container.J_col is not None:
+        if increment_filter is None or not increment_filter[container.J_col]:
+            return True
+    return False
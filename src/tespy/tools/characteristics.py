@@ -13,16 +13,44 @@ available from its original location tespy/tools/characteristics.py
 
 SPDX-License-Identifier: MIT
 """
+import copy
 import json
 import os
+from bisect import bisect_left
 
 import numpy as np
 
 from tespy import __datapath__
 from tespy.tools import logger
+from tespy.tools.autodiff import Dual
 from tespy.tools.helpers import extend_basic_path
 
 
+def _read_only_array(value):
+    r"""
+    Return a read-only float copy of an array.
+
+    The segment data of the characteristics are calculated once, in-place
+    changes of the data arrays would therefore not be taken into account.
+    Lists and read-only float arrays are returned unchanged.
+
+    Parameters
+    ----------
+    value : object
+        Value to set as data array.
+
+    Returns
+    -------
+    value : object
+        Read-only float array if an array was passed, the value otherwise.
+    """
+    if isinstance(value, np.ndarray) and (
+            value.flags.writeable or value.dtype != float):
+        value = value.astype(float)
+        value.flags.writeable = False
+    return value
+
+
 class CharLine:
     r"""
     Class for characteristc lines.
@@ -49,7 +77,9 @@ class CharLine:
     components, see the :py:mod:`tespy.data` module. If you neither specify the
     method to use from the defaults nor specify x and y values, the
     characteristic line generated will be
-    :code:`x = [0, 1], y = [1, 1]`.
+    :code:`x = [0, 1], y = [1, 1]`. The data arrays are stored as read-only
+    copies, change the data by assigning new arrays to :code:`x` and
+    :code:`y`.
     """
 
     def __init__(
@@ -79,18 +109,70 @@ class CharLine:
         msg = 'Created characteristic line function.'
         logger.debug(msg)
 
+    def __setattr__(self, key, value):
+        if key in ['x', 'y']:
+            value = _read_only_array(value)
+        super().__setattr__(key, value)
+        if key in ['x', 'y']:
+            # segment data are set up again on next evaluation
+            super().__setattr__('_segments', None)
+
+    def __setstate__(self, state):
+        # unpickled arrays are writeable again
+        self.__dict__.update(state)
+        for key in ['x', 'y']:
+            self.__dict__[key] = _read_only_array(state[key])
+
+    def _get_segments(self):
+        r"""
+        Return the lookup table as tuples and the slopes of all segments.
+
+        Returns
+        -------
+        segments : tuple
+            x-values, y-values and slopes as tuples and the slopes as ndarray.
+        """
+        if self._segments is None:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                slopes = np.diff(self.y) / np.diff(self.x)
+            self._segments = (
+                tuple(self.x.tolist()), tuple(self.y.tolist()),
+                tuple(slopes.tolist()), slopes
+            )
+        return self._segments
+
+    def _get_segment_array(self, x):
+        r"""
+        Return the segments for an array of x-values.
+
+        Parameters
+        ----------
+        x : ndarray
+            Input values.
+
+        Returns
+        -------
+        segment : tuple
+            Index of the upper value of the segment, mask of values below and
+            mask of values above the value range.
+        """
+        xpos = np.searchsorted(self.x, x)
+        below = xpos == 0
+        above = xpos == len(self.x)
+        return np.clip(xpos, 1, len(self.x) - 1), below, above
+
     def evaluate(self, x):
         r"""
         Return characteristic line evaluation at x.
 
         Parameters
         ----------
-        x : float
-            Input value for linear interpolation.
+        x : float, ndarray
+            Input value(s) for linear interpolation.
 
         Returns
         -------
-        y : float
+        y : float, ndarray
             Evaluation of characteristic line at x.
 
         Note
@@ -109,21 +191,98 @@ class CharLine:
         upper adjacent x-value. :math:`y_0` and :math:`y_1` are the
         corresponding y-values. On extrapolation the two smallest or the two
         largest value pairs are used respectively.
+
+        Example
+        -------
+        >>> import numpy as np
+        >>> from tespy.tools.characteristics import CharLine
+        >>> line = CharLine(x=[0, 1, 2], y=[1, 2, 4])
+        >>> line.evaluate(1.5)
+        3.0
+        >>> line.evaluate(np.array([-1, 0.5, 1.5, 3]))
+        array([1. , 1.5, 3. , 4. ])
+        >>> line.extrapolate = True
+        >>> line.evaluate(np.array([-1, 3]))
+        array([0., 6.])
         """
-        xpos = np.searchsorted(self.x, x)
-        if xpos == len(self.x):
+        if isinstance(x, Dual):
+            return Dual.from_partials(
+                self.evaluate(x.val), [(self.derivative(x.val), x)]
+            )
+
+        xs, ys, slopes, slope_arr = self._segments or self._get_segments()
+        if isinstance(x, (np.ndarray, list, tuple)):
+            x = np.asarray(x, dtype=float)
+            xpos, below, above = self._get_segment_array(x)
+            y = self.y[xpos - 1] + slope_arr[xpos - 1] * (x - self.x[xpos - 1])
+            if not self.extrapolate:
+                y[below] = ys[0]
+                y[above] = ys[-1]
+            return y
+
+        xpos = bisect_left(xs, x)
+        # nan values are placed behind the value range like in numpy
+        if xpos == len(xs) or x != x:
             if self.extrapolate:
-                xpos = -1
+                xpos = len(xs) - 1
             else:
-                return float(self.y[-1])
+                return ys[-1]
         elif xpos == 0:
             if self.extrapolate:
                 xpos = 1
             else:
-                return float(self.y[0])
+                return ys[0]
+
+        return float(ys[xpos - 1] + slopes[xpos - 1] * (x - xs[xpos - 1]))
+
+    def derivative(self, x):
+        r"""
+        Return the derivative of the characteristic line at x.
 
-        yfrac = (x - self.x[xpos - 1]) / (self.x[xpos] - self.x[xpos - 1])
-        return float(self.y[xpos - 1] + yfrac * (self.y[xpos] - self.y[xpos - 1]))
+        Parameters
+        ----------
+        x : float, ndarray
+            Input value(s).
+
+        Returns
+        -------
+        dydx : float, ndarray
+            Slope of the line segment used for the evaluation at x. The slope
+            is zero outside of the value range, if :code:`extrapolate` is
+            :code:`False`.
+
+        Example
+        -------
+        >>> from tespy.tools.characteristics import CharLine
+        >>> line = CharLine(x=[0, 1, 2], y=[1, 2, 4])
+        >>> line.derivative(1.5)
+        2.0
+        >>> line.derivative([0.5, 3])
+        array([1., 0.])
+        """
+        xs, ys, slopes, slope_arr = self._segments or self._get_segments()
+        if isinstance(x, (np.ndarray, list, tuple)):
+            xpos, below, above = self._get_segment_array(
+                np.asarray(x, dtype=float)
+            )
+            dydx = slope_arr[xpos - 1]
+            if not self.extrapolate:
+                dydx[below | above] = 0
+            return dydx
+
+        xpos = bisect_left(xs, x)
+        if xpos == len(xs) or x != x:
+            if self.extrapolate:
+                xpos = len(xs) - 1
+            else:
+                return 0.0
+        elif xpos == 0:
+            if self.extrapolate:
+                xpos = 1
+            else:
+                return 0.0
+
+        return slopes[xpos - 1]
 
     def get_domain_errors(self, x, c):
         r"""
@@ -213,7 +372,9 @@ class CharMap:
     ----
     This class generates a lookup table from the given input data x, y and z,
     then performs linear interpolation. The output parameter is z to be
-    calculated as functions from x and y.
+    calculated as functions from x and y. The data arrays are stored as
+    read-only copies, change the data by assigning new arrays to :code:`x`,
+    :code:`y` and :code:`z`.
     """
 
     def __init__(self, x=np.array([0, 1]), y=np.ones((2, 2)),
@@ -252,6 +413,42 @@ class CharMap:
         msg = ('Created characteristic map function.')
         logger.debug(msg)
 
+    def __setattr__(self, key, value):
+        if key in ['x', 'y', 'z']:
+            value = _read_only_array(value)
+        super().__setattr__(key, value)
+        if key in ['x', 'y', 'z']:
+            # segment data are set up again on next evaluation
+            super().__setattr__('_segments', None)
+
+    def __setstate__(self, state):
+        # unpickled arrays are writeable again
+        self.__dict__.update(state)
+        for key in ['x', 'y', 'z']:
+            self.__dict__[key] = _read_only_array(state[key])
+
+    def _get_segments(self):
+        r"""
+        Return the first dimension values and the slopes of all segments.
+
+        Returns
+        -------
+        segments : tuple
+            x-values as tuple, the slopes of the y- and z-arrays with respect
+            to x and the rows of y, z and their slopes as tuples.
+        """
+        if self._segments is None:
+            dx = np.diff(self.x)[:, np.newaxis]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                dydx = np.diff(self.y, axis=0) / dx
+                dzdx = np.diff(self.z, axis=0) / dx
+            rows = tuple(
+                tuple(tuple(row) for row in data.tolist())
+                for data in [self.y, self.z, dydx, dzdx]
+            )
+            self._segments = (tuple(self.x.tolist()), dydx, dzdx, rows)
+        return self._segments
+
     def evaluate_x(self, x):
         r"""
         Evaluate CharMap for x inputs.
@@ -270,19 +467,18 @@ class CharMap:
         zarr : ndarray
             Output array of CharMap calculated from first dimension input.
         """
-        xpos = np.searchsorted(self.x, x)
-        if xpos == len(self.x):
-            yarr = self.y[xpos - 1]
-            zarr = self.z[xpos - 1]
+        xs, dydx, dzdx, _ = self._segments or self._get_segments()
+        xpos = bisect_left(xs, x)
+        if xpos == len(xs) or x != x:
+            return self.y[-1], self.z[-1]
         elif xpos == 0:
-            yarr = self.y[0]
-            zarr = self.z[0]
-        else:
-            yfrac = (x - self.x[xpos - 1]) / (self.x[xpos] - self.x[xpos - 1])
-            yarr = self.y[xpos - 1] + yfrac * (self.y[xpos] - self.y[xpos - 1])
-            zarr = self.z[xpos - 1] + yfrac * (self.z[xpos] - self.z[xpos - 1])
+            return self.y[0], self.z[0]
 
-        return yarr, zarr
+        dx = x - xs[xpos - 1]
+        return (
+            self.y[xpos - 1] + dx * dydx[xpos - 1],
+            self.z[xpos - 1] + dx * dzdx[xpos - 1]
+        )
 
     def evaluate_y(self, y, yarr, zarr):
         r"""
@@ -300,9 +496,9 @@ class CharMap:
         zarr : ndarray
             Output array of CharMap calculated from first dimension input.
         """
-        ypos = np.searchsorted(yarr, y)
-        if ypos == len(yarr):
-            return zarr[ypos - 1]
+        ypos = bisect_left(yarr, y)
+        if ypos == len(yarr) or y != y:
+            return zarr[-1]
         elif ypos == 0:
             return zarr[0]
         else:
@@ -316,17 +512,17 @@ class CharMap:
 
         Parameters
         ----------
-        x : float
-            Input for first dimension of CharMap.
+        x : float, ndarray
+            Input(s) for first dimension of CharMap.
 
-        y : float
-            Input for second dimension of CharMap.
+        y : float, ndarray
+            Input(s) for second dimension of CharMap.
 
         Returns
         -------
 
-        z : float
-            Resulting z value.
+        z : float, ndarray
+            Resulting z value(s).
 
         Note
         ----
@@ -345,8 +541,161 @@ class CharMap:
         .. math::
 
             z = z_0 + \frac{y-y_0}{y_1-y_0} \cdot \left(z_1-z_0 \right)
+
+        Example
+        -------
+        >>> import numpy as np
+        >>> from tespy.tools.characteristics import CharMap
+        >>> char = CharMap(
+        ...     x=[0, 1], y=[[0, 1], [0, 2]], z=[[1, 2], [1, 4]]
+        ... )
+        >>> char.evaluate(0.5, 0.75)
+        2.0
+        >>> char.evaluate(np.array([0.5, 1, 2]), np.array([0.75, 1, 3]))
+        array([2. , 2.5, 4. ])
         """
-        return float(self.evaluate_y(y, *self.evaluate_x(x)))
+        if isinstance(x, Dual) or isinstance(y, Dual):
+            x_val = x.val if isinstance(x, Dual) else x
+            y_val = y.val if isinstance(y, Dual) else y
+            dzdx, dzdy = self.gradient(x_val, y_val)
+            return Dual.from_partials(self.evaluate(x_val, y_val), [
+                (partial, arg) for partial, arg in zip((dzdx, dzdy), (x, y))
+                if isinstance(arg, Dual)
+            ])
+
+        if isinstance(x, (np.ndarray, list, tuple)) or isinstance(
+                y, (np.ndarray, list, tuple)):
+            return self._evaluate_array(x, y)
+
+        xs, _, _, (y_rows, z_rows, dydx, dzdx) = (
+            self._segments or self._get_segments()
+        )
+        xpos = bisect_left(xs, x)
+        if xpos == len(xs) or x != x:
+            return float(self.evaluate_y(y, y_rows[-1], z_rows[-1]))
+        elif xpos == 0:
+            return float(self.evaluate_y(y, y_rows[0], z_rows[0]))
+
+        dx = x - xs[xpos - 1]
+        yarr = [
+            y_0 + dx * slope
+            for y_0, slope in zip(y_rows[xpos - 1], dydx[xpos - 1])
+        ]
+        # only the z-values adjacent to y are required
+        ypos = bisect_left(yarr, y)
+        if ypos == len(yarr) or y != y:
+            ypos = len(yarr) - 1
+        elif ypos > 0:
+            z_0, z_1 = [
+                z_rows[xpos - 1][i] + dx * dzdx[xpos - 1][i]
+                for i in [ypos - 1, ypos]
+            ]
+            zfrac = (y - yarr[ypos - 1]) / (yarr[ypos] - yarr[ypos - 1])
+            return float(z_0 + zfrac * (z_1 - z_0))
+
+        return float(z_rows[xpos - 1][ypos] + dx * dzdx[xpos - 1][ypos])
+
+    def _evaluate_array(self, x, y):
+        r"""
+        Evaluate CharMap for arrays of x and y inputs.
+
+        Parameters
+        ----------
+        x : ndarray
+            Inputs for first dimension of CharMap.
+
+        y : ndarray
+            Inputs for second dimension of CharMap.
+
+        Returns
+        -------
+        z : ndarray
+            Resulting z values.
+        """
+        x, y = np.broadcast_arrays(
+            np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+        )
+        shape = x.shape
+        x, y = x.ravel(), y.ravel()
+        _, dydx, dzdx, _ = self._segments or self._get_segments()
+
+        # interpolation of the second dimension arrays for all x-values
+        xpos = np.searchsorted(self.x, x)
+        rows = np.clip(xpos, 0, len(self.x) - 1)
+        yarr, zarr = self.y[rows], self.z[rows]
+        inner = (xpos > 0) & (xpos < len(self.x))
+        seg = xpos[inner] - 1
+        dx = (x[inner] - self.x[seg])[:, np.newaxis]
+        yarr[inner] = self.y[seg] + dx * dydx[seg]
+        zarr[inner] = self.z[seg] + dx * dzdx[seg]
+
+        # number of values smaller than y equals np.searchsorted per row
+        ypos = (yarr < y[:, np.newaxis]).sum(axis=1)
+        ypos[np.isnan(y)] = yarr.shape[1]
+        num = np.arange(len(y))
+        z = np.where(ypos == 0, zarr[:, 0], zarr[:, -1])
+        inner = (ypos > 0) & (ypos < yarr.shape[1])
+        num, ypos = num[inner], ypos[inner]
+        y_0, y_1 = yarr[num, ypos - 1], yarr[num, ypos]
+        z_0, z_1 = zarr[num, ypos - 1], zarr[num, ypos]
+        z[inner] = z_0 + (y[inner] - y_0) / (y_1 - y_0) * (z_1 - z_0)
+        return z.reshape(shape)
+
+    def gradient(self, x, y):
+        r"""
+        Return the partial derivatives of the CharMap evaluation.
+
+        Parameters
+        ----------
+        x : float
+            Input for first dimension of CharMap.
+
+        y : float
+            Input for second dimension of CharMap.
+
+        Returns
+        -------
+        gradient : tuple
+            Partial derivatives of z with respect to x and y. The derivatives
+            are zero outside of the value range of the respective dimension.
+
+        Example
+        -------
+        >>> from tespy.tools.characteristics import CharMap
+        >>> char = CharMap(
+        ...     x=[0, 1], y=[[0, 1], [0, 2]], z=[[1, 2], [1, 4]]
+        ... )
+        >>> [round(value, 4) for value in char.gradient(0.5, 0.75)]
+        [0.3333, 1.3333]
+        """
+        xs, dydx, dzdx, _ = self._segments or self._get_segments()
+        xpos = bisect_left(xs, x)
+        if xpos == len(xs) or x != x or xpos == 0:
+            xpos = 0 if xpos == 0 else len(xs) - 1
+            yarr, zarr = self.y[xpos], self.z[xpos]
+            dyarr = dzarr = np.zeros(len(yarr))
+        else:
+            dyarr, dzarr = dydx[xpos - 1], dzdx[xpos - 1]
+            yarr = self.y[xpos - 1] + (x - xs[xpos - 1]) * dyarr
+            zarr = self.z[xpos - 1] + (x - xs[xpos - 1]) * dzarr
+
+        ypos = np.searchsorted(yarr, y)
+        if ypos == len(yarr) or ypos == 0:
+            ypos = min(ypos, len(yarr) - 1)
+            return float(dzarr[ypos]), 0.0
+
+        y_0, y_1 = yarr[ypos - 1], yarr[ypos]
+        z_0, z_1 = zarr[ypos - 1], zarr[ypos]
+        dzdy = (z_1 - z_0) / (y_1 - y_0)
+        # chain rule for the shift of the interpolation nodes with x
+        dzdx = (
+            dzarr[ypos - 1] - dyarr[ypos - 1] * dzdy
+            + (y - y_0) / (y_1 - y_0) * (
+                dzarr[ypos] - dzarr[ypos - 1]
+                - dzdy * (dyarr[ypos] - dyarr[ypos - 1])
+            )
+        )
+        return float(dzdx), float(dzdy)
 
     def get_domain_errors_x(self, x, c):
         r"""
@@ -478,6 +827,90 @@ class CharMap:
         plt.close(fig)
 
 
+def _load_char_library(path):
+    r"""
+    Return the parsed content of a characteristics library file.
+
+    The content is cached per process and only parsed again, if the file has
+    been modified.
+
+    Parameters
+    ----------
+    path : str
+        Path to the library file.
+
+    Returns
+    -------
+    library : dict
+        Parsed file content (:code:`'data'`) and the characteristics objects
+        created from it (:code:`'objects'`).
+    """
+    stat = os.stat(path)
+    version = (stat.st_mtime_ns, stat.st_size)
+    library = _load_char_library.cache.get(path)
+    if library is None or library["version"] != version:
+        with open(path) as f:
+            data = json.load(f)
+        library = {"version": version, "data": data, "objects": {}}
+        _load_char_library.cache[path] = library
+
+        msg = f"Loaded characteristics library from {path}."
+        logger.debug(msg)
+
+    return library
+
+
+_load_char_library.cache = {}
+
+
+def _get_shared_char(library, keys, char_type):
+    r"""
+    Return the characteristics object of a library.
+
+    The data of the characteristics are created once per library and shared
+    between all components using them, therefore they are made read-only.
+    Every call returns a new object holding references to the shared data,
+    other attributes, e.g. :code:`extrapolate`, belong to the returned object
+    only.
+
+    Parameters
+    ----------
+    library : dict
+        Library as returned by :code:`_load_char_library`.
+
+    keys : tuple
+        Keys of the characteristics in the library data.
+
+    char_type : class
+        Class to generate an instance of.
+
+    Returns
+    -------
+    obj : object
+        The characteristics (CharLine, CharMap) object.
+    """
+    key = (char_type,) + keys
+    if key not in library["objects"]:
+        data = library["data"]
+        for k in keys:
+            data = data[k]
+
+        if char_type == CharLine:
+            obj = CharLine(data['x'], data['y'])
+            arrays = [obj.x, obj.y]
+        else:
+            obj = CharMap(data['x'], data['y'], data['z'])
+            arrays = [obj.x, obj.y, obj.z]
+
+        for array in arrays:
+            array.flags.writeable = False
+        obj._get_segments()
+
+        library["objects"][key] = obj
+
+    return copy.copy(library["objects"][key])
+
+
 def load_default_char(component, parameter, function_name, char_type):
     r"""
     Load a characteristic line of map.
@@ -500,27 +933,21 @@ def load_default_char(component, parameter, function_name, char_type):
     -------
     obj : object
         The characteristics (CharLine, CharMap) object.
+
+    Note
+    ----
+    The library is loaded only once, the data of the returned object are
+    shared between all calls with the same arguments and are read-only.
     """
     if char_type == CharLine:
         path = os.path.join(__datapath__, 'char_lines.json')
     else:
         path = os.path.join(__datapath__, 'char_maps.json')
 
-    with open(path) as f:
-        data = json.load(f)
-
-    if char_type == CharLine:
-        x = data[component][parameter][function_name]['x']
-        y = data[component][parameter][function_name]['y']
-        obj = CharLine(x, y)
-
-    else:
-        x = data[component][parameter][function_name]['x']
-        y = data[component][parameter][function_name]['y']
-        z = data[component][parameter][function_name]['z']
-        obj = CharMap(x, y, z)
-
-    return obj
+    library = _load_char_library(path)
+    return _get_shared_char(
+        library, (component, parameter, function_name), char_type
+    )
 
 
 def load_custom_char(name, char_type):
@@ -539,6 +966,12 @@ def load_custom_char(name, char_type):
     -------
     obj : object
         The characteristics (CharLine, CharMap) object.
+
+    Note
+    ----
+    The library is only loaded again, if the file has been modified. The data
+    of the returned object are shared between all calls with the same
+    arguments and are read-only.
     """
     path = extend_basic_path('data')
 
@@ -548,22 +981,8 @@ def load_custom_char(name, char_type):
         path = os.path.join(path, 'char_maps.json')
 
     if os.path.isfile(path):
-
-        with open(path) as f:
-            data = json.load(f)
-
-        if char_type == CharLine:
-            x = data[name]['x']
-            y = data[name]['y']
-            obj = CharLine(x, y)
-
-        else:
-            x = data[name]['x']
-            y = data[name]['y']
-            z = data[name]['z']
-            obj = CharMap(x, y, z)
-
-        return obj
+        library = _load_char_library(path)
+        return _get_shared_char(library, (name,), char_type)
 
     else:
         msg = ('The file containing your custom charactersitics could not be '
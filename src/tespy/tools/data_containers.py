@@ -90,11 +90,8 @@ class DataContainer:
 
     def __init__(self, **kwargs):
 
-        var = self.attr()
-
         # default values
-        for key in var.keys():
-            self.__dict__.update({key: var[key]})
+        self.__dict__.update(self.attr())
 
         self.set_attr(**kwargs)
 
@@ -146,6 +143,26 @@ class DataContainer:
             logger.error(msg)
             raise KeyError(msg)
 
+    def __getstate__(self):
+        """Return the attributes deviating from the immutable defaults."""
+        defaults = self.attr()
+        state = {}
+        for key, value in self.__dict__.items():
+            if key in defaults:
+                default = defaults[key]
+                if (
+                    type(value) is type(default)
+                    and isinstance(value, (bool, int, float, str))
+                    and (value == default or value != value and default != default)
+                ) or (value is None and default is None):
+                    continue
+            state[key] = value
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(self.attr())
+        self.__dict__.update(state)
+
     @staticmethod
     def attr():
         """
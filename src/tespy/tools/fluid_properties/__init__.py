@@ -5,6 +5,8 @@ from .functions import T_mix_ph  # noqa: F401
 from .functions import T_mix_ps  # noqa: F401
 from .functions import T_sat_p  # noqa: F401
 from .functions import dh_mix_dpQ  # noqa: F401
+from .functions import dh_mix_dpT  # noqa: F401
+from .functions import dh_mix_pdT  # noqa: F401
 from .functions import dT_mix_dph  # noqa: F401
 from .functions import dT_mix_pdh  # noqa: F401
 from .functions import dT_sat_dp  # noqa: F401
@@ -13,6 +15,7 @@ from .functions import dv_mix_pdh  # noqa: F401
 from .functions import h_mix_pQ  # noqa: F401
 from .functions import h_mix_pT  # noqa: F401
 from .functions import isentropic  # noqa: F401
+from .functions import isentropic_deriv  # noqa: F401
 from .functions import s_mix_ph  # noqa: F401
 from .functions import s_mix_pT  # noqa: F401
 from .functions import v_mix_ph  # noqa: F401
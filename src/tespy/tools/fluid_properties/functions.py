@@ -11,6 +11,9 @@ tespy/tools/fluid_properties/functions.py
 SPDX-License-Identifier: MIT
 """
 
+from tespy.tools.autodiff import Dual
+from tespy.tools.autodiff import differentiable
+
 from .helpers import _check_mixing_rule
 from .helpers import get_number_of_fluids
 from .helpers import get_pure_fluid
@@ -22,9 +25,12 @@ from .mixtures import T_MIX_PH_REVERSE
 from .mixtures import T_MIX_PS_REVERSE
 from .mixtures import V_MIX_PT_DIRECT
 from .mixtures import VISCOSITY_MIX_PT_DIRECT
+from .mixtures import _water_in_mixture
 
 
 def isentropic(p_1, h_1, p_2, fluid_data, mixing_rule=None, T0=None):
+    if any(isinstance(x, Dual) for x in (p_1, h_1, p_2)):
+        return _isentropic_dual(p_1, h_1, p_2, fluid_data, mixing_rule, T0)
     if get_number_of_fluids(fluid_data) == 1:
         pure_fluid = get_pure_fluid(fluid_data)
         return pure_fluid["wrapper"].isentropic(p_1, h_1, p_2)
@@ -34,6 +40,68 @@ def isentropic(p_1, h_1, p_2, fluid_data, mixing_rule=None, T0=None):
         return h_mix_pT(p_2, T_2, fluid_data, mixing_rule)
 
 
+def isentropic_deriv(p_1, h_1, p_2, fluid_data, mixing_rule=None, T0=None):
+    r"""
+    Calculate isentropic outlet enthalpy and its partial derivatives.
+
+    The derivatives follow from :math:`dh = T \cdot ds + v \cdot dp` at inlet
+    and outlet state with :math:`s_{2,s} = s_1`. The mixture models for water
+    containing gases do not satisfy this relation, the derivatives are
+    calculated by central finite differences in that case.
+
+    .. math::
+
+        \frac{\partial h_{2,s}}{\partial p_1} =
+        -\frac{T_{2,s} \cdot v_1}{T_1}\;
+        \frac{\partial h_{2,s}}{\partial h_1} = \frac{T_{2,s}}{T_1}\;
+        \frac{\partial h_{2,s}}{\partial p_2} = v_{2,s}
+
+    Returns
+    -------
+    tuple
+        Isentropic outlet enthalpy and its derivatives with respect to inlet
+        pressure, inlet enthalpy and outlet pressure.
+    """
+    if get_number_of_fluids(fluid_data) == 1:
+        wrapper = get_pure_fluid(fluid_data)["wrapper"]
+        h_2 = wrapper.isentropic(p_1, h_1, p_2)
+        T_1 = wrapper.T_ph(p_1, h_1)
+        v_1 = 1 / wrapper.d_ph(p_1, h_1)
+        T_2 = wrapper.T_ph(p_2, h_2)
+        v_2 = 1 / wrapper.d_ph(p_2, h_2)
+    elif _water_in_mixture(fluid_data):
+        h_2 = isentropic(p_1, h_1, p_2, fluid_data, mixing_rule, T0)
+        d = 1e-1
+        derivs = []
+        for dp_1, dh_1, dp_2 in [(d, 0, 0), (0, d, 0), (0, 0, d)]:
+            upper = isentropic(
+                p_1 + dp_1, h_1 + dh_1, p_2 + dp_2, fluid_data, mixing_rule, T0
+            )
+            lower = isentropic(
+                p_1 - dp_1, h_1 - dh_1, p_2 - dp_2, fluid_data, mixing_rule, T0
+            )
+            derivs += [(upper - lower) / (2 * d)]
+        return (h_2, *derivs)
+    else:
+        T_1 = T_mix_ph(p_1, h_1, fluid_data, mixing_rule, T0)
+        s_1 = s_mix_pT(p_1, T_1, fluid_data, mixing_rule)
+        T_2 = T_mix_ps(p_2, s_1, fluid_data, mixing_rule)
+        h_2 = h_mix_pT(p_2, T_2, fluid_data, mixing_rule)
+        v_1 = v_mix_pT(p_1, T_1, fluid_data, mixing_rule)
+        v_2 = v_mix_pT(p_2, T_2, fluid_data, mixing_rule)
+
+    return h_2, -T_2 * v_1 / T_1, T_2 / T_1, v_2
+
+
+def _isentropic_dual(p_1, h_1, p_2, fluid_data, mixing_rule=None, T0=None):
+    args = [x.val if isinstance(x, Dual) else x for x in (p_1, h_1, p_2)]
+    h_2s, *partials = isentropic_deriv(*args, fluid_data, mixing_rule, T0)
+    return Dual.from_partials(h_2s, [
+        (partial, x) for partial, x in zip(partials, (p_1, h_1, p_2))
+        if isinstance(x, Dual)
+    ])
+
+
 def calc_physical_exergy(h, s, p, pamb, Tamb, fluid_data, mixing_rule=None, T0=None):
     r"""
     Calculate specific physical exergy.
@@ -85,6 +153,7 @@ def calc_chemical_exergy(pamb, Tamb, fluid_data, Chem_Ex, mixing_rule=None, T0=N
         return EXERGY_CHEMICAL[mixing_rule](pamb, Tamb, fluid_data, Chem_Ex)
 
 
+@differentiable(1e-1, 1e-1)
 def T_mix_ph(p, h, fluid_data, mixing_rule=None, T0=None):
     if get_number_of_fluids(fluid_data) == 1:
         pure_fluid = get_pure_fluid(fluid_data)
@@ -122,6 +191,7 @@ def dT_mix_ph_dfluid(p, h, fluid, fluid_data, mixing_rule=None, T0=None):
     return (upper - lower) / (2 * d)
 
 
+@differentiable(1e-1, 1e-3)
 def h_mix_pT(p, T, fluid_data, mixing_rule=None):
     if get_number_of_fluids(fluid_data) == 1:
         pure_fluid = get_pure_fluid(fluid_data)
@@ -131,6 +201,21 @@ def h_mix_pT(p, T, fluid_data, mixing_rule=None):
         return H_MIX_PT_DIRECT[mixing_rule](p, T, fluid_data)
 
 
+def dh_mix_dpT(p, T, fluid_data, mixing_rule=None):
+    d = 1e-1
+    upper = h_mix_pT(p + d, T, fluid_data, mixing_rule=mixing_rule)
+    lower = h_mix_pT(p - d, T, fluid_data, mixing_rule=mixing_rule)
+    return (upper - lower) / (2 * d)
+
+
+def dh_mix_pdT(p, T, fluid_data, mixing_rule=None):
+    d = 1e-3
+    upper = h_mix_pT(p, T + d, fluid_data, mixing_rule=mixing_rule)
+    lower = h_mix_pT(p, T - d, fluid_data, mixing_rule=mixing_rule)
+    return (upper - lower) / (2 * d)
+
+
+@differentiable(1e-1, 1e-6)
 def h_mix_pQ(p, Q, fluid_data, mixing_rule=None):
     if get_number_of_fluids(fluid_data) == 1:
         pure_fluid = get_pure_fluid(fluid_data)
@@ -147,6 +232,7 @@ def dh_mix_dpQ(p, Q, fluid_data, mixing_rule=None):
     return (upper - lower) / (2 * d)
 
 
+@differentiable(1e-1, 1e-1)
 def Q_mix_ph(p, h, fluid_data, mixing_rule=None):
     if get_number_of_fluids(fluid_data) == 1:
         pure_fluid = get_pure_fluid(fluid_data)
@@ -156,6 +242,7 @@ def Q_mix_ph(p, h, fluid_data, mixing_rule=None):
         raise ValueError(msg)
 
 
+@differentiable(1e-3)
 def p_sat_T(T, fluid_data, mixing_rule=None):
     if get_number_of_fluids(fluid_data) == 1:
         pure_fluid = get_pure_fluid(fluid_data)
@@ -165,6 +252,7 @@ def p_sat_T(T, fluid_data, mixing_rule=None):
         raise ValueError(msg)
 
 
+@differentiable(1e-2)
 def T_sat_p(p, fluid_data, mixing_rule=None):
     if get_number_of_fluids(fluid_data) == 1:
         pure_fluid = get_pure_fluid(fluid_data)
@@ -181,6 +269,7 @@ def dT_sat_dp(p, fluid_data, mixing_rule=None):
     return (upper - lower) / (2 * d)
 
 
+@differentiable(1e-1, 1e-1)
 def s_mix_ph(p, h, fluid_data, mixing_rule=None, T0=None):
     if get_number_of_fluids(fluid_data) == 1:
         pure_fluid = get_pure_fluid(fluid_data)
@@ -191,6 +280,7 @@ def s_mix_ph(p, h, fluid_data, mixing_rule=None, T0=None):
 
 
 
+@differentiable(1e-1, 1e-3)
 def s_mix_pT(p, T, fluid_data, mixing_rule=None):
     if get_number_of_fluids(fluid_data) == 1:
         pure_fluid = get_pure_fluid(fluid_data)
@@ -200,6 +290,7 @@ def s_mix_pT(p, T, fluid_data, mixing_rule=None):
         return S_MIX_PT_DIRECT[mixing_rule](p, T, fluid_data)
 
 
+@differentiable(1e-1, 1e-3)
 def T_mix_ps(p, s, fluid_data, mixing_rule=None, T0=None):
     if get_number_of_fluids(fluid_data) == 1:
         pure_fluid = get_pure_fluid(fluid_data)
@@ -213,6 +304,7 @@ def T_mix_ps(p, s, fluid_data, mixing_rule=None, T0=None):
         return inverse_temperature_mixture(**kwargs)
 
 
+@differentiable(1e-1, 1e-1)
 def v_mix_ph(p, h, fluid_data, mixing_rule=None, T0=None):
     if get_number_of_fluids(fluid_data) == 1:
         pure_fluid = get_pure_fluid(fluid_data)
@@ -225,17 +317,18 @@ def v_mix_ph(p, h, fluid_data, mixing_rule=None, T0=None):
 def dv_mix_dph(p, h, fluid_data, mixing_rule=None, T0=None):
     d = 1e-1
     upper = v_mix_ph(p + d, h, fluid_data, mixing_rule=mixing_rule, T0=T0)
-    lower = v_mix_ph(p - d, h, fluid_data, mixing_rule=mixing_rule, T0=upper)
+    lower = v_mix_ph(p - d, h, fluid_data, mixing_rule=mixing_rule, T0=T0)
     return (upper - lower) / (2 * d)
 
 
 def dv_mix_pdh(p, h, fluid_data, mixing_rule=None, T0=None):
     d = 1e-1
     upper = v_mix_ph(p, h + d, fluid_data, mixing_rule=mixing_rule, T0=T0)
-    lower = v_mix_ph(p, h - d, fluid_data, mixing_rule=mixing_rule, T0=upper)
+    lower = v_mix_ph(p, h - d, fluid_data, mixing_rule=mixing_rule, T0=T0)
     return (upper - lower) / (2 * d)
 
 
+@differentiable(1e-1, 1e-3)
 def v_mix_pT(p, T, fluid_data, mixing_rule=None):
     if get_number_of_fluids(fluid_data) == 1:
         pure_fluid = get_pure_fluid(fluid_data)
@@ -245,6 +338,7 @@ def v_mix_pT(p, T, fluid_data, mixing_rule=None):
         return V_MIX_PT_DIRECT[mixing_rule](p, T, fluid_data)
 
 
+@differentiable(1e-1, 1e-1)
 def viscosity_mix_ph(p, h, fluid_data, mixing_rule=None, T0=None):
     if get_number_of_fluids(fluid_data) == 1:
         pure_fluid = get_pure_fluid(fluid_data)
@@ -254,6 +348,7 @@ def viscosity_mix_ph(p, h, fluid_data, mixing_rule=None, T0=None):
         return viscosity_mix_pT(p, T, fluid_data, mixing_rule)
 
 
+@differentiable(1e-1, 1e-3)
 def viscosity_mix_pT(p, T, fluid_data, mixing_rule=None):
     if get_number_of_fluids(fluid_data) == 1:
         pure_fluid = get_pure_fluid(fluid_data)
@@ -262,6 +262,98 @@ def darcy_friction_factor(re, ks, d):
             )
 
 
+def darcy_friction_factor_array(re, ks, d):
+    r"""
+    Calculate the Darcy friction factor for arrays of hydraulic states.
+
+    The flow regimes and correlations are identical to
+    :py:func:`tespy.tools.fluid_properties.helpers.darcy_friction_factor`.
+    The implicit equations of Prandtl and v. Kármán and of Colebrook and
+    White are solved for all elements simultaneously by a Newton iteration on
+    :math:`\frac{1}{\sqrt{\lambda}}`.
+
+    Parameters
+    ----------
+    re : ndarray
+        Reynolds numbers re / 1.
+
+    ks : ndarray
+        Pipe roughness ks / m.
+
+    d : ndarray
+        Pipe diameter/characteristic lenght d / m.
+
+    Returns
+    -------
+    darcy_friction_factor : ndarray
+        Darcy friction factors :math:`\lambda` / 1
+
+    Example
+    -------
+    >>> import numpy as np
+    >>> from tespy.tools.fluid_properties.helpers import (
+    ...     darcy_friction_factor_array)
+    >>> re = np.array([2000, 5000, 70000, 70000, 1000000, 6000000])
+    >>> ks = np.array([5e-5, 5e-5, 5e-5, 1e-3, 5e-5, 1e-5])
+    >>> d = np.array([0.05, 0.05, 0.05, 0.05, 0.8, 1])
+    >>> lam = darcy_friction_factor_array(re, ks, d)
+    >>> [round(float(x), 3) for x in lam]
+    [0.032, 0.038, 0.023, 0.049, 0.012, 0.009]
+    """
+    re, ks, d = np.broadcast_arrays(
+        np.asarray(re, dtype=float), np.asarray(ks, dtype=float),
+        np.asarray(d, dtype=float)
+    )
+    lam = np.empty(re.shape)
+
+    laminar = re <= 2320
+    lam[laminar] = 64 / re[laminar]
+
+    smooth = ~laminar & (re * ks / d < 65)
+    mask = smooth & (re <= 1e4)
+    lam[mask] = 0.3164 * re[mask] ** (-0.25)
+    mask = smooth & (re > 1e4) & (re < 1e6)
+    lam[mask] = (1.8 * np.log10(re[mask]) - 1.5) ** (-2)
+
+    # x = 1 / sqrt(lambda) for the implicit correlations
+    mask = smooth & (re >= 1e6)
+    if mask.any():
+        log_re = np.log10(re[mask])
+
+        def residual(x):
+            return x - 2 * (log_re - np.log10(x)) + 0.8
+
+        def derivative(x):
+            return 1 + 2 / (x * math.log(10))
+
+        lam[mask] = _solve_friction_factor(residual, derivative)
+
+    mask = ~laminar & ~smooth
+    if mask.any():
+        a = 2.51 / re[mask]
+        b = ks[mask] / (3.71 * d[mask])
+
+        def residual(x):
+            return x + 2 * np.log10(a * x + b)
+
+        def derivative(x):
+            return 1 + 2 * a / ((a * x + b) * math.log(10))
+
+        lam[mask] = _solve_friction_factor(residual, derivative)
+
+    return lam
+
+
+def _solve_friction_factor(residual, derivative, max_iter=50):
+    x = np.full(residual(np.ones(1)).shape, 1 / 0.02 ** 0.5)
+    for _ in range(max_iter):
+        r = residual(x)
+        if np.all(np.abs(r) < ERR ** 2):
+            break
+        x = np.clip(x - r / derivative(x), 1 / 0.2 ** 0.5, 100)
+    return 1 / x ** 2
+
+
 def blasius(re):
     """
     Calculate friction coefficient according to Blasius.
@@ -55,6 +55,28 @@ class FluidPropertyWrapper:
         else:
             self._fractions = None
 
+    def _get_state_key(self):
+        """Return the arguments defining the complete state of the wrapper.
+
+        Only wrapper classes setting :code:`_state_from_arguments` in their
+        own class body are completely defined by the fluid and the back end,
+        for all other wrappers :code:`None` is returned.
+        """
+        if not type(self).__dict__.get("_state_from_arguments", False):
+            return None
+        fluid = self.fluid
+        if self._fractions is not None:
+            fluid = f"{fluid}[{self._fractions}]"
+        return fluid, self.back_end
+
+    def __reduce_ex__(self, protocol):
+        # wrappers defined by their arguments are constructed again instead
+        # of pickling their (back end specific) internal state
+        key = self._get_state_key()
+        if key is None:
+            return super().__reduce_ex__(protocol)
+        return (self.__class__, key)
+
     def _not_implemented(self) -> None:
         raise NotImplementedError(
             f"Method is not implemented for {self.__class__.__name__}."
@@ -118,6 +140,8 @@ class FluidPropertyWrapper:
 @wrapper_registry
 class CoolPropWrapper(FluidPropertyWrapper):
 
+    _state_from_arguments = True
+
     def __init__(self, fluid, back_end=None) -> None:
         """Wrapper for CoolProp.CoolProp.AbstractState instance calls
 
@@ -261,6 +285,7 @@ class CoolPropWrapper(FluidPropertyWrapper):
 @wrapper_registry
 class IAPWSWrapper(FluidPropertyWrapper):
 
+    _state_from_arguments = True
 
     def __init__(self, fluid, back_end=None) -> None:
         """Wrapper for iapws library calls
@@ -380,6 +405,8 @@ class IAPWSWrapper(FluidPropertyWrapper):
 @wrapper_registry
 class PyromatWrapper(FluidPropertyWrapper):
 
+    _state_from_arguments = True
+
     def __init__(self, fluid, back_end=None) -> None:
         """_summary_
 
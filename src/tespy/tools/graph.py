@@ -0,0 +1,194 @@
+# -*- coding: utf-8
+
+"""Module for the structural analysis of the equation system.
+
+The functions operate on the sparsity pattern of the Jacobian matrix, which is
+given as list of the columns (variables) appearing in each row (equation).
+
+
+This file is part of project TESPy (github.com/oemof/tespy). It's copyrighted
+by the contributors recorded in the version control history of the file,
+available from its original location tespy/tools/graph.py
+
+SPDX-License-Identifier: MIT
+"""
+
+
+def maximum_matching(row_columns, num_columns):
+    r"""
+    Match every row to a distinct column it contains.
+
+    Parameters
+    ----------
+    row_columns : list
+        Columns appearing in each row.
+
+    num_columns : int
+        Number of columns.
+
+    Returns
+    -------
+    matching : list
+        Column matched to each row, :code:`None` for unmatched rows.
+
+    Example
+    -------
+    >>> from tespy.tools.graph import maximum_matching
+    >>> maximum_matching([[0, 1], [0], [1, 2]], 3)
+    [1, 0, 2]
+    """
+    row_match = [None] * len(row_columns)
+    column_match = [None] * num_columns
+
+    # cheap initial assignment
+    for row, columns in enumerate(row_columns):
+        for col in columns:
+            if column_match[col] is None:
+                row_match[row] = col
+                column_match[col] = row
+                break
+
+    # augmenting paths by depth first search
+    for root in range(len(row_columns)):
+        if row_match[root] is not None:
+            continue
+        visited = set()
+        parent = {}
+        stack = [root]
+        end = None
+        while stack and end is None:
+            row = stack.pop()
+            for col in row_columns[row]:
+                if col in visited:
+                    continue
+                visited.add(col)
+                parent[col] = row
+                if column_match[col] is None:
+                    end = col
+                    break
+                stack.append(column_match[col])
+
+        # flip the matching along the augmenting path
+        col = end
+        while col is not None:
+            row = parent[col]
+            previous = row_match[row]
+            row_match[row] = col
+            column_match[col] = row
+            col = previous
+
+    return row_match
+
+
+def strongly_connected_components(adjacency):
+    r"""
+    Find the strongly connected components of a directed graph (Tarjan).
+
+    Parameters
+    ----------
+    adjacency : list
+        Successors of each node.
+
+    Returns
+    -------
+    components : list
+        Lists of nodes of each strongly connected component. A component is
+        listed after all components reachable from it.
+
+    Example
+    -------
+    >>> from tespy.tools.graph import strongly_connected_components
+    >>> strongly_connected_components([[1], [0, 2], [], [2]])
+    [[2], [0, 1], [3]]
+    """
+    index = {}
+    lowlink = {}
+    on_stack = set()
+    stack = []
+    components = []
+    counter = 0
+
+    for start in range(len(adjacency)):
+        if start in index:
+            continue
+        work = [(start, 0)]
+        while work:
+            node, pos = work.pop()
+            if pos == 0:
+                index[node] = lowlink[node] = counter
+                counter += 1
+                stack.append(node)
+                on_stack.add(node)
+
+            successors = adjacency[node]
+            while pos < len(successors):
+                successor = successors[pos]
+                pos += 1
+                if successor not in index:
+                    work.append((node, pos))
+                    work.append((successor, 0))
+                    break
+                elif successor in on_stack:
+                    lowlink[node] = min(lowlink[node], index[successor])
+            else:
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.remove(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(sorted(component))
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+    return components
+
+
+def block_triangular_decomposition(row_columns, num_columns):
+    r"""
+    Decompose a square equation system into irreducible blocks.
+
+    The rows are matched to columns (maximum matching) and the strongly
+    connected components of the resulting dependency graph form the blocks
+    of the block triangular form (Dulmage-Mendelsohn decomposition).
+
+    Parameters
+    ----------
+    row_columns : list
+        Columns appearing in each row.
+
+    num_columns : int
+        Number of columns.
+
+    Returns
+    -------
+    blocks : list
+        Tuples of rows and matched columns of each block in the order the
+        blocks can be solved sequentially. :code:`None`, if the system is
+        structurally singular.
+
+    Example
+    -------
+    Two equations only depend on the variables 0 and 1, the third equation
+    couples variable 2 to variable 1.
+
+    >>> from tespy.tools.graph import block_triangular_decomposition
+    >>> block_triangular_decomposition([[0, 1], [0, 1], [1, 2]], 3)
+    [([0, 1], [0, 1]), ([2], [2])]
+    """
+    matching = maximum_matching(row_columns, num_columns)
+    if None in matching:
+        return None
+
+    column_row = {col: row for row, col in enumerate(matching)}
+    adjacency = [
+        [column_row[col] for col in columns if column_row[col] != row]
+        for row, columns in enumerate(row_columns)
+    ]
+    return [
+        (rows, [matching[row] for row in rows])
+        for rows in strongly_connected_components(adjacency)
+    ]
@@ -11,6 +11,7 @@ SPDX-License-Identifier: MIT
 
 import json
 import os
+import pickle
 from collections.abc import Mapping
 from copy import deepcopy
 
@@ -18,10 +19,45 @@ import CoolProp.CoolProp as CP
 
 from tespy import __datapath__
 from tespy.tools import logger
+from tespy.tools.autodiff import _numeric_deriv
+from tespy.tools.autodiff import evaluate_dual
 from tespy.tools.global_vars import ERR
 from tespy.tools.global_vars import fluid_property_data
 
 
+def _shared_object(key):
+    """Placeholder resolved by _SharedObjectUnpickler for shared objects."""
+    raise RuntimeError(
+        "Shared objects can only be restored by the _SharedObjectUnpickler."
+    )
+
+
+class _SharedObjectPickler(pickle.Pickler):
+    """Pickler storing references to shared objects instead of copies."""
+
+    def __init__(self, file, shared):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.shared = shared
+
+    def reducer_override(self, obj):
+        if id(obj) in self.shared:
+            return _shared_object, (id(obj),)
+        return NotImplemented
+
+
+class _SharedObjectUnpickler(pickle.Unpickler):
+    """Unpickler resolving the references of a _SharedObjectPickler."""
+
+    def __init__(self, file, shared):
+        super().__init__(file)
+        self.shared = shared
+
+    def find_class(self, module, name):
+        if module == __name__ and name == "_shared_object":
+            return self.shared.__getitem__
+        return super().find_class(module, name)
+
+
 def get_all_subdictionaries(data):
     subdictionaries = []
     for value in data.values():
@@ -39,17 +75,33 @@ def get_all_subdictionaries(data):
 
 
 def get_chem_ex_lib(name):
-    """Return a new dictionary by merging two dictionaries recursively."""
-    path = os.path.join(__datapath__, "ChemEx", f"{name}.json")
-    with open(path, "r") as f:
-        return json.load(f)
+    """Return the chemical exergy library, the data are loaded only once.
+
+    The returned dictionary is shared between all calls, do not modify it.
+    """
+    if name not in get_chem_ex_lib.cache:
+        path = os.path.join(__datapath__, "ChemEx", f"{name}.json")
+        with open(path, "r") as f:
+            get_chem_ex_lib.cache[name] = json.load(f)
+    return get_chem_ex_lib.cache[name]
+
+
+get_chem_ex_lib.cache = {}
 
 
 def fluidalias_in_list(fluid, fluid_list):
-    aliases = [alias.replace(' ', '') for alias in CP.get_aliases(fluid)]
+    # the aliases of a fluid are only looked up once per process
+    if fluid not in fluidalias_in_list.aliases:
+        fluidalias_in_list.aliases[fluid] = [
+            alias.replace(' ', '') for alias in CP.get_aliases(fluid)
+        ]
+    aliases = fluidalias_in_list.aliases[fluid]
     return any(alias in fluid_list for alias in aliases)
 
 
+fluidalias_in_list.aliases = {}
+
+
 def merge_dicts(dict1, dict2):
     """Return a new dictionary by merging two dictionaries recursively."""
 
@@ -178,7 +230,11 @@ class UserDefinedEquation:
             Equation to evaluate.
 
         deriv : function
-            Partial derivatives of the equation.
+            Partial derivatives of the equation. If :code:`None`, the
+            residual and the partial derivatives are calculated in a single
+            evaluation of the equation with dual numbers, the derivatives of
+            the fluid properties by finite differences, see
+            :py:mod:`tespy.tools.autodiff`.
 
         conns : list
             List of connections used by the function.
@@ -328,6 +384,24 @@ class UserDefinedEquation:
         >>> nw.solve('design')
         >>> round(inflow.v.val, 3)
         0.067
+
+        Instead of implementing the derivatives, they can be calculated with
+        dual numbers passing :code:`None` as derivative. The equation is
+        evaluated with dual numbers, which carry the partial derivatives with
+        respect to all variables. The fluid property functions return partial
+        derivatives calculated by finite differences, the characteristics their
+        exact slopes. Mathematical functions accepting dual numbers are
+        available in the :py:mod:`tespy.tools.autodiff` module, equations using
+        e.g. the :code:`math` module are differentiated by finite differences.
+
+        >>> nw.del_ude(my_ude)
+        >>> my_ude = UserDefinedEquation(
+        ...    'myudelabel', myfunc, None, [inflow, outflow],
+        ...    params={'char': char})
+        >>> nw.add_ude(my_ude)
+        >>> nw.solve('design')
+        >>> round(inflow.v.val, 3)
+        0.067
         """
         if isinstance(label, str):
             self.label = label
@@ -368,107 +442,61 @@ class UserDefinedEquation:
             raise TypeError(msg)
 
     def solve(self):
+        if self.deriv is None:
+            self.residual, self.jacobian = evaluate_dual(
+                self, self.func, self.conns, ude=self
+            )
+        else:
+            self.residual = self.func(self)
+            self.deriv(self)
+
+    def evaluate_residuals(self):
+        """
+        Calculate the residual value of the equation only.
+
+        Returns
+        -------
+        residual : float
+            Residual value of the user defined equation.
+        """
         self.residual = self.func(self)
-        self.deriv(self)
+        return self.residual
 
     def numeric_deriv(self, dx, conn):
         r"""
         Calculate partial derivative of the user defined function to dx.
 
-        For details see :py:func:`tespy.tools.helpers._numeric_deriv`
+        For details see :py:func:`tespy.tools.autodiff._numeric_deriv`
         """
         return _numeric_deriv(self, self.func, dx, conn, ude=self)
 
 
-def _numeric_deriv(obj, func, dx, conn=None, **kwargs):
+def combine_derivatives(*terms):
     r"""
-    Calculate partial derivative of the function func to dx.
+    Calculate the weighted sum of partial derivatives.
 
     Parameters
     ----------
-    obj : object
-        Instance, which provides the equation to calculate the derivative for.
-
-    func : function
-        Function :math:`f` to calculate the partial derivative for.
-
-    dx : str
-        Partial derivative.
-
-    conn : tespy.connections.connection.Connection
-        Connection to calculate the numeric derivative for.
+    terms : tuple
+        Factor and dictionary of partial derivatives with the column of the
+        variable in the Jacobian matrix as key.
 
     Returns
     -------
-    deriv : float/list
-        Partial derivative(s) of the function :math:`f` to variable(s)
-        :math:`x`.
-
-        .. math::
+    derivatives : dict
+        Sum of the partial derivatives.
 
-            \frac{\partial f}{\partial x} = \frac{f(x + d) + f(x - d)}{2 d}
+    Example
+    -------
+    >>> from tespy.tools.helpers import combine_derivatives
+    >>> combine_derivatives((1, {0: 2, 1: 1}), (-2, {1: 0.5, 3: 1}))
+    {0: 2, 1: 0.0, 3: -2}
     """
-    if conn is None:
-        d = obj.get_attr(dx).d
-        exp = 0
-        obj.get_attr(dx).val += d
-        exp += func(**kwargs)
-
-        obj.get_attr(dx).val -= 2 * d
-        exp -= func(**kwargs)
-        deriv = exp / (2 * d)
-
-        obj.get_attr(dx).val += d
-
-    elif dx in conn.fluid.is_var:
-        d = 1e-5
-
-        val = conn.fluid.val[dx]
-        if conn.fluid.val[dx] + d <= 1:
-            conn.fluid.val[dx] += d
-        else:
-            conn.fluid.val[dx] = 1
-
-        conn.build_fluid_data()
-        exp = func(**kwargs)
-
-        if conn.fluid.val[dx] - 2 * d >= 0:
-            conn.fluid.val[dx] -= 2 * d
-        else:
-            conn.fluid.val[dx] = 0
-
-        conn.build_fluid_data()
-        exp -= func(**kwargs)
-
-        conn.fluid.val[dx] = val
-        conn.build_fluid_data()
-
-        deriv = exp / (2 * d)
-
-    elif dx in ['m', 'p', 'h']:
-
-        if dx == 'm':
-            d = 1e-4
-        else:
-            d = 1e-1
-        conn.get_attr(dx).val_SI += d
-        exp = func(**kwargs)
-
-        conn.get_attr(dx).val_SI -= 2 * d
-        exp -= func(**kwargs)
-        deriv = exp / (2 * d)
-
-        conn.get_attr(dx).val_SI += d
-
-    else:
-        msg = (
-            "Your variable specification for the numerical derivative "
-            "calculation seems to be wrong. It has to be a fluid name, m, "
-            "p, h or the name of a component variable."
-        )
-        logger.exception(msg)
-        raise ValueError(msg)
-    return deriv
+    derivatives = {}
+    for factor, partial_derivatives in terms:
+        for col, value in partial_derivatives.items():
+            derivatives[col] = derivatives.get(col, 0) + factor * value
+    return derivatives
 
 
 def bus_char_evaluation(component_value, char_func, reference_value, bus_value, **kwargs):
@@ -503,12 +531,21 @@ def bus_char_evaluation(component_value, char_func, reference_value, bus_value,
 
 
 def bus_char_derivative(component_value, char_func, reference_value, bus_value, **kwargs):
-    """Calculate derivative for bus char evaluation."""
-    d = 1e-3
-    return (1 - (
-        1 / char_func.evaluate((bus_value + d) / reference_value) -
-        1 / char_func.evaluate((bus_value - d) / reference_value)
-    ) / (2 * d))
+    r"""
+    Calculate derivative for bus char evaluation.
+
+    .. math::
+
+        \frac{\partial residual}{\partial \dot{E}_\mathrm{bus}} = 1 +
+        \frac{\dot{E}_\mathrm{component} \cdot f'\left(X\right)}
+        {\dot{E}_\mathrm{bus,ref} \cdot f\left(X\right)^2}\;
+        X = \frac{\dot{E}_\mathrm{bus}}{\dot{E}_\mathrm{bus,ref}}
+    """
+    expr = bus_value / reference_value
+    return 1 + (
+        component_value * char_func.derivative(expr)
+        / (reference_value * char_func.evaluate(expr) ** 2)
+    )
 
 
 def newton_with_kwargs(
@@ -0,0 +1,259 @@
+# -*- coding: utf-8
+
+"""Module for streaming simulation results to disk.
+
+The :py:class:`tespy.tools.results_sink.ResultsSink` appends selected results
+of a network after every call of the :code:`solve` method to a file. Use
+:py:func:`tespy.tools.results_sink.read_results` to read the results, also
+while the simulation is still running.
+
+
+This file is part of project TESPy (github.com/oemof/tespy). It's copyrighted
+by the contributors recorded in the version control history of the file,
+available from its original location tespy/tools/results_sink.py
+
+SPDX-License-Identifier: MIT
+"""
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from tespy.tools import logger
+
+
+class ResultsSink:
+    r"""
+    Append selected results of a network to a file after each simulation.
+
+    The results are stored in a folder containing two files:
+
+    - header.json: The names of the columns.
+    - data.bin: The values of all simulations as rows of float64 values. New
+      rows are only appended, the file can be memory mapped with the shape
+      (number of rows, number of columns).
+
+    Results are buffered and written to the file in chunks of
+    :code:`batch_size` rows, the remaining rows are written on calling the
+    :code:`flush` or the :code:`close` method.
+
+    Parameters
+    ----------
+    path : str
+        Path of the folder to write the results to. Existing results in this
+        path are overwritten.
+
+    connections : dict
+        Connection labels (keys) and list of parameters (values) to store,
+        e.g. :code:`{'1': ['m', 'T']}`. Fluid mass fractions are available by
+        the name of the fluid.
+
+    components : dict
+        Component labels (keys) and list of parameters (values) to store, e.g.
+        :code:`{'turbine': ['P', 'eta_s']}`.
+
+    busses : list
+        List of bus labels to store the total bus value of.
+
+    batch_size : int
+        Number of simulations to buffer before writing to the file, default:
+        100.
+
+    Note
+    ----
+    Every call of the :code:`solve` method adds a row, also if the simulation
+    did not converge. The column :code:`('Network', 'converged', '')` indicates,
+    whether the values of a row are valid.
+
+    Example
+    -------
+    Create a simple network and store the outlet temperature and the heat of
+    a heat exchanger for a set of different heat inputs.
+
+    >>> import shutil
+    >>> from tespy.components import Sink, Source, SimpleHeatExchanger
+    >>> from tespy.connections import Connection
+    >>> from tespy.networks import Network
+    >>> from tespy.tools import ResultsSink, read_results
+    >>> nw = Network(T_unit='C', p_unit='bar', iterinfo=False)
+    >>> so = Source('source')
+    >>> si = Sink('sink')
+    >>> hx = SimpleHeatExchanger('heater', pr=1)
+    >>> c1 = Connection(so, 'out1', hx, 'in1', label='1')
+    >>> c2 = Connection(hx, 'out1', si, 'in1', label='2')
+    >>> nw.add_conns(c1, c2)
+    >>> c1.set_attr(fluid={'water': 1}, m=1, p=5, T=20)
+    >>> nw.results_sink = ResultsSink(
+    ...     'tmp_results', connections={'2': ['T']},
+    ...     components={'heater': ['Q']}, batch_size=2
+    ... )
+    >>> for Q in [1e5, 2e5, 3e5]:
+    ...     hx.set_attr(Q=Q)
+    ...     nw.solve('design')
+    >>> nw.results_sink.close()
+    >>> df = read_results('tmp_results')
+    >>> df.shape
+    (3, 3)
+    >>> float(round(df[('Connection', '2', 'T')].iloc[0], 1))
+    43.9
+    >>> list(df[('Component', 'heater', 'Q')])
+    [100000.0, 200000.0, 300000.0]
+    >>> shutil.rmtree('tmp_results', ignore_errors=True)
+    """
+
+    def __init__(self, path, connections=None, components=None, busses=None,
+                 batch_size=100):
+
+        if connections is None:
+            connections = {}
+        if components is None:
+            components = {}
+        if busses is None:
+            busses = []
+
+        if not isinstance(batch_size, int) or batch_size < 1:
+            msg = "The batch_size of a ResultsSink must be a positive integer."
+            logger.error(msg)
+            raise ValueError(msg)
+
+        self.path = path
+        self.connections = connections
+        self.components = components
+        self.busses = busses
+        self.batch_size = batch_size
+
+        self.columns = [("Network", "converged", "")]
+        self.columns += [
+            ("Connection", label, param)
+            for label, params in connections.items() for param in params
+        ]
+        self.columns += [
+            ("Component", label, param)
+            for label, params in components.items() for param in params
+        ]
+        self.columns += [("Bus", label, "P") for label in busses]
+
+        self._buffer = []
+        self.num_rows = 0
+
+        os.makedirs(path, exist_ok=True)
+        with open(os.path.join(path, "header.json"), "w") as f:
+            json.dump({"columns": self.columns, "dtype": "float64"}, f)
+
+        # start with an empty data file
+        open(os.path.join(path, "data.bin"), "wb").close()
+
+        msg = f"Created results sink with {len(self.columns)} columns in {path}."
+        logger.debug(msg)
+
+    def write(self, nw):
+        r"""
+        Append the current results of a network.
+
+        Parameters
+        ----------
+        nw : tespy.networks.network.Network
+            Network to take the results from.
+        """
+        row = [float(nw.converged)]
+        for label, params in self.connections.items():
+            c = self._get_object(nw.conns, label, "Connection")
+            for param in params:
+                if param in c.property_data:
+                    row += [c.get_attr(param).val]
+                else:
+                    row += [c.fluid.val.get(param, np.nan)]
+
+        for label, params in self.components.items():
+            cp = self._get_object(nw.comps, label, "Component")
+            row += [cp.get_attr(param).val for param in params]
+
+        for label in self.busses:
+            if label not in nw.busses:
+                msg = f"Bus with label {label} not found."
+                logger.error(msg)
+                raise KeyError(msg)
+            row += [nw.busses[label].P.val]
+
+        self._buffer += [row]
+        self.num_rows += 1
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    @staticmethod
+    def _get_object(df, label, object_type):
+        try:
+            return df.loc[label, "object"]
+        except KeyError:
+            msg = f"{object_type} with label {label} not found."
+            logger.error(msg)
+            raise KeyError(msg)
+
+    def flush(self):
+        r"""Write the buffered results to the data file."""
+        if len(self._buffer) == 0:
+            return
+
+        data = np.asarray(self._buffer, dtype=np.float64)
+        with open(os.path.join(self.path, "data.bin"), "ab") as f:
+            f.write(data.tobytes())
+
+        msg = f"Wrote {len(self._buffer)} rows to results sink {self.path}."
+        logger.debug(msg)
+        self._buffer = []
+
+    def close(self):
+        r"""Write the remaining buffered results."""
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def read_results(path, memory_map=False):
+    r"""
+    Read the results written by a ResultsSink.
+
+    Only rows, which have been written completely, are read. Therefore, the
+    results can be read while a simulation is still running.
+
+    Parameters
+    ----------
+    path : str
+        Path of the results folder.
+
+    memory_map : boolean
+        Return the memory mapped array of the data file instead of a
+        DataFrame, default: False.
+
+    Returns
+    -------
+    results : pandas.DataFrame, numpy.memmap
+        Results with one row per simulation and a column MultiIndex of object
+        type, label and parameter.
+    """
+    with open(os.path.join(path, "header.json"), "r") as f:
+        header = json.load(f)
+
+    columns = [tuple(col) for col in header["columns"]]
+    dtype = np.dtype(header["dtype"])
+    fn = os.path.join(path, "data.bin")
+    num_rows = os.path.getsize(fn) // (dtype.itemsize * len(columns))
+
+    if num_rows == 0:
+        data = np.empty((0, len(columns)), dtype=dtype)
+    else:
+        data = np.memmap(
+            fn, dtype=dtype, mode="r", shape=(num_rows, len(columns))
+        )
+
+    if memory_map:
+        return data
+
+    return pd.DataFrame(
+        np.array(data), columns=pd.MultiIndex.from_tuples(columns)
+    )
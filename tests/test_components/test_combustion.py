@@ -17,9 +17,11 @@ from tespy.components import CombustionEngine
 from tespy.components import DiabaticCombustionChamber
 from tespy.components import Sink
 from tespy.components import Source
+from tespy.components.combustion.base import reference_enthalpy
 from tespy.connections import Bus
 from tespy.connections import Connection
 from tespy.networks import Network
+from tespy.tools.fluid_properties import h_mix_pT
 
 
 class TestCombustion:
@@ -117,6 +119,81 @@ class TestCombustion:
         self.nw._convergence_check()
         assert self.c3.T.val_SI == pytest.approx(2110, abs=0.1)
 
+    def test_CombustionChamber_reference_enthalpy(self):
+        """Test cached reference enthalpies against direct evaluation."""
+        instance = CombustionChamber('combustion chamber')
+        self.setup_CombustionChamber_network(instance)
+
+        air = {'N2': 0.7556, 'O2': 0.2315, 'Ar': 0.0129}
+        fuel = {'CO2': 0.04, 'CH4': 0.96}
+        self.c1.set_attr(fluid=air, p=1, T=30, m=10)
+        self.c2.set_attr(fluid=fuel, T=30)
+        instance.set_attr(lamb=2)
+        self.nw.solve('design')
+        self.nw._convergence_check()
+
+        for c in [self.c1, self.c2, self.c3]:
+            h_ref = h_mix_pT(
+                1e5, 298.15, c.fluid_data, mixing_rule="forced-gas"
+            )
+            msg = (
+                f'Reference enthalpy at {c.label} must be {h_ref}, is '
+                f'{reference_enthalpy(c.fluid_data)}.'
+            )
+            assert reference_enthalpy(c.fluid_data) == h_ref, msg
+
+        fuels = instance.fuels
+        fuels['CH4']['LHV'] = 0
+        instance.setup_reaction_parameters()
+        msg = 'Modifying the fuel data of a component must not alter the cache.'
+        assert instance.fuels['CH4']['LHV'] > 0, msg
+
+    def test_CombustionChamber_stoichiometry_deriv(self):
+        """Test analytic derivatives of the reaction balance equations."""
+        instance = CombustionChamber('combustion chamber')
+        self.setup_CombustionChamber_network(instance)
+
+        air = {'N2': 0.7556, 'O2': 0.2315, 'Ar': 0.0129}
+        fuel = {'CO2': 0.04, 'CH4': 0.76, 'H2': 0.2}
+        self.c1.set_attr(fluid=air, p=1, T=30, m=10)
+        self.c2.set_attr(fluid=fuel, T=30)
+        instance.set_attr(lamb=1.5)
+        self.nw.solve('design')
+        self.nw._convergence_check()
+
+        for lamb in [1.5, None]:
+            if lamb is None:
+                self.c3.set_attr(T=1200)
+                instance.set_attr(lamb=None)
+                self.nw.solve('design')
+                self.nw._convergence_check()
+
+            instance.jacobian = {}
+            instance.stoichiometry_deriv(None, 0)
+            for eq_num, fluid in enumerate(instance.fluid_eqs_list):
+                for c in [self.c2, self.c3]:
+                    variables = ['m'] + [
+                        f for f in c.fluid.is_var
+                        # numerical derivative is inaccurate at the bounds
+                        if 1e-4 < c.fluid.val[f] < 1 - 1e-4
+                    ]
+                    for var in variables:
+                        if var == 'm':
+                            col = c.m.J_col
+                        else:
+                            col = c.fluid.J_col[var]
+                        numeric = instance.numeric_deriv(
+                            instance.stoichiometry, var, c, fluid=fluid
+                        )
+                        analytic = instance.jacobian[eq_num, col]
+                        msg = (
+                            f'Derivative of the {fluid} balance to {var} at '
+                            f'{c.label} must be {numeric}, is {analytic}.'
+                        )
+                        assert analytic == pytest.approx(
+                            numeric, rel=1e-6, abs=1e-6
+                        ), msg
+
     def test_DiabaticCombustionChamber(self):
         """
         Test component properties of diabatic combustion chamber.
@@ -734,6 +734,53 @@ class TestHeatExchangers:
         )
         assert np.isnan(instance.eff_hot.val), msg
 
+    @mark.parametrize("component", [HeatExchanger, Condenser, Desuperheater])
+    def test_HeatExchanger_derivatives(self, component):
+        """Test analytic derivatives against numerical derivatives."""
+        instance = component('heat exchanger')
+        self.setup_HeatExchanger_network(instance)
+
+        instance.set_attr(pr1=0.98, pr2=0.98)
+        if component == HeatExchanger:
+            self.c1.set_attr(fluid={'H2O': 1}, m=1, p=3, T=90)
+            self.c2.set_attr(T=50)
+        else:
+            self.c1.set_attr(fluid={'H2O': 1}, m=1, p=0.5, T=150)
+        self.c3.set_attr(fluid={'H2O': 1}, p=5, T=20)
+        self.c4.set_attr(T=55)
+        self.nw.solve('design')
+        self.nw._convergence_check()
+
+        instance.kA.design = instance.kA.val
+        instance.set_attr(ttd_min=5, eff_cold=0.5, eff_hot=0.5, eff_max=0.5)
+        # all pressure and enthalpy values are variables for this test
+        conns = [self.c1, self.c2, self.c3, self.c4]
+        for num, c in enumerate(conns):
+            c.m.design = c.m.val_SI * 1.1
+            for col, var in enumerate(['p', 'h']):
+                c.get_attr(var).is_var = True
+                c.get_attr(var).J_col = 2 * num + col
+
+        equations = ['kA', 'kA_char', 'ttd_u', 'ttd_l', 'ttd_min']
+        if component == HeatExchanger:
+            equations += ['eff_cold', 'eff_hot', 'eff_max']
+
+        for equation in equations:
+            func = getattr(instance, f'{equation}_func')
+            instance.jacobian = {}
+            getattr(instance, f'{equation}_deriv')(None, 0)
+            for c in conns:
+                for var in ['p', 'h']:
+                    numeric = instance.numeric_deriv(func, var, c)
+                    analytic = instance.jacobian.get(
+                        (0, c.get_attr(var).J_col), 0
+                    )
+                    msg = (
+                        f'Derivative of {equation} to {var} at {c.label} must '
+                        f'be {numeric}, is {analytic}.'
+                    )
+                    assert analytic == approx(numeric, rel=1e-3, abs=1e-3), msg
+
     def test_Condenser(self, tmp_path):
         """Test component properties of Condenser."""
         instance = Condenser('condenser')
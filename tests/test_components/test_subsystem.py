@@ -0,0 +1,100 @@
+# -*- coding: utf-8
+
+"""Module for testing subsystems and subsystem templates.
+
+This file is part of project TESPy (github.com/oemof/tespy). It's copyrighted
+by the contributors recorded in the version control history of the file,
+available from its original location
+tests/test_components/test_subsystem.py
+
+SPDX-License-Identifier: MIT
+"""
+from pytest import approx
+
+from tespy.components import Pipe
+from tespy.components import Sink
+from tespy.components import Source
+from tespy.components import Subsystem
+from tespy.components import SubsystemTemplate
+from tespy.components import Valve
+from tespy.connections import Connection
+from tespy.networks import Network
+from tespy.tools.characteristics import CharLine
+
+
+class Substation(Subsystem):
+    """Valve and heat consumer of a building substation."""
+
+    def create_comps(self):
+        self.comps['valve'] = Valve(f'{self.label}_valve')
+        self.comps['consumer'] = Pipe(f'{self.label}_consumer')
+
+    def create_conns(self):
+        self.conns['valve_consumer'] = Connection(
+            self.comps['valve'], 'out1', self.comps['consumer'], 'in1',
+            label=f'{self.label}_valve_consumer'
+        )
+
+
+def parametrize(substation):
+    substation.comps['valve'].set_attr(pr=0.8)
+    substation.comps['consumer'].set_attr(
+        pr=0.95, Q=-1e5, kA_char=CharLine(x=[0, 1, 2], y=[0, 1, 1.5])
+    )
+
+
+def build_network(substations):
+    nw = Network(p_unit='bar', T_unit='C', iterinfo=False)
+    for substation in substations:
+        so = Source(f'{substation.label}_supply')
+        si = Sink(f'{substation.label}_return')
+        c1 = Connection(so, 'out1', substation.comps['valve'], 'in1')
+        c2 = Connection(substation.comps['consumer'], 'out1', si, 'in1')
+        nw.add_conns(c1, c2)
+        nw.add_subsys(substation)
+        c1.set_attr(fluid={'water': 1}, m=1, p=10, T=90)
+    nw.solve('design')
+    nw._convergence_check()
+    return nw
+
+
+def test_SubsystemTemplate():
+    """Test the instantiation of subsystems from a template."""
+    template = SubsystemTemplate(Substation('template'))
+    parametrize(template)
+    instances = [template.instantiate(f'building {i}') for i in range(3)]
+
+    msg = 'The labels must start with the label of the instance.'
+    assert instances[1].label == 'building 1', msg
+    assert instances[1].comps['valve'].label == 'building 1_valve', msg
+    assert (
+        instances[1].conns['valve_consumer'].label
+        == 'building 1_valve_consumer'
+    ), msg
+
+    msg = 'The data containers must not be shared by the instances.'
+    assert (
+        instances[0].comps['consumer'].Q
+        is not instances[2].comps['consumer'].Q
+    ), msg
+    msg = 'The characteristic lines must not be shared by the instances.'
+    assert (
+        instances[0].comps['consumer'].kA_char.char_func
+        is not instances[2].comps['consumer'].kA_char.char_func
+    ), msg
+
+    instances[2].comps['consumer'].set_attr(Q=-2e5)
+    nw = build_network(instances)
+
+    references = [Substation(f'building {i}') for i in range(3)]
+    for substation in references:
+        parametrize(substation)
+    references[2].comps['consumer'].set_attr(Q=-2e5)
+    reference = build_network(references)
+
+    for c in reference.conns['object']:
+        msg = (
+            f'The temperature at connection {c.label} must be identical for '
+            'the subsystems created from the template.'
+        )
+        assert nw.get_conn(c.label).T.val == approx(c.T.val), msg
@@ -11,6 +11,8 @@ SPDX-License-Identifier: MIT
 """
 
 import numpy as np
+from pytest import approx
+from pytest import mark
 
 from tespy.components import Compressor
 from tespy.components import Pump
@@ -329,6 +331,89 @@ class TestTurbomachinery:
                ') must be (' + str(eta_s) + ').')
         assert eta_s == round(instance.eta_s.val, 3), msg
 
+    @mark.parametrize(
+        "component, fluid, inlet, outlet, equations",
+        [
+            (
+                Turbine, {'H2O': 1}, {'m': 10, 'p': 100, 'T': 500}, {'p': 0.5},
+                ['eta_s', 'eta_s_char', 'cone']
+            ),
+            (
+                Turbine, {'N2': 0.7556, 'O2': 0.2315, 'Ar': 0.0129},
+                {'m': 10, 'p': 15, 'T': 1200}, {'p': 1},
+                ['eta_s', 'eta_s_char', 'cone']
+            ),
+            (
+                Compressor, {'N2': 0.7556, 'O2': 0.2315, 'Ar': 0.0129},
+                {'m': 10, 'p': 1, 'T': 20}, {'p': 8},
+                ['eta_s', 'eta_s_char', 'char_map_pr', 'char_map_eta_s']
+            ),
+            (
+                Pump, {'H2O': 1}, {'m': 10, 'p': 1, 'T': 20}, {'p': 10},
+                ['eta_s', 'eta_s_char', 'flow_char']
+            )
+        ]
+    )
+    def test_Turbomachine_derivatives(
+            self, component, fluid, inlet, outlet, equations):
+        """Test analytic derivatives against numerical derivatives."""
+        instance = component('turbomachine')
+        self.setup_network(instance)
+        self.c1.set_attr(fluid=fluid, **inlet)
+        self.c2.set_attr(**outlet)
+        instance.set_attr(eta_s=0.8)
+        self.nw.solve('design')
+        self.nw._convergence_check()
+
+        conns = [self.c1, self.c2]
+        for c in conns:
+            for var in ['m', 'p', 'T', 'v', 'vol']:
+                c.get_attr(var).design = c.get_attr(var).val_SI
+        instance.pr.design = instance.pr.val
+        instance.eta_s.design = instance.eta_s.val
+
+        # move away from design point, all mass flow, pressure and enthalpy
+        # values are variables for this test
+        self.c1.m.val_SI *= 0.87
+        self.c1.h.val_SI *= 1.01
+        self.c2.p.val_SI *= 0.93
+        for num, c in enumerate(conns):
+            c.T.val_SI = c.calc_T()
+            for col, var in enumerate(['m', 'p', 'h']):
+                c.get_attr(var).is_var = True
+                c.get_attr(var).J_col = 3 * num + col
+
+        variables = [(c, var) for c in conns for var in ['m', 'p', 'h']]
+        if component == Compressor:
+            instance.set_attr(
+                char_map_pr={'char_func': ldc(
+                    'compressor', 'char_map_pr', 'DEFAULT', CharMap)},
+                char_map_eta_s={'char_func': ldc(
+                    'compressor', 'char_map_eta_s', 'DEFAULT', CharMap)}
+            )
+            instance.igva.val = 5
+            instance.igva.is_var = True
+            instance.igva.J_col = 6
+            variables += [(None, 'igva')]
+
+        instance.it = 0
+        for equation in equations:
+            func = getattr(instance, f'{equation}_func')
+            instance.jacobian = {}
+            getattr(instance, f'{equation}_deriv')(None, 0)
+            for c, var in variables:
+                numeric = instance.numeric_deriv(func, var, c)
+                if c is None:
+                    col = instance.get_attr(var).J_col
+                else:
+                    col = c.get_attr(var).J_col
+                analytic = instance.jacobian.get((0, col), 0)
+                msg = (
+                    f'Derivative of {equation} to {var} must be {numeric}, '
+                    f'is {analytic}.'
+                )
+                assert analytic == approx(numeric, rel=1e-3, abs=1e-6), msg
+
     def test_Turbomachine(self):
         """Test component properties of turbomachines."""
         instance = Turbomachine('turbomachine')
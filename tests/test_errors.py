@@ -23,6 +23,7 @@ from tespy.components import Sink
 from tespy.components import Source
 from tespy.components import Splitter
 from tespy.components import Subsystem
+from tespy.components import SubsystemTemplate
 from tespy.components import Turbine
 from tespy.components import WaterElectrolyzer
 from tespy.components.component import Component
@@ -341,6 +342,16 @@ def test_subsys_label_forbidden():
     with raises(ValueError):
         Subsystem('label;')
 
+
+class UnlabeledSubsystem(Subsystem):
+    def create_comps(self):
+        self.comps['pipe'] = Pipe('pipe')
+
+
+def test_subsys_template_label():
+    with raises(ValueError):
+        SubsystemTemplate(UnlabeledSubsystem('sub'))
+
 ##############################################################################
 # turbine
 
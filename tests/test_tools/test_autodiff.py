@@ -0,0 +1,206 @@
+# -*- coding: utf-8
+
+"""Module for testing forward-mode automatic differentiation.
+
+This file is part of project TESPy (github.com/oemof/tespy). It's copyrighted
+by the contributors recorded in the version control history of the file,
+available from its original location
+tests/test_tools/test_autodiff.py
+
+SPDX-License-Identifier: MIT
+"""
+import math
+
+from pytest import approx
+
+from tespy.components import SimpleHeatExchanger
+from tespy.components import Sink
+from tespy.components import Source
+from tespy.connections import Connection
+from tespy.networks import Network
+from tespy.tools import CharLine
+from tespy.tools import UserDefinedEquation
+from tespy.tools.autodiff import Dual
+from tespy.tools.autodiff import exp
+from tespy.tools.autodiff import log
+from tespy.tools.autodiff import sqrt
+from tespy.tools.fluid_properties import T_mix_ph
+from tespy.tools.fluid_properties import dT_mix_dph
+from tespy.tools.fluid_properties import dT_mix_pdh
+
+
+def test_Dual_arithmetic():
+    """Test the partial derivatives of the arithmetic operations."""
+    x = Dual.variable(1.5, 'x')
+    y = Dual.variable(0.5, 'y')
+    z = (x * y - 2 / x + y ** 2 - x ** y) / sqrt(x) + exp(y) * log(x) - 3
+    z_val = (
+        (1.5 * 0.5 - 2 / 1.5 + 0.5 ** 2 - 1.5 ** 0.5) / math.sqrt(1.5)
+        + math.exp(0.5) * math.log(1.5) - 3
+    )
+    msg = f'The value of the Dual must be {z_val}, is {z.val}.'
+    assert z.val == approx(z_val), msg
+
+    def f(a, b):
+        return (
+            (a * b - 2 / a + b ** 2 - a ** b) / math.sqrt(a)
+            + math.exp(b) * math.log(a) - 3
+        )
+
+    d = 1e-6
+    dzdx = (f(1.5 + d, 0.5) - f(1.5 - d, 0.5)) / (2 * d)
+    dzdy = (f(1.5, 0.5 + d) - f(1.5, 0.5 - d)) / (2 * d)
+    msg = f'The derivatives must be {dzdx} and {dzdy}, are {z.grad}.'
+    assert z.grad['x'] == approx(dzdx) and z.grad['y'] == approx(dzdy), msg
+
+
+def test_Dual_property_functions():
+    """Test the derivative-aware fluid property functions."""
+    fluid_data = {'water': {'wrapper': None, 'mass_fraction': 1}}
+    from tespy.tools.fluid_properties.wrappers import CoolPropWrapper
+    fluid_data['water']['wrapper'] = CoolPropWrapper('water')
+
+    p, h = 1e6, 1e6
+    T = T_mix_ph(Dual.variable(p, 'p'), Dual.variable(h, 'h'), fluid_data)
+    msg = 'The temperature of a Dual must equal the temperature of floats.'
+    assert T.val == approx(T_mix_ph(p, h, fluid_data)), msg
+    msg = 'The derivatives of the temperature must match the numerical ones.'
+    assert T.grad['p'] == approx(dT_mix_dph(p, h, fluid_data)), msg
+    assert T.grad['h'] == approx(dT_mix_pdh(p, h, fluid_data)), msg
+
+
+def build_pipeline():
+    nw = Network(p_unit='bar', T_unit='C', iterinfo=False)
+    so = Source('source')
+    si = Sink('sink')
+    pipe = SimpleHeatExchanger('pipe')
+    inflow = Connection(so, 'out1', pipe, 'in1')
+    outflow = Connection(pipe, 'out1', si, 'in1')
+    nw.add_conns(inflow, outflow)
+    inflow.set_attr(fluid={'water': 1}, m=10, p=10, T=120)
+    pipe.set_attr(pr=0.9, Q=-1e6)
+    nw.solve('design')
+    pipe.set_attr(pr=None, zeta=pipe.zeta.val)
+    return nw, pipe, inflow, outflow
+
+
+def test_Component_autodiff():
+    """Test the Jacobian of a component equation without derivative method."""
+    nw, pipe, _, _ = build_pipeline()
+    nw.solve('design')
+    pipe.jacobian = {}
+    pipe.solve(None)
+    jacobian = pipe.jacobian.copy()
+    residual = pipe.residual.copy()
+
+    pipe.zeta.deriv = None
+    pipe.jacobian = {}
+    pipe.solve(None)
+    msg = 'The residual must not change with automatic differentiation.'
+    assert list(pipe.residual) == approx(list(residual), abs=1e-6), msg
+    for key, value in jacobian.items():
+        msg = (
+            f'The derivative {key} must be {value}, is '
+            f'{pipe.jacobian[key]} with automatic differentiation.'
+        )
+        assert pipe.jacobian[key] == approx(value, rel=1e-4, abs=1e-8), msg
+
+    pipe.set_attr(zeta=pipe.zeta.val * 1.2)
+    nw.solve('design')
+    nw._convergence_check()
+    msg = 'The component equation without derivative method must be applied.'
+    assert pipe.zeta.deriv is None, msg
+    p_out = pipe.outl[0].p.val
+
+    pipe.zeta.deriv = pipe.zeta_deriv
+    nw.solve('design')
+    msg = (
+        'The outlet pressure must be identical with numerical and automatic '
+        'differentiation.'
+    )
+    assert pipe.outl[0].p.val == approx(p_out), msg
+
+
+def test_UserDefinedEquation_autodiff():
+    """Test user defined equation without derivative method."""
+    char = CharLine(x=[0, 0.05, 0.1], y=[0, 5, 8], extrapolate=True)
+
+    def myfunc(ude):
+        return (
+            ude.conns[0].calc_T() - ude.conns[1].calc_T()
+            - ude.params['char'].evaluate(
+                ude.conns[0].m.val_SI * ude.conns[0].calc_vol()
+            )
+        )
+
+    def myjacobian(ude):
+        c0, c1 = ude.conns
+        for c, variables in [(c0, ['m', 'p', 'h']), (c1, ['p', 'h'])]:
+            for var in variables:
+                if c.get_attr(var).is_var:
+                    ude.jacobian[c.get_attr(var).J_col] = ude.numeric_deriv(
+                        var, c
+                    )
+
+    results = []
+    for deriv in [myjacobian, None]:
+        nw, pipe, inflow, outflow = build_pipeline()
+        pipe.set_attr(zeta=None, pr=1)
+        inflow.set_attr(m=None)
+        ude = UserDefinedEquation(
+            'ude', myfunc, deriv, [inflow, outflow], params={'char': char}
+        )
+        nw.add_ude(ude)
+        nw.solve('design')
+        nw._convergence_check()
+        results += [(inflow.m.val, nw.iter)]
+
+    msg = (
+        'The mass flow must be identical with numerical and automatic '
+        f'differentiation: {results}.'
+    )
+    assert results[0][0] == approx(results[1][0]), msg
+    msg = (
+        'The number of iterations must not be higher with automatic '
+        f'differentiation: {results}.'
+    )
+    assert results[1][1] <= results[0][1], msg
+
+
+def test_UserDefinedEquation_math_functions():
+    """Test user defined equation using functions of the math module."""
+
+    def myfunc(ude):
+        c0, c1 = ude.conns
+        return math.log(c0.p.val_SI) - math.log(c1.p.val_SI) - 0.1
+
+    def myfunc_dual(ude):
+        c0, c1 = ude.conns
+        return log(c0.p.val_SI) - log(c1.p.val_SI) - 0.1
+
+    results = []
+    for func in [myfunc, myfunc_dual]:
+        nw, pipe, inflow, outflow = build_pipeline()
+        pipe.set_attr(zeta=None)
+        ude = UserDefinedEquation('ude', func, None, [inflow, outflow])
+        nw.add_ude(ude)
+        nw.solve('design')
+        nw._convergence_check()
+        msg = (
+            'The values of the variables must be restored after evaluating '
+            'an equation not accepting dual numbers.'
+        )
+        assert not isinstance(inflow.p.val_SI, Dual), msg
+        results += [(outflow.p.val_SI, dict(ude.jacobian))]
+
+    msg = (
+        'The outlet pressure must be identical for equations using the math '
+        f'module and the functions for dual numbers: {results}.'
+    )
+    assert results[0][0] == approx(results[1][0]), msg
+    for col, value in results[1][1].items():
+        msg = (
+            f'The finite difference derivative {col} must match the dual '
+            f'number derivative {value}, is {results[0][1][col]}.'
+        )
+        assert results[0][1][col] == approx(value, rel=1e-4, abs=1e-12), msg
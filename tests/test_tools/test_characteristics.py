@@ -11,9 +11,11 @@ SPDX-License-Identifier: MIT
 """
 import json
 import os
+import pickle
 import shutil
 
 import numpy as np
+from pytest import raises
 
 from tespy import __datapath__
 from tespy.tools.characteristics import CharLine
@@ -224,3 +226,127 @@ def test_CharMap_evaluation():
 
     # check, if bound errors go through
     map.get_domain_errors(x, y, 'Componentlabel')
+
+
+def test_default_char_shared():
+    """Test default characteristics data are loaded once and shared."""
+    char1 = load_default_char('compressor', 'char_map_pr', 'DEFAULT', CharMap)
+    char2 = load_default_char('compressor', 'char_map_pr', 'DEFAULT', CharMap)
+    msg = 'The data of the default characteristic map must be shared.'
+    assert char1.z is char2.z, msg
+
+    msg = 'The data of shared characteristics must be read-only.'
+    assert not char1.z.flags.writeable, msg
+
+    line = load_default_char('pump', 'eta_s_char', 'DEFAULT', CharLine)
+    msg = (
+        'Loading a characteristic line must not return a characteristic map '
+        'from the cache.'
+    )
+    assert isinstance(line, CharLine), msg
+
+
+def test_default_char_independent():
+    """Test changing a default characteristics does not change others."""
+    line1 = load_default_char(
+        'heat exchanger', 'kA_char1', 'DEFAULT', CharLine
+    )
+    line2 = load_default_char(
+        'heat exchanger', 'kA_char1', 'DEFAULT', CharLine
+    )
+    line1.extrapolate = True
+    msg = (
+        'Changing the default characteristic line of a component must not '
+        'change the characteristic line of another component.'
+    )
+    assert not line2.extrapolate, msg
+
+    map1 = load_default_char('compressor', 'char_map_pr', 'DEFAULT', CharMap)
+    map1.z = map1.z * 2
+    map2 = load_default_char('compressor', 'char_map_pr', 'DEFAULT', CharMap)
+    assert map2.evaluate(1, 1) != map1.evaluate(1, 1), msg
+
+
+def test_CharLine_array_evaluation():
+    """Test evaluation and derivative of CharLine for arrays of x-values."""
+    line = CharLine(x=[0, 1, 2, 3, 4], y=[4, 1, 0, 1, 4])
+    x = np.array([-1, 0, 0.5, 2, 2.5, 4, 5, np.nan])
+
+    for extrapolate in [False, True]:
+        line.extrapolate = extrapolate
+        y = line.evaluate(x)
+        y_scalar = np.array([line.evaluate(value) for value in x])
+        msg = (
+            f'The evaluation of {x} must be {y_scalar}, but is {y} with '
+            f'extrapolate={extrapolate}.'
+        )
+        assert np.allclose(y, y_scalar, equal_nan=True), msg
+
+        dydx = line.derivative(x[:-1])
+        dydx_scalar = np.array([line.derivative(value) for value in x[:-1]])
+        msg = (
+            f'The derivative at {x[:-1]} must be {dydx_scalar}, but is '
+            f'{dydx} with extrapolate={extrapolate}.'
+        )
+        assert np.allclose(dydx, dydx_scalar), msg
+
+    msg = 'The derivative outside of the value range must be 0.'
+    line.extrapolate = False
+    assert line.derivative(5) == 0, msg
+
+    # changing the data must change the evaluation
+    line.y = np.array([0, 1, 2, 3, 4])
+    msg = 'The evaluation must use the new data of the characteristic line.'
+    assert line.evaluate(2.5) == 2.5, msg
+
+
+def test_char_data_read_only():
+    """Test the data of characteristics can not be changed in place."""
+    y = np.array([4, 1, 0, 1, 4])
+    line = CharLine(x=[0, 1, 2, 3, 4], y=y)
+    line.evaluate(2.5)
+    y[0] = 0
+    msg = 'The characteristic line must not change with the passed array.'
+    assert line.y[0] == 4, msg
+
+    with raises(ValueError):
+        line.y[0] = 0
+
+    char_map = CharMap(
+        x=[0, 1], y=[[0, 1], [0, 1]], z=[[1, 2], [3, 4]]
+    )
+    char_map.evaluate(0.5, 0.5)
+    with raises(ValueError):
+        char_map.z[0, 0] = 0
+
+    line = pickle.loads(pickle.dumps(line))
+    msg = 'The data must be read-only after unpickling.'
+    assert not line.y.flags.writeable, msg
+
+
+def test_CharMap_array_evaluation():
+    """Test evaluation and gradient of CharMap for arrays of x and y."""
+    x = [1, 2, 3]
+    y = np.array([[1, 2, 3], [2, 3, 5], [3, 4, 7]])
+    z = y ** 0.5
+    map = CharMap(x=x, y=y, z=z)
+
+    x = np.array([0, 1, 1.5, 2.5, 2.5, 3, 4, np.nan, 2])
+    y = np.array([0, 1.5, 2.5, 3.25, 8, 2, 6, 1, np.nan])
+    z = map.evaluate(x, y)
+    z_scalar = np.array([map.evaluate(a, b) for a, b in zip(x, y)])
+    msg = f'The evaluation of {x} and {y} must be {z_scalar}, but is {z}.'
+    assert np.allclose(z, z_scalar, equal_nan=True), msg
+
+    d = 1e-6
+    # test points off the nodes of the map
+    points = [(0, 0), (1.5, 2.3), (2.5, 3.25), (2.5, 8), (4, 6), (1.2, 1)]
+    for a, b in points:
+        dzdx, dzdy = map.gradient(a, b)
+        dzdx_num = (map.evaluate(a + d, b) - map.evaluate(a - d, b)) / (2 * d)
+        dzdy_num = (map.evaluate(a, b + d) - map.evaluate(a, b - d)) / (2 * d)
+        msg = (
+            f'The gradient at x={a} and y={b} must be ({dzdx_num}, '
+            f'{dzdy_num}), but is ({dzdx}, {dzdy}).'
+        )
+        assert np.allclose([dzdx, dzdy], [dzdx_num, dzdy_num]), msg
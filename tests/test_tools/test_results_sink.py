@@ -0,0 +1,78 @@
+# -*- coding: utf-8
+
+"""Module for testing the results sink.
+
+This file is part of project TESPy (github.com/oemof/tespy). It's copyrighted
+by the contributors recorded in the version control history of the file,
+available from its original location
+tests/test_tools/test_results_sink.py
+
+SPDX-License-Identifier: MIT
+"""
+from pytest import raises
+
+from tespy.components import Sink
+from tespy.components import SimpleHeatExchanger
+from tespy.components import Source
+from tespy.connections import Bus
+from tespy.connections import Connection
+from tespy.networks import Network
+from tespy.tools import ResultsSink
+from tespy.tools import read_results
+
+
+class TestResultsSink:
+
+    def setup_method(self):
+        self.nw = Network(T_unit="C", p_unit="bar", iterinfo=False)
+        so = Source("source")
+        si = Sink("sink")
+        self.hx = SimpleHeatExchanger("heater", pr=1)
+        c1 = Connection(so, "out1", self.hx, "in1", label="1")
+        c2 = Connection(self.hx, "out1", si, "in1", label="2")
+        self.nw.add_conns(c1, c2)
+        c1.set_attr(fluid={"water": 1}, m=1, p=5, T=20)
+        heat = Bus("heat")
+        heat.add_comps({"comp": self.hx})
+        self.nw.add_busses(heat)
+
+    def test_batched_writing(self, tmp_path):
+        """Test the rows are written in batches and can be read meanwhile."""
+        self.nw.results_sink = ResultsSink(
+            tmp_path, connections={"2": ["T", "water"]},
+            components={"heater": ["Q"]}, busses=["heat"], batch_size=2
+        )
+        for Q in [1e5, 2e5, 3e5]:
+            self.hx.set_attr(Q=Q)
+            self.nw.solve("design")
+
+        df = read_results(tmp_path)
+        msg = "Only the first batch of two rows must be written to the file."
+        assert df.shape == (2, 5), msg
+
+        self.nw.results_sink.close()
+        data = read_results(tmp_path, memory_map=True)
+        msg = "All three rows must be written after closing the sink."
+        assert data.shape == (3, 5), msg
+
+        df = read_results(tmp_path)
+        msg = "The stored bus value must equal the heat of the heat exchanger."
+        assert (
+            df[("Bus", "heat", "P")] == df[("Component", "heater", "Q")]
+        ).all(), msg
+        msg = "The stored mass fraction of water must be equal to 1."
+        assert (df[("Connection", "2", "water")] == 1).all(), msg
+        msg = "All simulations must be marked as converged."
+        assert (df[("Network", "converged", "")] == 1).all(), msg
+
+    def test_unknown_label(self, tmp_path):
+        """Test error for a connection label not available in the network."""
+        self.nw.results_sink = ResultsSink(tmp_path, connections={"3": ["T"]})
+        self.hx.set_attr(Q=1e5)
+        with raises(KeyError):
+            self.nw.solve("design")
+
+    def test_invalid_batch_size(self, tmp_path):
+        """Test error for an invalid batch size."""
+        with raises(ValueError):
+            ResultsSink(tmp_path, batch_size=0)